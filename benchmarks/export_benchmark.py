@@ -0,0 +1,71 @@
+# Run from the repository root: python -m benchmarks.export_benchmark
+# Import packages and libraries
+import time
+import argparse
+import tempfile
+import numpy as np
+import rasterio as rio
+from pathlib import Path
+from rasterio.transform import from_origin
+
+# Import module and files
+from fezrs import NDVICalculator
+
+
+def _write_band(path, data):
+    with rio.open(
+        path,
+        "w",
+        driver="GTiff",
+        height=data.shape[0],
+        width=data.shape[1],
+        count=1,
+        dtype=data.dtype,
+        crs="EPSG:32639",
+        transform=from_origin(500000, 4000000, 30, 30),
+    ) as dst:
+        dst.write(data, 1)
+
+
+def _timed(label, run):
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<24}: {elapsed:8.2f} s")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare PNG rendering against raw GeoTIFF/COG export for NDVI."
+    )
+    parser.add_argument("--size", type=int, default=2048)
+    parser.add_argument("--dpi", type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as directory:
+        directory = Path(directory)
+        for band in ("nir", "red"):
+            data = rng.integers(1, 10000, (args.size, args.size)).astype(np.uint16)
+            _write_band(directory / f"{band}.tif", data)
+
+        def calculator():
+            return NDVICalculator(
+                nir_path=directory / "nir.tif", red_path=directory / "red.tif"
+            )
+
+        png = _timed(
+            f"PNG (dpi={args.dpi})",
+            lambda: calculator().execute(directory / "png", dpi=args.dpi),
+        )
+        for driver in ("GTiff", "COG"):
+            elapsed = _timed(
+                driver,
+                lambda: calculator().execute_raster(directory / driver, driver=driver),
+            )
+            print(f"{'':<24}  x{png / elapsed:.1f} faster than PNG")
+
+
+if __name__ == "__main__":
+    main()
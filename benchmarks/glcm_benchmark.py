@@ -0,0 +1,52 @@
+# Run from the repository root: python -m benchmarks.glcm_benchmark
+# Import packages and libraries
+import os
+import time
+import argparse
+import numpy as np
+
+# Import module and files
+from fezrs.tools.glcm.glcm_engine import glcm_features, glcm_features_tiled
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Report GLCM throughput against the number of worker processes."
+    )
+    parser.add_argument("--size", type=int, default=2048)
+    parser.add_argument("--window-size", type=int, default=5)
+    parser.add_argument("--tile-size", type=int, default=512)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    image = np.random.default_rng(0).integers(0, 256, (args.size, args.size))
+    image = image.astype(np.uint8)
+    options = {
+        "window_size": args.window_size,
+        "properties": ["contrast", "ASM", "dissimilarity", "homogeneity"],
+    }
+    megapixels = image.size / 1e6
+
+    start = time.perf_counter()
+    expected = glcm_features(image, **options)
+    baseline = time.perf_counter() - start
+    print(f"single tile : {baseline:8.2f} s  {megapixels / baseline:8.2f} MPix/s")
+
+    workers = 1
+    while workers <= args.max_workers:
+        start = time.perf_counter()
+        result = glcm_features_tiled(
+            image, tile_size=args.tile_size, workers=workers, **options
+        )
+        elapsed = time.perf_counter() - start
+
+        identical = np.array_equal(result, expected)
+        print(
+            f"workers={workers:<3}: {elapsed:8.2f} s  {megapixels / elapsed:8.2f} MPix/s"
+            f"  speedup x{baseline / elapsed:.2f}  identical={identical}"
+        )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
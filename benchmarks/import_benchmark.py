@@ -0,0 +1,58 @@
+# Run from the repository root: python -m benchmarks.import_benchmark
+# Import packages and libraries
+import sys
+import json
+import argparse
+import subprocess
+
+HEAVY_BACKENDS = ("sklearn", "cv2", "rasterio", "pandas", "matplotlib", "skimage")
+
+STATEMENTS = {
+    "import fezrs": "import fezrs",
+    "NDVICalculator": "from fezrs import NDVICalculator",
+    "KMeansCalculator": "from fezrs import KMeansCalculator",
+    "all calculators": "import fezrs; [getattr(fezrs, name) for name in fezrs.__all__]",
+}
+
+
+def _cold_import(statement):
+    """Times a statement in a fresh interpreter and lists the backends it loaded."""
+    code = (
+        "import sys, json, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"loaded = [m for m in {HEAVY_BACKENDS!r} if m in sys.modules]\n"
+        "print(json.dumps([elapsed, loaded]))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Report cold import times and fail if `import fezrs` is over budget."
+    )
+    parser.add_argument("--budget", type=float, default=0.1, help="Seconds.")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    timings = {}
+    for name, statement in STATEMENTS.items():
+        runs = [_cold_import(statement) for _ in range(args.repeat)]
+        timings[name] = min(elapsed for elapsed, _ in runs)
+        loaded = ", ".join(runs[0][1]) or "-"
+        print(f"{name:<18}: {timings[name]:8.3f} s  backends: {loaded}")
+
+    elapsed, loaded = _cold_import("import fezrs")
+    assert not loaded, f"`import fezrs` loaded {loaded}"
+    assert (
+        timings["import fezrs"] <= args.budget
+    ), f"`import fezrs` took {timings['import fezrs']:.3f} s, budget {args.budget} s"
+    print(f"`import fezrs` is within the {args.budget} s budget")
+
+
+if __name__ == "__main__":
+    main()
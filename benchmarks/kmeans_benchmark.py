@@ -0,0 +1,71 @@
+# Run from the repository root: python -m benchmarks.kmeans_benchmark
+# Import packages and libraries
+import time
+import argparse
+import tempfile
+import tracemalloc
+import numpy as np
+import tifffile
+from pathlib import Path
+
+# Import module and files
+from fezrs import KMeansCalculator
+
+OPTIONS = {
+    "full fit": {},
+    "random sample": {"sample_size": 100_000},
+    "stratified sample": {"sample_size": 100_000, "sampling": "stratified"},
+    "mini-batch": {"method": "minibatch"},
+    "mini-batch sample": {"method": "minibatch", "sample_size": 100_000},
+}
+
+
+def _scene(height, width, n_clusters, rng):
+    """Blocky land covers with noise, so the clusters are well defined."""
+    covers = rng.integers(0, n_clusters, (height // 16 + 1, width // 16 + 1))
+    covers = np.kron(covers, np.ones((16, 16), dtype=int))[:height, :width]
+    noise = rng.normal(0, 60, (height, width))
+    return np.clip(covers * 1500 + 1000 + noise, 0, 65535).astype(np.uint16)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare sampled and mini-batch k-means with the full fit."
+    )
+    parser.add_argument("--height", type=int, default=3000)
+    parser.add_argument("--width", type=int, default=3000)
+    parser.add_argument("--clusters", type=int, default=4)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as directory:
+        nir_path = Path(directory) / "nir.tif"
+        tifffile.imwrite(nir_path, _scene(args.height, args.width, args.clusters, rng))
+
+        expected = None
+        for name, options in OPTIONS.items():
+            calculator = KMeansCalculator(
+                nir_path=nir_path, n_clusters=args.clusters, random_state=0, **options
+            )
+            calculator.nir_band  # read the band before timing
+
+            tracemalloc.start()
+            start = time.perf_counter()
+            output = calculator.process()
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] / 2**20
+            tracemalloc.stop()
+
+            if expected is None:
+                expected = output
+            # Parity: share of pixels whose cluster center is within 1% of the full fit's
+            agreement = np.mean(np.isclose(output, expected, rtol=0.01))
+            inertia = np.mean((calculator.nir_band - output) ** 2)
+            print(
+                f"{name:<18}: {elapsed:8.2f} s  peak {peak:8.1f} MiB"
+                f"  agreement {agreement:7.2%}  inertia/pixel {inertia:10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# Run from the repository root: python -m benchmarks.magdir_benchmark
+# Import packages and libraries
+import time
+import argparse
+import tempfile
+import numpy as np
+import tifffile
+from pathlib import Path
+
+# Import module and files
+from fezrs import MagDirCalculator
+
+BANDS = ("nir", "swir1", "before_nir", "before_swir1")
+
+
+def _per_pixel_rows(images, rows):
+    """The former nested-loop implementation, restricted to the first rows."""
+    nir, swir1, before_nir, before_swir1 = (images[band] for band in BANDS)
+    magnitude = np.empty((rows, nir.shape[1]))
+    for i in range(rows):
+        for j in range(nir.shape[1]):
+            magnitude[i][j] = np.sqrt(
+                (before_nir[i][j] - nir[i][j]) ** 2
+                + (before_swir1[i][j] - swir1[i][j]) ** 2
+            )
+    return magnitude
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the vectorized MagDir calculator with the per-pixel loop."
+    )
+    # Default to the size of a full Landsat 8 scene
+    parser.add_argument("--height", type=int, default=7811)
+    parser.add_argument("--width", type=int, default=7681)
+    parser.add_argument(
+        "--loop-rows",
+        type=int,
+        default=20,
+        help="Rows timed with the per-pixel loop, extrapolated to the full scene.",
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as directory:
+        directory = Path(directory)
+        images = {}
+        for band in BANDS:
+            images[band] = rng.integers(1, 10000, (args.height, args.width)).astype(
+                np.uint16
+            )
+            tifffile.imwrite(directory / f"{band}.tif", images[band], tile=(512, 512))
+
+        float_images = {
+            band: image.astype(np.float64) for band, image in images.items()
+        }
+        start = time.perf_counter()
+        _per_pixel_rows(float_images, args.loop_rows)
+        loop = (time.perf_counter() - start) * args.height / args.loop_rows
+        print(f"{'per-pixel loop (est.)':<24}: {loop:10.2f} s")
+
+        tool = MagDirCalculator(
+            **{f"{band}_path": directory / f"{band}.tif" for band in BANDS},
+            selecte="magnitude",
+        )
+        # Decode the bands first so only the computation is timed
+        for band in BANDS:
+            tool.files_handler.bands[band]
+
+        start = time.perf_counter()
+        tool.process()
+        vectorized = time.perf_counter() - start
+        print(f"{'vectorized':<24}: {vectorized:10.2f} s")
+        print(f"{'':<24}  x{loop / vectorized:.0f} faster")
+
+
+if __name__ == "__main__":
+    main()
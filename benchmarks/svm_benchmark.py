@@ -0,0 +1,55 @@
+# Run from the repository root: python -m benchmarks.svm_benchmark
+# Import packages and libraries
+import os
+import time
+import argparse
+import numpy as np
+from sklearn import svm
+
+# Import module and files
+from fezrs.utils.predict_handler import predict_chunked
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Report SVM prediction throughput against the number of worker processes."
+    )
+    parser.add_argument("--size", type=int, default=1024)
+    parser.add_argument("--bands", type=int, default=6)
+    parser.add_argument("--classes", type=int, default=4)
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--chunk-size", type=int, default=65536)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    bands = [
+        rng.integers(0, 10000, (args.size, args.size)).astype(np.uint16)
+        for _ in range(args.bands)
+    ]
+    features = rng.integers(0, 10000, (args.samples, args.bands))
+    labels = rng.integers(1, args.classes + 1, args.samples)
+    clf = svm.SVC(gamma="scale").fit(features, labels)
+    pixels = args.size * args.size
+
+    start = time.perf_counter()
+    expected = predict_chunked(clf, bands, args.chunk_size, workers=1)
+    baseline = time.perf_counter() - start
+    print(f"workers=1  : {baseline:8.2f} s  {pixels / baseline:12,.0f} pixels/s")
+
+    workers = 2
+    while workers <= args.max_workers:
+        start = time.perf_counter()
+        result = predict_chunked(clf, bands, args.chunk_size, workers=workers)
+        elapsed = time.perf_counter() - start
+
+        identical = np.array_equal(result, expected)
+        print(
+            f"workers={workers:<3}: {elapsed:8.2f} s  {pixels / elapsed:12,.0f} pixels/s"
+            f"  speedup x{baseline / elapsed:.2f}  identical={identical}"
+        )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -1,94 +1,69 @@
-from fezrs.tools.clustering.kmeans_calculator import KMeansCalculator
+"""
+FEZrs: Feature Extraction and Zoning for Remote Sensing.
 
-from fezrs.tools.filters.gaussian_calculator import GuassianCalculator
-from fezrs.tools.filters.laplacian_calculator import LaplacianCalculator
-from fezrs.tools.filters.mean_calculator import MeanCalculator
-from fezrs.tools.filters.median_calculator import MedianCalculator
-from fezrs.tools.filters.sobel_calculator import SobelCalculator
+Calculators are imported on first access, so `import fezrs` stays cheap and
+scikit-learn, OpenCV, rasterio, matplotlib and the other backends are only
+loaded by the calculators that use them.
+"""
 
+# Import packages and libraries
+from importlib import import_module
 
-from fezrs.tools.glcm.glcm_calculator import GLCMCalculator
+_CALCULATORS = {
+    "KMeansCalculator": "fezrs.tools.clustering.kmeans_calculator",
+    "GuassianCalculator": "fezrs.tools.filters.gaussian_calculator",
+    "LaplacianCalculator": "fezrs.tools.filters.laplacian_calculator",
+    "MeanCalculator": "fezrs.tools.filters.mean_calculator",
+    "MedianCalculator": "fezrs.tools.filters.median_calculator",
+    "SobelCalculator": "fezrs.tools.filters.sobel_calculator",
+    "GLCMCalculator": "fezrs.tools.glcm.glcm_calculator",
+    "HSVCalculator": "fezrs.tools.hsv.hsv_calculator",
+    "IRHSVCalculator": "fezrs.tools.hsv.irhsv_calculator",
+    "AdaptiveCalculator": "fezrs.tools.image_enhancement.adaptive_calculator",
+    "AdaptiveRGBCalculator": "fezrs.tools.image_enhancement.adaptive_rgb_calculator",
+    "EqualizeCalculator": "fezrs.tools.image_enhancement.equalize_calculator",
+    "EqualizeRGBCalculator": "fezrs.tools.image_enhancement.equalize_rgb_calculator",
+    "FloatCalculator": "fezrs.tools.image_enhancement.float_calculator",
+    "GammaCalculator": "fezrs.tools.image_enhancement.gamma_calculator",
+    "GammaRGBCalculator": "fezrs.tools.image_enhancement.gamma_rgb_calculator",
+    "LogAdjustCalculator": "fezrs.tools.image_enhancement.log_adjust_calculator",
+    "OriginalCalculator": "fezrs.tools.image_enhancement.original_calculator",
+    "OriginalRGBCalculator": "fezrs.tools.image_enhancement.original_rgb_calculator",
+    "SigmoidAdjustCalculator": "fezrs.tools.image_enhancement.sigmoid_adjust_calculator",
+    "PCACalculator": "fezrs.tools.pca.pca_calculator",
+    "AFVICalculator": "fezrs.tools.spectral_indices.afvi_calculator",
+    "BICalculator": "fezrs.tools.spectral_indices.bi_calculator",
+    "NDVICalculator": "fezrs.tools.spectral_indices.ndvi_calculator",
+    "NDWICalculator": "fezrs.tools.spectral_indices.ndwi_calculator",
+    "SAVICalculator": "fezrs.tools.spectral_indices.savi_calculator",
+    "SpectralIndicesCalculator": "fezrs.tools.spectral_indices.spectral_indices_calculator",
+    "UICalculator": "fezrs.tools.spectral_indices.ui_calculator",
+    "SpectralProfileCalculator": "fezrs.tools.spectral_profile.spectral_profile_calculator",
+    "MosaicCalculator": "fezrs.tools.mosaic.mosaic_calculator",
+    "Geoeye_Calculator": "fezrs.tools.import_tools.geoeye_calculator",
+    "Landsat8_Calculator": "fezrs.tools.import_tools.landsat8_calculator",
+    "BurnCalculator": "fezrs.tools.change_detection.burn_calculator",
+    "CVACalculator": "fezrs.tools.change_detection.cva_calculator",
+    "IndicesCalculator": "fezrs.tools.change_detection.indices_calculator",
+    "MagDirCalculator": "fezrs.tools.change_detection.magdir_calculator",
+    "SubDivCalculator": "fezrs.tools.change_detection.subdiv_calculator",
+    "TimeCalculator": "fezrs.tools.change_detection.time_calculator",
+}
+"""Public calculator names mapped to the modules defining them."""
 
-from fezrs.tools.hsv.hsv_calculator import HSVCalculator
-from fezrs.tools.hsv.irhsv_calculator import IRHSVCalculator
+__all__ = list(_CALCULATORS)
 
-from fezrs.tools.image_enhancement.adaptive_calculator import AdaptiveCalculator
-from fezrs.tools.image_enhancement.adaptive_rgb_calculator import AdaptiveRGBCalculator
-from fezrs.tools.image_enhancement.equalize_calculator import EqualizeCalculator
-from fezrs.tools.image_enhancement.equalize_rgb_calculator import EqualizeRGBCalculator
-from fezrs.tools.image_enhancement.float_calculator import FloatCalculator
-from fezrs.tools.image_enhancement.gamma_calculator import GammaCalculator
-from fezrs.tools.image_enhancement.gamma_rgb_calculator import GammaRGBCalculator
-from fezrs.tools.image_enhancement.log_adjust_calculator import LogAdjustCalculator
-from fezrs.tools.image_enhancement.original_calculator import OriginalCalculator
-from fezrs.tools.image_enhancement.original_rgb_calculator import OriginalRGBCalculator
-from fezrs.tools.image_enhancement.sigmoid_adjust_calculator import (
-    SigmoidAdjustCalculator,
-)
 
+def __getattr__(name):
+    try:
+        module = _CALCULATORS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
 
-from fezrs.tools.pca.pca_calculator import PCACalculator
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
 
-from fezrs.tools.spectral_indices.afvi_calculator import AFVICalculator
-from fezrs.tools.spectral_indices.bi_calculator import BICalculator
-from fezrs.tools.spectral_indices.ndvi_calculator import NDVICalculator
-from fezrs.tools.spectral_indices.ndwi_calculator import NDWICalculator
-from fezrs.tools.spectral_indices.savi_calculator import SAVICalculator
-from fezrs.tools.spectral_indices.ui_calculator import UICalculator
 
-from fezrs.tools.spectral_profile.spectral_profile_calculator import (
-    SpectralProfileCalculator,
-)
-
-from fezrs.tools.mosaic.mosaic_calculator import (
-    MosaicCalculator,
-)
-
-from fezrs.tools.import_tools.geoeye_calculator import Geoeye_Calculator
-from fezrs.tools.import_tools.landsat8_calculator import Landsat8_Calculator
-
-from fezrs.tools.change_detection.burn_calculator import BurnCalculator
-from fezrs.tools.change_detection.indices_calculator import IndicesCalculator
-from fezrs.tools.change_detection.magdir_calculator import MagDirCalculator
-from fezrs.tools.change_detection.subdiv_calculator import SubDivCalculator
-from fezrs.tools.change_detection.time_calculator import TimeCalculator
-
-
-__all__ = [
-    "KMeansCalculator",
-    "GuassianCalculator",
-    "LaplacianCalculator",
-    "MeanCalculator",
-    "MedianCalculator",
-    "SobelCalculator",
-    "GLCMCalculator",
-    "HSVCalculator",
-    "IRHSVCalculator",
-    "AdaptiveCalculator",
-    "AdaptiveRGBCalculator",
-    "EqualizeCalculator",
-    "EqualizeRGBCalculator",
-    "FloatCalculator",
-    "GammaCalculator",
-    "GammaRGBCalculator",
-    "LogAdjustCalculator",
-    "OriginalCalculator",
-    "OriginalRGBCalculator",
-    "SigmoidAdjustCalculator",
-    "PCACalculator",
-    "AFVICalculator",
-    "BICalculator",
-    "NDVICalculator",
-    "NDWICalculator",
-    "SAVICalculator",
-    "UICalculator",
-    "SpectralProfileCalculator",
-    "MosaicCalculator",
-    "Geoeye_Calculator",
-    "Landsat8_Calculator",
-    "BurnCalculator",
-    "IndicesCalculator",
-    "MagDirCalculator",
-    "SubDivCalculator",
-    "TimeCalculator",
-]
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,17 +1,38 @@
 # Import packages and libraries
+import numpy as np
 from abc import ABC
 from PIL import Image
 from pathlib import Path
 from uuid import uuid4
+from functools import lru_cache
 from importlib import resources
 import matplotlib.pyplot as plt
 
-
 # Import module and files
+from fezrs.utils.cache_handler import ResultCache
 from fezrs.utils.file_handler import FileHandler
+from fezrs.utils.stream_handler import normalize_block, stream_blocks
+from fezrs.utils.raster_handler import RasterDriverType, write_raster
 from fezrs.utils.type_handler import BandPathType, BandPathsType
 
 
+@lru_cache(maxsize=None)
+def _load_watermark() -> np.ndarray:
+    """
+    Decodes the watermark logo once per process.
+
+    Returns:
+        np.ndarray: The 80 x 80 RGBA logo, read-only since it is shared by every tool.
+    """
+    logo_file = resources.files("fezrs.media").joinpath("logo_watermark.png")
+    with logo_file.open("rb") as file:
+        logo_img = Image.open(file).convert("RGBA").resize((80, 80))
+
+    logo = np.asarray(logo_img)
+    logo.setflags(write=False)
+    return logo
+
+
 # Definition abstract class (BaseTool)
 class BaseTool(ABC):
     """
@@ -19,11 +40,32 @@ class BaseTool(ABC):
 
     Provides common initialization, validation, processing, and export logic for derived tools.
     Handles band file paths, watermarking, and standardized export of results.
+
+    Per-pixel tools can also run block by block through execute_stream by listing
+    their input bands in _block_bands and implementing _process_block.
     """
 
+    _block_bands: tuple = ()
+    """Bands passed to _process_block; empty if the tool can not be streamed."""
+
+    _block_normalized: bool = False
+    """Whether _process_block expects normalized bands."""
+
+    _block_intermediates: dict = {}
+    """Named intermediates of _process_block: name -> (function, input bands)."""
+
+    _shared_files_handler: FileHandler | None = None
+    """Handler whose caches new tools share; set by Pipeline while it builds tools."""
+
+    _cacheable: bool = True
+    """Whether the output alone is enough to export the tool, so it can be cached."""
+
+    result_cache: ResultCache | None = None
+    """Cache of outputs used by execute and execute_raster; disabled if None."""
+
     def __init__(self, **bands_path: BandPathsType):
         """
-        Initializes the BaseTool with band file paths and loads the watermark logo.
+        Initializes the BaseTool with band file paths.
 
         Args:
             **bands_path: Arbitrary keyword arguments representing band file paths.
@@ -31,13 +73,123 @@ class BaseTool(ABC):
         self._output = None
         self.__tool_name = self.__class__.__name__.replace("Calculator", "")
 
-        with resources.path("fezrs.media", "logo_watermark.png") as logo_path:
-            logo_img = Image.open(logo_path).convert("RGBA")
-            logo_img = logo_img.resize((80, 80))
+        self.files_handler = self._new_files_handler(**bands_path)
 
-        self._logo_watermark = logo_img
+    def _new_files_handler(self, **bands_path: BandPathsType) -> FileHandler:
+        """
+        Creates the handler of a set of bands, a view of the shared handler if it serves them all.
+
+        Args:
+            **bands_path: Band paths by parameter name, e.g. nir_path.
+
+        Returns:
+            FileHandler: The handler.
+        """
+        if BaseTool._shared_files_handler is not None:
+            try:
+                return BaseTool._shared_files_handler.view(**bands_path)
+            except ValueError:
+                pass
+        return FileHandler(**bands_path)
+
+    @property
+    def _logo_watermark(self) -> np.ndarray:
+        """
+        The watermark logo, decoded on first use and shared by all tools.
+        """
+        return _load_watermark()
+
+    def _intermediate(self, bands: dict, name: str) -> np.ndarray:
+        """
+        Returns an intermediate listed in _block_intermediates.
+
+        A Pipeline computes each intermediate once and passes it in bands under
+        its name; otherwise it is computed here from its input bands.
+
+        Args:
+            bands (dict): The inputs of _process_block.
+            name (str): Name of the intermediate.
+
+        Returns:
+            np.ndarray: The intermediate array.
+        """
+        if name in bands:
+            return bands[name]
+        function, inputs = self._block_intermediates[name]
+        return function(*(bands[band] for band in inputs))
+
+    def use_memmap(self, memmap_dir: BandPathType | None = None):
+        """
+        Serves the input bands as read-only memory maps instead of in-memory arrays.
+
+        Must be called before processing. Uncompressed TIFF files are mapped in
+        place; other files are decoded once into .npy sidecars in memmap_dir.
+
+        Args:
+            memmap_dir: Directory for the .npy sidecar files.
+
+        Returns:
+            self: The instance of the tool.
+        """
+        self.files_handler.use_memmap(memmap_dir)
+        return self
+
+    def use_cache(self, cache: ResultCache | BandPathType | None):
+        """
+        Reuses outputs computed earlier with the same inputs and parameters.
 
-        self.files_handler = FileHandler(**bands_path)
+        execute and execute_raster then load the output from the cache instead
+        of processing when the input files and the tool's parameters did not
+        change. Set BaseTool.result_cache to enable a cache for every tool.
+
+        Args:
+            cache: A ResultCache, a cache directory, or None to disable caching.
+
+        Returns:
+            self: The instance of the tool.
+        """
+        if cache is not None and not isinstance(cache, ResultCache):
+            cache = ResultCache(cache)
+        self.result_cache = cache
+        return self
+
+    def _cached_process(self):
+        """
+        Processes the tool through result_cache, if any.
+
+        Returns:
+            The output of the tool.
+        """
+        if self.result_cache is None or not self._cacheable:
+            self.process()
+            return self._output
+
+        key = self.result_cache.key(self)
+        if key is None:
+            self.process()
+            return self._output
+
+        output = self.result_cache.get(key)
+        if output is not None:
+            self._output = output
+            return self._output
+
+        self.process()
+        if self._output is not None:
+            self.result_cache.put(key, self._output)
+        return self._output
+
+    @property
+    def profile(self):
+        """
+        The rasterio profile of the first input band, read from its header only.
+
+        Carries the CRS, transform and nodata value needed to write georeferenced outputs.
+
+        Returns:
+            dict: A copy of the profile, empty if the tool has no raster input.
+        """
+        return self.files_handler.get_profile()
 
     def _validate(self):
         """
@@ -56,6 +208,18 @@ class BaseTool(ABC):
         self._validate()
         raise NotImplementedError("Subclasses should implement this method")
 
+    def _process_block(self, bands):
+        """
+        Hook for per-pixel tools computing the output of a single block.
+
+        Args:
+            bands: A dictionary mapping each name in _block_bands to its block.
+
+        Returns:
+            The output block, (rows, cols) or (rows, cols, channels).
+        """
+        raise NotImplementedError("Subclasses should implement this method")
+
     def _customize_export_file(self, ax):
         """
         Hook for subclasses to customize the export plot.
@@ -77,8 +241,8 @@ class BaseTool(ABC):
         dpi: int = 500,
         bbox_inches: str = "tight",
         grid: bool = True,
-        nrows: int = 1,
-        ncols: int = 1,
+        nrows: int | None = None,
+        ncols: int | None = None,
     ):
         """
         Exports the computed output as a PNG image with optional customization.
@@ -94,8 +258,8 @@ class BaseTool(ABC):
             dpi: Dots per inch for the saved image.
             bbox_inches: Bounding box option for saving the figure.
             grid: Whether to display a grid.
-            nrows: Number of subplot rows.
-            ncols: Number of subplot columns.
+            nrows: Number of subplot rows, 1 if None.
+            ncols: Number of subplot columns, 1 if None.
 
         Returns:
             The path to the saved image file.
@@ -111,7 +275,7 @@ class BaseTool(ABC):
         output_path.mkdir(parents=True, exist_ok=True)
 
         # Run plot methods
-        fig, ax = plt.subplots(figsize=figsize, nrows=nrows, ncols=ncols)
+        fig, ax = plt.subplots(figsize=figsize, nrows=nrows or 1, ncols=ncols or 1)
         im = ax.imshow(self._output, cmap=colormap)
         plt.grid(grid)
 
@@ -135,6 +299,149 @@ class BaseTool(ABC):
         plt.close(fig)
         return filename
 
+    def _export_stack(
+        self,
+        output_path: BandPathType,
+        names: list,
+        title: str | None = None,
+        figsize: tuple = (15, 10),
+        show_axis: bool = False,
+        colormap: str = None,
+        show_colorbar: bool = False,
+        dpi: int = 500,
+        bbox_inches: str = "tight",
+        grid: bool = False,
+        nrows: int | None = None,
+        ncols: int | None = None,
+    ):
+        """
+        Exports a stacked (rows, cols, layers) output as a grid of subplots.
+
+        Args:
+            output_path: Directory to save the exported image.
+            names: Title of each layer.
+            title: Optional title for the figure.
+            figsize: Figure size for the plot.
+            show_axis: Whether to display axes.
+            colormap: Colormap for the layers.
+            show_colorbar: Whether to display a colorbar per layer.
+            dpi: Dots per inch for the saved image.
+            bbox_inches: Bounding box option for saving the figure.
+            grid: Whether to display a grid.
+            nrows: Number of subplot rows, derived from ncols if None.
+            ncols: Number of subplot columns, at most 4 if None.
+
+        Returns:
+            The path to the saved image file.
+        """
+        if self._output is None:
+            raise ValueError("Data not computed.")
+
+        output_path = Path(output_path)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        layers_count = self._output.shape[-1]
+        ncols = ncols or min(layers_count, 4)
+        nrows = nrows or int(np.ceil(layers_count / ncols))
+
+        fig, axes = plt.subplots(nrows=nrows, ncols=ncols, figsize=figsize)
+        axes = np.atleast_1d(axes).ravel()
+        for index, ax in enumerate(axes):
+            if index >= layers_count:
+                ax.axis("off")
+                continue
+
+            im = ax.imshow(self._output[:, :, index], cmap=colormap)
+            ax.set_title(names[index])
+            ax.grid(grid)
+
+            if not show_axis:
+                ax.axis("off")
+
+            if show_colorbar:
+                fig.colorbar(im, ax=ax)
+
+        if title:
+            fig.suptitle(f"{title}-FEZrs")
+
+        filename = f"{output_path}/{self.__tool_name}_output_{uuid4().hex}.png"
+        fig.savefig(filename, dpi=dpi, bbox_inches=bbox_inches)
+
+        plt.close(fig)
+        return filename
+
+    def _export_raster(
+        self,
+        output_path: BandPathType,
+        driver: RasterDriverType = "GTiff",
+        compress: str | None = "deflate",
+        block_size: int = 512,
+    ):
+        """
+        Exports the computed output as raw raster data, without rendering a figure.
+
+        The raster keeps the CRS and transform of the first input band when the
+        output has the same dimensions.
+
+        Args:
+            output_path: Directory to save the raster.
+            driver: "GTiff" for a tiled GeoTIFF, "COG" for a Cloud-Optimized GeoTIFF.
+            compress: GDAL compression method, or None.
+            block_size: Internal tile size, a multiple of 16.
+
+        Returns:
+            The path to the saved raster file.
+        """
+        # Check output property is not empty
+        if self._output is None:
+            raise ValueError("Data not computed.")
+
+        output_path = Path(output_path)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        profile = self.profile
+        if np.shape(self._output)[:2] != (profile.get("height"), profile.get("width")):
+            profile = {}
+
+        filename = f"{output_path}/{self.__tool_name}_output_{uuid4().hex}.tif"
+        self.output_file = write_raster(
+            self._output,
+            filename,
+            crs=profile.get("crs"),
+            transform=profile.get("transform"),
+            driver=driver,
+            compress=compress,
+            block_size=block_size,
+        )
+        return self.output_file
+
+    def execute_raster(
+        self,
+        output_path: BandPathType,
+        driver: RasterDriverType = "GTiff",
+        compress: str | None = "deflate",
+        block_size: int = 512,
+    ):
+        """
+        Executes the tool and exports the raw output as a GeoTIFF or COG.
+
+        Skips matplotlib rendering entirely, which is much faster than execute
+        for quick tools and keeps the georeferencing of the inputs.
+
+        Args:
+            output_path: Directory to save the raster.
+            driver: "GTiff" for a tiled GeoTIFF, "COG" for a Cloud-Optimized GeoTIFF.
+            compress: GDAL compression method, or None.
+            block_size: Internal tile size, a multiple of 16.
+
+        Returns:
+            self: The instance of the tool. The raster path is stored in output_file.
+        """
+        self._validate()
+        self._cached_process()
+        self._export_raster(output_path, driver, compress, block_size)
+        return self
+
     def execute(
         self,
         output_path: BandPathType,
@@ -164,14 +471,14 @@ class BaseTool(ABC):
             dpi: Dots per inch for the saved image.
             bbox_inches: Bounding box option for saving the figure.
             grid: Whether to display a grid.
-            nrows: Number of subplot rows.
-            ncols: Number of subplot columns.
+            nrows: Number of subplot rows of stacked outputs, derived if None.
+            ncols: Number of subplot columns of stacked outputs, derived if None.
 
         Returns:
             self: The instance of the tool.
         """
         self._validate()
-        self.process()
+        self._cached_process()
         self._export_file(
             output_path,
             title,
@@ -183,5 +490,65 @@ class BaseTool(ABC):
             dpi,
             bbox_inches,
             grid,
+            nrows,
+            ncols,
+        )
+        return self
+
+    def execute_stream(
+        self,
+        output_path: BandPathType,
+        block_size: int | None = None,
+    ):
+        """
+        Executes a per-pixel tool block by block, writing the result to a GeoTIFF.
+
+        Blocks follow the native internal tiling of the first input band unless
+        block_size is given. Normalized inputs are scaled with whole-image
+        statistics gathered in a streaming pass, so the output matches execute
+        while only a few blocks are held in memory.
+
+        Args:
+            output_path: Directory to save the GeoTIFF.
+            block_size: Size of square blocks, or None for the native tiling.
+
+        Returns:
+            self: The instance of the tool. The GeoTIFF path is stored in output_file.
+
+        Raises:
+            NotImplementedError: If the tool does not support block processing.
+        """
+        if not self._block_bands:
+            raise NotImplementedError(
+                f"{self.__class__.__name__} does not support streaming execution"
+            )
+
+        self._validate()
+
+        band_paths = {
+            band: self.files_handler.band_paths[band] for band in self._block_bands
+        }
+
+        process_block = self._process_block
+        if self._block_normalized:
+            statistics = {
+                band: self.files_handler.get_band_statistics(band)
+                for band in band_paths
+            }
+
+            def process_block(blocks):
+                return self._process_block(
+                    {
+                        band: normalize_block(block, statistics[band])
+                        for band, block in blocks.items()
+                    }
+                )
+
+        output_path = Path(output_path)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        filename = f"{output_path}/{self.__tool_name}_output_{uuid4().hex}.tif"
+        self.output_file = stream_blocks(
+            band_paths, filename, process_block, block_size
         )
         return self
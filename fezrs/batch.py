@@ -0,0 +1,356 @@
+# Run from the command line: python -m fezrs.batch catalog.json tools.json -o output
+# Import packages and libraries
+import os
+import csv
+import json
+import time
+import inspect
+import argparse
+import traceback
+from pathlib import Path
+from importlib import import_module
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional
+
+# Import module and files
+from fezrs.base import BaseTool
+from fezrs.utils.cache_handler import ResultCache
+from fezrs.utils.file_handler import BandCache, FileHandler
+from fezrs.utils.type_handler import BandPathType, ToolConfigType
+
+
+def _init_worker(cache_bytes: int, cache_dir: Optional[BandPathType]) -> None:
+    FileHandler.band_cache = BandCache(cache_bytes)
+    if cache_dir is not None:
+        BaseTool.result_cache = ResultCache(cache_dir)
+
+
+def _resolve_paths(value: Any, base: Path) -> Any:
+    if isinstance(value, (list, tuple)):
+        return [_resolve_paths(item, base) for item in value]
+    return str(base / value) if value else None
+
+
+def read_catalog(path: BandPathType) -> Dict[str, Dict[str, Any]]:
+    """
+    Reads a scene catalog: the band paths of each scene.
+
+    A JSON catalog maps scene ids to {band: path} objects, or is a list of such
+    objects with a "scene" key. A CSV catalog has a "scene" column and one
+    column per band. Relative paths are resolved against the catalog's folder.
+
+    Args:
+        path (BandPathType): The .json or .csv catalog.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: The bands of each scene, in catalog order.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the format is not supported.
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"File {path} not found")
+
+    match (path.suffix.lower()):
+        case ".json":
+            with open(path) as file:
+                entries = json.load(file)
+            if isinstance(entries, list):
+                entries = {
+                    str(entry["scene"]): {
+                        k: v for k, v in entry.items() if k != "scene"
+                    }
+                    for entry in entries
+                }
+        case ".csv":
+            with open(path, newline="") as file:
+                entries = {row.pop("scene"): row for row in csv.DictReader(file)}
+        case _:
+            raise ValueError(
+                f"Unsupported catalog format '{path.suffix}', expected .json or .csv"
+            )
+
+    return {
+        scene: {
+            band: _resolve_paths(value, path.parent) for band, value in bands.items()
+        }
+        for scene, bands in entries.items()
+    }
+
+
+def read_tools(path: BandPathType) -> List[ToolConfigType]:
+    """
+    Reads the tool configurations of a batch run from a JSON list.
+
+    Args:
+        path (BandPathType): The .json file.
+
+    Returns:
+        List[ToolConfigType]: The tool configurations.
+    """
+    with open(path) as file:
+        return json.load(file)
+
+
+def _tool_class(name: str):
+    # Public calculators by name, any other class by its dotted path
+    if "." not in name:
+        return getattr(import_module("fezrs"), name)
+    module, _, attribute = name.rpartition(".")
+    return getattr(import_module(module), attribute)
+
+
+def _band_params(tool_class, config: ToolConfigType, bands: Dict[str, Any]) -> dict:
+    params = {}
+    for param in inspect.signature(tool_class.__init__).parameters:
+        if param.endswith("_path") and bands.get(param[: -len("_path")]):
+            params[param] = bands[param[: -len("_path")]]
+    for param, band in config.get("bands", {}).items():
+        params[param] = (
+            [bands[item] for item in band] if isinstance(band, list) else bands[band]
+        )
+    return params
+
+
+def _result(scene: str, config: ToolConfigType) -> Dict[str, Any]:
+    name = config.get("name", config["tool"])
+    result = {"scene": scene, "tool": name, "status": "ok", "seconds": 0.0}
+    result.update(output=None, error=None)
+    return result
+
+
+def _fail(result: Dict[str, Any], error: BaseException) -> Dict[str, Any]:
+    result["status"] = "failed"
+    result["error"] = "".join(traceback.format_exception_only(error)).strip()
+    return result
+
+
+def _run_isolated(
+    tasks: List[tuple], cache_bytes: int, cache_dir: Optional[BandPathType]
+) -> List[Dict[str, Any]]:
+    # One task at a time on a single worker, so a crash is charged to its task
+    results = []
+    executor = None
+    try:
+        for task in tasks:
+            if executor is None:
+                executor = ProcessPoolExecutor(
+                    max_workers=1,
+                    initializer=_init_worker,
+                    initargs=(cache_bytes, cache_dir),
+                )
+            try:
+                results.append(executor.submit(run_task, *task).result())
+            except Exception as error:
+                results.append(_fail(_result(task[0], task[2]), error))
+                if isinstance(error, BrokenProcessPool):
+                    executor.shutdown()
+                    executor = None
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return results
+
+
+def run_task(
+    scene: str,
+    bands: Dict[str, Any],
+    config: ToolConfigType,
+    output_path: BandPathType,
+) -> Dict[str, Any]:
+    """
+    Runs one tool on one scene, catching any failure.
+
+    Args:
+        scene (str): Scene id, used for the output folder.
+        bands (Dict[str, Any]): Band paths of the scene.
+        config (ToolConfigType): The tool configuration.
+        output_path (BandPathType): Root folder of the outputs.
+
+    Returns:
+        Dict[str, Any]: The scene, tool name, status ("ok" or "failed"), run time
+            in seconds, output file and error message of the task.
+    """
+    result = _result(scene, config)
+
+    start = time.perf_counter()
+    try:
+        tool_class = _tool_class(config["tool"])
+        tool = tool_class(
+            **_band_params(tool_class, config, bands), **config.get("params", {})
+        )
+
+        output_dir = Path(output_path) / scene / result["tool"]
+        output_dir.mkdir(parents=True, exist_ok=True)
+        options = config.get("options", {})
+        match (config.get("action", "execute")):
+            case "execute":
+                tool.execute(output_dir, **options)
+            case "raster":
+                tool.execute_raster(output_dir, **options)
+            case "stream":
+                tool.execute_stream(output_dir, **options)
+            case "process":
+                tool._validate()
+                tool.process()
+            case action:
+                raise ValueError(f"Unsupported batch action '{action}'")
+        result["output"] = getattr(tool, "output_file", None)
+    except Exception as error:
+        _fail(result, error)
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def _run_scene(
+    scene: str,
+    bands: Dict[str, Any],
+    tools: List[ToolConfigType],
+    output_path: BandPathType,
+) -> List[Dict[str, Any]]:
+    return [run_task(scene, bands, config, output_path) for config in tools]
+
+
+def run_batch(
+    catalog: Dict[str, Dict[str, Any]],
+    tools: List[ToolConfigType],
+    output_path: BandPathType,
+    workers: Optional[int] = None,
+    cache_bytes: int = 2**30,
+    cache_dir: Optional[BandPathType] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Runs every tool on every scene of a catalog over a process pool.
+
+    Each worker receives all the tools of a scene at once, so its band cache
+    decodes each band file once. A failing task is reported and does not stop
+    the run. If a worker process dies, e.g. killed for lack of memory, the pool
+    is recreated for the remaining scenes and the scenes it was running are
+    rerun one task at a time, so only the task that crashed is reported failed.
+
+    Args:
+        catalog (Dict[str, Dict[str, Any]]): Band paths of each scene, see read_catalog.
+        tools (List[ToolConfigType]): The tool configurations, see ToolConfigType.
+        output_path (BandPathType): Root folder; outputs go to <scene>/<tool name>.
+        workers (Optional[int]): Number of worker processes. None uses every CPU,
+            1 runs in the current process.
+        cache_bytes (int): Size of the band cache of each worker.
+        cache_dir (Optional[BandPathType]): Folder of a ResultCache shared by the
+            workers, so a rerun skips the tasks whose inputs and parameters did not
+            change. Only used by the "execute" and "raster" actions.
+
+    Returns:
+        List[Dict[str, Any]]: One result per task in catalog and tools order, see run_task.
+
+    Raises:
+        ValueError: If workers is not positive.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"'workers' must be >= 1, got {workers}")
+
+    tasks = [
+        (scene, bands, config, str(output_path))
+        for scene, bands in catalog.items()
+        for config in tools
+    ]
+
+    if workers == 1:
+        previous = FileHandler.band_cache, BaseTool.result_cache
+        _init_worker(cache_bytes, cache_dir)
+        try:
+            return [run_task(*task) for task in tasks]
+        finally:
+            FileHandler.band_cache, BaseTool.result_cache = previous
+
+    # One future per scene, at most one per worker in flight, so that a crashed
+    # worker only leaves the scenes it was running without results
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    pending = list(catalog)
+    suspects = []
+    while pending:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(cache_bytes, cache_dir),
+        ) as executor:
+            running = {}
+            broken = False
+            while (pending or running) and not broken:
+                while pending and len(running) < workers:
+                    scene = pending.pop(0)
+                    future = executor.submit(
+                        _run_scene, scene, catalog[scene], tools, str(output_path)
+                    )
+                    running[future] = scene
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    scene = running.pop(future)
+                    try:
+                        results[scene] = future.result()
+                    except BrokenProcessPool:
+                        suspects.append(scene)
+                        broken = True
+                    except Exception as error:
+                        results[scene] = [
+                            _fail(_result(scene, config), error) for config in tools
+                        ]
+            suspects.extend(running.values())
+
+    # Rerun the scenes of a crashed worker task by task to find the culprit
+    isolated = _run_isolated(
+        [task for task in tasks if task[0] in suspects], cache_bytes, cache_dir
+    )
+    for result in isolated:
+        results.setdefault(result["scene"], []).append(result)
+
+    return [result for scene in catalog for result in results[scene]]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m fezrs.batch",
+        description="Run FEZrs tools over every scene of a catalog in parallel.",
+    )
+    parser.add_argument("catalog", help="Scene catalog, .json or .csv.")
+    parser.add_argument("tools", help="JSON list of tool configurations.")
+    parser.add_argument("-o", "--output", default="fezrs_output")
+    parser.add_argument("-w", "--workers", type=int, default=None)
+    parser.add_argument("--cache-mb", type=int, default=1024)
+    parser.add_argument(
+        "--cache-dir", help="Reuse the outputs of an earlier run stored in this folder."
+    )
+    parser.add_argument("--report", help="Write the task results to this JSON file.")
+    args = parser.parse_args(argv)
+
+    results = run_batch(
+        read_catalog(args.catalog),
+        read_tools(args.tools),
+        args.output,
+        args.workers,
+        args.cache_mb * 2**20,
+        args.cache_dir,
+    )
+
+    for result in results:
+        detail = result["output"] or result["error"] or ""
+        print(
+            f"{result['status']:<6} {result['seconds']:8.2f} s  "
+            f"{result['scene']}/{result['tool']}  {detail}"
+        )
+    failed = sum(result["status"] != "ok" for result in results)
+    print(f"{len(results) - failed} succeeded, {failed} failed")
+
+    if args.report:
+        with open(args.report, "w") as file:
+            json.dump(results, file, indent=2)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,149 @@
+# Import packages and libraries
+import inspect
+import numpy as np
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Import module and files
+from fezrs.base import BaseTool
+from fezrs.utils.file_handler import FileHandler
+from fezrs.utils.raster_handler import RasterDriverType
+from fezrs.utils.type_handler import BandPathType, BandPathsType
+
+
+class Pipeline:
+    """
+    Runs several tools on the same bands, computing every shared input once.
+
+    The tools are declared once with add and built when run reaches them. They
+    share one FileHandler, so each band is decoded and normalized once for the
+    whole pipeline. Per-pixel tools (those with _block_bands) are evaluated from
+    the pipeline's nodes: the intermediates they list in _block_intermediates,
+    such as the NBR of BurnCalculator and IndicesCalculator, are computed once
+    and passed to every tool using them.
+
+    A band, its normalization or an intermediate is released as soon as no
+    remaining tool reads the bands it comes from, which bounds peak memory.
+
+    Attributes:
+        files_handler (FileHandler): The handler shared by the tools.
+        computed (List[tuple]): Keys of the intermediates computed, in order.
+    """
+
+    def __init__(self, memmap: bool = False, **bands_path: BandPathsType):
+        """
+        Initialize an empty pipeline over a set of bands.
+
+        Args:
+            memmap (bool): Serve the bands as read-only memory maps.
+            **bands_path: Band paths by parameter name, e.g. nir_path.
+        """
+        self.files_handler = FileHandler(memmap=memmap, **bands_path)
+        self.computed: List[tuple] = []
+        self._tools: List[Tuple[str, type, dict]] = []
+        self._intermediates: Dict[tuple, np.ndarray] = {}
+
+    def add(self, name: str, tool_class: type, **params: Any) -> "Pipeline":
+        """
+        Declare a tool. Its band path parameters are filled from the pipeline's bands.
+
+        Args:
+            name (str): Name of the tool's output.
+            tool_class (type): The BaseTool subclass, e.g. NDVICalculator.
+            **params (Any): The other parameters of the tool.
+
+        Returns:
+            Pipeline: The pipeline itself.
+
+        Raises:
+            ValueError: If the name is already used.
+        """
+        if any(name == declared for declared, _, _ in self._tools):
+            raise ValueError(f"A tool named '{name}' is already declared.")
+
+        self._tools.append((name, tool_class, params))
+        return self
+
+    def _band_paths(self, tool_class: type) -> Dict[str, BandPathType]:
+        parameters = inspect.signature(tool_class.__init__).parameters
+        return {
+            f"{band}_path": path
+            for band, path in self.files_handler.band_paths.items()
+            if path is not None and f"{band}_path" in parameters
+        }
+
+    def _node(self, key: tuple) -> np.ndarray:
+        match (key):
+            case ("band", band):
+                return self.files_handler.bands[band]
+            case ("normalized", band):
+                return self.files_handler.get_normalized_bands([band])[band]
+            case (function, inputs):
+                if key not in self._intermediates:
+                    self._intermediates[key] = function(*map(self._node, inputs))
+                    self.computed.append(key)
+                return self._intermediates[key]
+
+    def _block_inputs(self, tool: BaseTool) -> Dict[str, np.ndarray]:
+        kind = "normalized" if tool._block_normalized else "band"
+        keys = {band: (kind, band) for band in tool._block_bands}
+        for name, (function, inputs) in tool._block_intermediates.items():
+            keys[name] = (function, tuple(keys[band] for band in inputs))
+        return {name: self._node(key) for name, key in keys.items()}
+
+    def _release(self, pending: List[set]) -> None:
+        def needed(bands):
+            return any(bands <= tool_bands for tool_bands in pending)
+
+        for band, path in self.files_handler.band_paths.items():
+            if path is not None and not needed({band}):
+                self.files_handler.release(band)
+
+        for key in list(self._intermediates):
+            if not needed({band for _, band in key[1]}):
+                del self._intermediates[key]
+
+    def run(
+        self,
+        output_path: Optional[BandPathType] = None,
+        driver: RasterDriverType = "GTiff",
+    ) -> Dict[str, np.ndarray]:
+        """
+        Run the tools in declaration order.
+
+        Args:
+            output_path (Optional[BandPathType]): If set, each output is written to
+                <output_path>/<name> as a raster, as with execute_raster.
+            driver (RasterDriverType): Raster driver of the written outputs.
+
+        Returns:
+            Dict[str, np.ndarray]: The output of each tool by name.
+        """
+        band_sets = [
+            {param.removesuffix("_path") for param in self._band_paths(tool_class)}
+            for _, tool_class, _ in self._tools
+        ]
+
+        outputs = {}
+        for index, (name, tool_class, params) in enumerate(self._tools):
+            BaseTool._shared_files_handler = self.files_handler
+            try:
+                tool = tool_class(**self._band_paths(tool_class), **params)
+            finally:
+                BaseTool._shared_files_handler = None
+
+            tool._validate()
+            if tool._block_bands:
+                tool._output = tool._process_block(self._block_inputs(tool))
+            else:
+                tool.process()
+
+            if output_path is not None:
+                tool._export_raster(Path(output_path) / name, driver)
+            outputs[name] = tool._output
+
+            # The tool keeps references to its inputs, drop it before releasing them
+            del tool
+            self._release(band_sets[index + 1 :])
+
+        return outputs
@@ -1,10 +1,17 @@
 from pathlib import Path
 
 from fezrs.base import BaseTool
+from fezrs.tools.spectral_indices.spectral_engine import normalized_difference
 from fezrs.utils.type_handler import BandPathType
 
 
 class BurnCalculator(BaseTool):
+    _block_bands = ("nir", "swir2", "before_nir", "before_swir2")
+    _block_intermediates = {
+        "nbr": (normalized_difference, ("nir", "swir2")),
+        "before_nbr": (normalized_difference, ("before_nir", "before_swir2")),
+    }
+
     def __init__(
         self,
         nir_path: BandPathType,
@@ -31,17 +38,17 @@ class BurnCalculator(BaseTool):
     def _validate(self):
         pass
 
-    def process(self):
-        nir = self.time_bands["nir"]["image_skimage"]
-        swir2 = self.time_bands["swir2"]["image_skimage"]
-        before_nir = self.time_bands["before_nir"]["image_skimage"]
-        before_swir2 = self.time_bands["before_swir2"]["image_skimage"]
-
-        indices_after = (nir - swir2) / (nir + swir2)
-        indices_before = (before_nir - before_swir2) / (before_nir + before_swir2)
+    def _process_block(self, bands):
+        indices_after = self._intermediate(bands, "nbr")
+        indices_before = self._intermediate(bands, "before_nbr")
         subtract_before_after = indices_before - indices_after
 
-        self._output = subtract_before_after > 0.7
+        return subtract_before_after > 0.7
+
+    def process(self):
+        self._output = self._process_block(
+            {band: self.time_bands[band]["image_skimage"] for band in self._block_bands}
+        )
         return self._output
 
     def execute(
@@ -0,0 +1,213 @@
+import numpy as np
+from uuid import uuid4
+from pathlib import Path
+from typing import List
+
+from fezrs.base import BaseTool
+from fezrs.tools.change_detection.cva_engine import (
+    cva_block,
+    cva_layer_names,
+    stream_cva,
+)
+from fezrs.utils.type_handler import BandPathType, CVAOutputType
+
+
+class CVACalculator(BaseTool):
+    def __init__(
+        self,
+        after_paths: List[BandPathType],
+        before_paths: List[BandPathType],
+        band_names: List[str] | None = None,
+        select: CVAOutputType = "all",
+        block_rows: int = 1024,
+    ):
+        # tif_paths lists every input for the profile and the result cache key,
+        # the bands themselves are served by one handler per file
+        super().__init__(tif_paths=list(after_paths) + list(before_paths))
+
+        self.after_paths = list(after_paths)
+        self.before_paths = list(before_paths)
+        self.select: CVAOutputType = select
+        self.block_rows = block_rows
+        self.layer_names = cva_layer_names(len(self.after_paths), band_names)
+
+        self._band_handlers = {
+            f"{time}_{index}": self._new_files_handler(tif_path=path)
+            for time, paths in (
+                ("after", self.after_paths),
+                ("before", self.before_paths),
+            )
+            for index, path in enumerate(paths)
+        }
+
+    @property
+    def _layers(self) -> slice:
+        match (self.select):
+            case "magnitude":
+                return slice(0, 1)
+            case "direction":
+                return slice(1, 2)
+            case "deltas":
+                return slice(2, None)
+            case _:
+                return slice(None)
+
+    def use_memmap(self, memmap_dir=None):
+        super().use_memmap(memmap_dir)
+        for handler in self._band_handlers.values():
+            handler.use_memmap(memmap_dir)
+        return self
+
+    def _validate(self):
+        if not self.after_paths or len(self.after_paths) != len(self.before_paths):
+            raise ValueError(
+                "CVA needs the same, non-zero number of before and after bands."
+            )
+
+        if len(self.layer_names) != len(self.after_paths) + 2:
+            raise ValueError("Expected one band name per before/after band pair.")
+
+    def _process_block(self, bands):
+        count = len(self.after_paths)
+        result = cva_block(
+            [bands[f"after_{index}"] for index in range(count)],
+            [bands[f"before_{index}"] for index in range(count)],
+        )[..., self._layers]
+
+        # Single layers keep the 2D layout of the other change detection tools
+        return result[..., 0] if result.shape[-1] == 1 else result
+
+    def process(self):
+        self._validate()
+
+        bands = {
+            band: handler.bands["tif"] for band, handler in self._band_handlers.items()
+        }
+        rows = bands["after_0"].shape[0]
+
+        self._output = None
+        for row in range(0, rows, self.block_rows):
+            block = slice(row, row + self.block_rows)
+            result = self._process_block(
+                {band: image[block] for band, image in bands.items()}
+            )
+            if self._output is None:
+                self._output = np.empty((rows,) + result.shape[1:])
+            self._output[block] = result
+
+        return self._output
+
+    def execute_stream(self, output_path, block_size=None):
+        """
+        Executes the analysis block by block, writing the selected layers to a GeoTIFF.
+
+        Only the current block of every band is held in memory, whatever the number
+        of band pairs.
+
+        Args:
+            output_path: Directory to save the GeoTIFF.
+            block_size: Size of square blocks, or None for the native tiling.
+
+        Returns:
+            self: The instance of the tool. The GeoTIFF path is stored in output_file.
+        """
+        self._validate()
+
+        output_path = Path(output_path)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        filename = f"{output_path}/CVA_output_{uuid4().hex}.tif"
+        self.output_file = stream_cva(
+            self.after_paths, self.before_paths, filename, block_size, self._layers
+        )
+        return self
+
+    def _export_file(
+        self,
+        output_path,
+        title=None,
+        figsize=(15, 10),
+        show_axis=False,
+        colormap="gray",
+        show_colorbar=True,
+        filename_prefix="Tool_output",
+        dpi=500,
+        bbox_inches="tight",
+        grid=False,
+        nrows=None,
+        ncols=None,
+    ):
+        if self._output is None or self._output.ndim == 2:
+            return super()._export_file(
+                output_path,
+                title,
+                figsize,
+                show_axis,
+                colormap,
+                show_colorbar,
+                filename_prefix,
+                dpi,
+                bbox_inches,
+                grid,
+            )
+
+        return self._export_stack(
+            output_path,
+            self.layer_names[self._layers],
+            title,
+            figsize,
+            show_axis,
+            colormap,
+            show_colorbar,
+            dpi,
+            bbox_inches,
+            grid,
+            nrows,
+            ncols,
+        )
+
+    def execute(
+        self,
+        output_path,
+        title=None,
+        figsize=(15, 10),
+        show_axis=False,
+        colormap="gray",
+        show_colorbar=True,
+        filename_prefix="Tool_output",
+        dpi=500,
+        bbox_inches="tight",
+        grid=False,
+        nrows=None,
+        ncols=None,
+    ):
+        return super().execute(
+            output_path,
+            title,
+            figsize,
+            show_axis,
+            colormap,
+            show_colorbar,
+            filename_prefix,
+            dpi,
+            bbox_inches,
+            grid,
+            nrows,
+            ncols,
+        )
+
+
+# NOTE - These block code for test the tools, delete before publish product
+if __name__ == "__main__":
+    after_paths = [
+        Path.cwd() / f"data/Change Detection/After/B{band}.tif" for band in (4, 5, 7)
+    ]
+    before_paths = [
+        Path.cwd() / f"data/Change Detection/Before/B{band}.tif" for band in (4, 5, 7)
+    ]
+
+    calculator = CVACalculator(
+        after_paths=after_paths,
+        before_paths=before_paths,
+        band_names=["nir", "swir1", "swir2"],
+    ).execute("./", title="CVA")
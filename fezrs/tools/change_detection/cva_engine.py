@@ -0,0 +1,117 @@
+import numpy as np
+from typing import List, Optional, Sequence
+
+from fezrs.utils.stream_handler import stream_blocks
+from fezrs.utils.type_handler import BandPathType
+
+
+def cva_layer_names(
+    count: int, band_names: Optional[Sequence[str]] = None
+) -> List[str]:
+    """
+    Names the layers produced by cva_block.
+
+    Args:
+        count (int): Number of band pairs.
+        band_names (Optional[Sequence[str]]): Name of each band pair, numbered from 1 if None.
+
+    Returns:
+        List[str]: "magnitude", "direction" and one "delta_<band>" per band pair.
+    """
+    if band_names is None:
+        band_names = [str(index + 1) for index in range(count)]
+    return ["magnitude", "direction"] + [f"delta_{name}" for name in band_names]
+
+
+def cva_block(after: Sequence[np.ndarray], before: Sequence[np.ndarray]) -> np.ndarray:
+    """
+    Runs change vector analysis over any number of before/after band pairs.
+
+    The direction is a sector code with one bit per band: 1 plus 2**k for every
+    band k whose value increased, or 0 when at least one band did not change.
+    With (NIR, SWIR1) pairs the codes match MagDirCalculator.
+
+    Args:
+        after (Sequence[np.ndarray]): The bands (or blocks) after the change.
+        before (Sequence[np.ndarray]): The matching bands before the change.
+
+    Returns:
+        np.ndarray: A (rows, cols, 2 + bands) float64 stack of the magnitude,
+            the direction code and the per-band deltas (after - before).
+
+    Raises:
+        ValueError: If no band pair is given or the sequences differ in length.
+    """
+    if not after or len(after) != len(before):
+        raise ValueError(
+            f"Expected matching before/after bands, got {len(before)} and {len(after)}."
+        )
+
+    count = len(after)
+    shape = np.shape(after[0])
+    result = np.empty(shape + (2 + count,))
+    magnitude, direction = result[..., 0], result[..., 1]
+
+    unchanged = np.zeros(shape, dtype=bool)
+    direction[...] = 1
+    for band, (after_band, before_band) in enumerate(zip(after, before)):
+        # Work in float64 so unsigned integer bands do not wrap around
+        delta = result[..., 2 + band]
+        np.subtract(after_band, before_band, out=delta, dtype=np.float64)
+
+        if band == 0:
+            np.square(delta, out=magnitude)
+        else:
+            magnitude += delta**2
+
+        direction += (delta > 0) * float(2**band)
+        unchanged |= delta == 0
+
+    np.sqrt(magnitude, out=magnitude)
+    direction[unchanged] = 0
+    return result
+
+
+def stream_cva(
+    after_paths: Sequence[BandPathType],
+    before_paths: Sequence[BandPathType],
+    output_file: BandPathType,
+    block_size: Optional[int] = None,
+    layers: slice = slice(None),
+) -> str:
+    """
+    Runs change vector analysis block by block and streams the layers to a GeoTIFF.
+
+    Args:
+        after_paths (Sequence[BandPathType]): The bands after the change.
+        before_paths (Sequence[BandPathType]): The matching bands before the change.
+        output_file (BandPathType): Path of the GeoTIFF to write, with the layers of
+            cva_block as bands.
+        block_size (Optional[int]): Size of square windows, or None for the native
+            tiling of the first after band.
+        layers (slice): The layers of cva_block to write, all of them by default.
+
+    Returns:
+        str: The path of the written GeoTIFF.
+
+    Raises:
+        ValueError: If no band pair is given or the sequences differ in length.
+    """
+    if not after_paths or len(after_paths) != len(before_paths):
+        raise ValueError(
+            f"Expected matching before/after bands, got {len(before_paths)} "
+            f"and {len(after_paths)}."
+        )
+
+    band_paths = {f"after_{index}": path for index, path in enumerate(after_paths)}
+    band_paths.update(
+        {f"before_{index}": path for index, path in enumerate(before_paths)}
+    )
+
+    def process_block(blocks):
+        return cva_block(
+            [blocks[f"after_{index}"] for index in range(len(after_paths))],
+            [blocks[f"before_{index}"] for index in range(len(before_paths))],
+        )[..., layers]
+
+    return stream_blocks(band_paths, output_file, process_block, block_size)
@@ -1,6 +1,7 @@
 from pathlib import Path
 
 from fezrs.base import BaseTool
+from fezrs.tools.spectral_indices.spectral_engine import normalized_difference
 from fezrs.utils.type_handler import BandPathType, TimeCDType
 
 
@@ -34,33 +35,25 @@ class IndicesCalculator(BaseTool):
     def _validate(self):
         pass
 
-    def process(self):
+    @property
+    def _block_bands(self):
         match (self.selectedTime):
-            case "after":
-                self._output = self._output = (
-                    self.time_bands["nir"]["image_skimage"]
-                    - self.time_bands["swir2"]["image_skimage"]
-                ) / (
-                    self.time_bands["nir"]["image_skimage"]
-                    + self.time_bands["swir2"]["image_skimage"]
-                )
             case "before":
-                self._output = (
-                    self.time_bands["before_nir"]["image_skimage"]
-                    - self.time_bands["before_swir2"]["image_skimage"]
-                ) / (
-                    self.time_bands["before_nir"]["image_skimage"]
-                    + self.time_bands["before_swir2"]["image_skimage"]
-                )
+                return ("before_nir", "before_swir2")
             case _:
-                self._output = self._output = self._output = (
-                    self.time_bands["nir"]["image_skimage"]
-                    - self.time_bands["swir2"]["image_skimage"]
-                ) / (
-                    self.time_bands["nir"]["image_skimage"]
-                    + self.time_bands["swir2"]["image_skimage"]
-                )
+                return ("nir", "swir2")
+
+    @property
+    def _block_intermediates(self):
+        return {"nbr": (normalized_difference, self._block_bands)}
+
+    def _process_block(self, bands):
+        return self._intermediate(bands, "nbr")
 
+    def process(self):
+        self._output = self._process_block(
+            {band: self.time_bands[band]["image_skimage"] for band in self._block_bands}
+        )
         return self._output
 
     def execute(
@@ -2,10 +2,13 @@ import numpy as np
 from pathlib import Path
 
 from fezrs.base import BaseTool
+from fezrs.tools.change_detection.cva_engine import cva_block
 from fezrs.utils.type_handler import BandPathType, MagDirCDType
 
 
 class MagDirCalculator(BaseTool):
+    _block_bands = ("nir", "swir1", "before_nir", "before_swir1")
+
     def __init__(
         self,
         nir_path: BandPathType,
@@ -13,6 +16,7 @@ class MagDirCalculator(BaseTool):
         before_nir_path: BandPathType,
         before_swir1_path: BandPathType,
         selecte: MagDirCDType,
+        block_rows: int = 1024,
     ):
         super().__init__(
             nir_path=nir_path,
@@ -31,82 +35,36 @@ class MagDirCalculator(BaseTool):
         )
 
         self.select: MagDirCDType = selecte
+        self.block_rows = block_rows
 
     def _validate(self):
         pass
 
-    def process(self):
-        change_magnitude_result = np.empty(
-            self.time_bands["nir"]["image_skimage"].shape
+    def _process_block(self, bands):
+        result = cva_block(
+            [bands["nir"], bands["swir1"]], [bands["before_nir"], bands["before_swir1"]]
         )
-        change_direction_result = np.empty(
-            self.time_bands["nir"]["image_skimage"].shape
-        )
-
-        for i in range(len(self.time_bands["nir"]["image_skimage"])):
-            for j in range(len(self.time_bands["nir"]["image_skimage"][0])):
-                change_magnitude = np.sqrt(
-                    (
-                        self.time_bands["before_nir"]["image_skimage"][i][j]
-                        - self.time_bands["nir"]["image_skimage"][i][j]
-                    )
-                    ** 2
-                    + (
-                        self.time_bands["before_swir1"]["image_skimage"][i][j]
-                        - self.time_bands["swir1"]["image_skimage"][i][j]
-                    )
-                    ** 2
-                )
-
-                if (
-                    self.time_bands["nir"]["image_skimage"][i][j]
-                    - self.time_bands["before_nir"]["image_skimage"][i][j]
-                    < 0
-                    and self.time_bands["swir1"]["image_skimage"][i][j]
-                    - self.time_bands["before_swir1"]["image_skimage"][i][j]
-                    < 0
-                ):
-                    change_direction = 1
-                elif (
-                    self.time_bands["nir"]["image_skimage"][i][j]
-                    - self.time_bands["before_nir"]["image_skimage"][i][j]
-                    > 0
-                    and self.time_bands["swir1"]["image_skimage"][i][j]
-                    - self.time_bands["before_swir1"]["image_skimage"][i][j]
-                    < 0
-                ):
-                    change_direction = 2
-                elif (
-                    self.time_bands["nir"]["image_skimage"][i][j]
-                    - self.time_bands["before_nir"]["image_skimage"][i][j]
-                    < 0
-                    and self.time_bands["swir1"]["image_skimage"][i][j]
-                    - self.time_bands["before_swir1"]["image_skimage"][i][j]
-                    > 0
-                ):
-                    change_direction = 3
-                elif (
-                    self.time_bands["nir"]["image_skimage"][i][j]
-                    - self.time_bands["before_nir"]["image_skimage"][i][j]
-                    > 0
-                    and self.time_bands["swir1"]["image_skimage"][i][j]
-                    - self.time_bands["before_swir1"]["image_skimage"][i][j]
-                    > 0
-                ):
-                    change_direction = 4
-
-                change_magnitude_result[i][j] = change_magnitude
-                change_direction_result[i][j] = change_direction
 
         match (self.select):
             case "magnitude":
-                self._output = change_magnitude_result
-
-            case "direction":
-                self._output = change_direction_result
+                return result[..., 0]
 
+            # Codes 1 to 4 are the sectors of the original per-pixel loop. 0 marks
+            # pixels where NIR or SWIR1 did not change, which the loop left with
+            # the code of the previous pixel
             case _:
-                self._output = change_direction_result
+                return result[..., 1]
+
+    def process(self):
+        bands = {band: self.files_handler.bands[band] for band in self._block_bands}
+        rows = bands["nir"].shape[0]
+
+        self._output = np.empty(bands["nir"].shape)
+        for row in range(0, rows, self.block_rows):
+            block = slice(row, row + self.block_rows)
+            self._output[block] = self._process_block(
+                {band: image[block] for band, image in bands.items()}
+            )
 
         return self._output
 
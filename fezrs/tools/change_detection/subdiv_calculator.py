@@ -5,6 +5,8 @@ from fezrs.utils.type_handler import BandPathType, SubDivCDType
 
 
 class SubDivCalculator(BaseTool):
+    _block_bands = ("nir", "before_nir")
+
     def __init__(
         self,
         nir_path: BandPathType,
@@ -28,25 +30,19 @@ class SubDivCalculator(BaseTool):
     def _validate(self):
         pass
 
-    def process(self):
-
+    def _process_block(self, bands):
         match (self.operation):
             case "divide":
-                self._output = (
-                    self.time_bands["before_nir"]["image_skimage"]
-                    / self.time_bands["nir"]["image_skimage"]
-                )
+                return bands["before_nir"] / bands["nir"]
             case "subtract":
-                self._output = (
-                    self.time_bands["before_nir"]["image_skimage"]
-                    - self.time_bands["nir"]["image_skimage"]
-                )
+                return bands["before_nir"] - bands["nir"]
             case _:
-                self._output = (
-                    self.time_bands["before_nir"]["image_skimage"]
-                    - self.time_bands["nir"]["image_skimage"]
-                )
+                return bands["before_nir"] - bands["nir"]
 
+    def process(self):
+        self._output = self._process_block(
+            {band: self.time_bands[band]["image_skimage"] for band in self._block_bands}
+        )
         return self._output
 
     def execute(
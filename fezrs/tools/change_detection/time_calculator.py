@@ -28,15 +28,21 @@ class TimeCalculator(BaseTool):
     def _validate(self):
         pass
 
-    def process(self):
+    @property
+    def _block_bands(self):
         match (self.selectedTime):
-            case "after":
-                self._output = self.time_bands["nir"]["image_skimage"]
             case "before":
-                self._output = self.time_bands["before_nir"]["image_skimage"]
+                return ("before_nir",)
             case _:
-                self._output = self.time_bands["nir"]["image_skimage"]
+                return ("nir",)
+
+    def _process_block(self, bands):
+        return bands[self._block_bands[0]]
 
+    def process(self):
+        self._output = self._process_block(
+            {band: self.time_bands[band]["image_skimage"] for band in self._block_bands}
+        )
         return self._output
 
     def execute(
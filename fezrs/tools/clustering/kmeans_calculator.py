@@ -1,11 +1,17 @@
 # Import packages and libraries
 import numpy as np
 from pathlib import Path
-from sklearn.cluster import KMeans
 
 # Import module and files
 from fezrs.base import BaseTool
-from fezrs.utils.type_handler import BandPathType
+from fezrs.tools.clustering.kmeans_engine import fit_kmeans, sample_pixels
+from fezrs.utils.model_handler import load_model, save_model
+from fezrs.utils.predict_handler import predict_chunked
+from fezrs.utils.type_handler import (
+    BandPathType,
+    KMeansMethodType,
+    PixelSamplingType,
+)
 
 
 # Calculator class
@@ -13,8 +19,14 @@ class KMeansCalculator(BaseTool):
     def __init__(
         self,
         nir_path: BandPathType,
-        n_clusters: any,
-        random_state: any,
+        n_clusters: any = None,
+        random_state: any = None,
+        model_path: BandPathType | None = None,
+        chunk_size: int = 1_000_000,
+        method: KMeansMethodType = "full",
+        sample_size: int | None = None,
+        sampling: PixelSamplingType = "random",
+        batch_size: int = 4096,
     ):
         super().__init__(nir_path=nir_path)
 
@@ -26,12 +38,26 @@ class KMeansCalculator(BaseTool):
             requested_bands=["nir"]
         )
 
-        self.nir_band = self.files_handler.bands["nir"]
-
         self.n_clusters = n_clusters
         self.random_state = random_state
+        self.model_path = model_path
+        self.chunk_size = chunk_size
+        self.method: KMeansMethodType = method
+        self.sample_size = sample_size
+        self.sampling: PixelSamplingType = sampling
+        self.batch_size = batch_size
+
+    @property
+    def nir_band(self) -> np.ndarray:
+        return self.files_handler.bands["nir"]
 
     def _validate(self):
+        # A saved model brings its own clusters
+        if self.model_path is not None:
+            if not Path(self.model_path).exists():
+                raise FileNotFoundError(f"File {self.model_path} not found")
+            return
+
         # Validate n_clusters
         if not isinstance(self.n_clusters, int):
             raise TypeError(
@@ -46,6 +72,18 @@ class KMeansCalculator(BaseTool):
                 f"'random_state' must be an int or None, got {type(self.random_state).__name__}"
             )
 
+        # Validate the fitting options
+        if self.method not in ("full", "minibatch"):
+            raise ValueError(f"Unsupported k-means method '{self.method}'")
+        if self.sampling not in ("random", "stratified"):
+            raise ValueError(f"Unsupported sampling '{self.sampling}'")
+        if self.sample_size is not None and (
+            not isinstance(self.sample_size, int) or self.sample_size < self.n_clusters
+        ):
+            raise ValueError(
+                f"'sample_size' must be an int >= n_clusters, got {self.sample_size}"
+            )
+
         # Validate nir_band
         if not isinstance(self.nir_band, np.ndarray):
             raise TypeError(
@@ -63,7 +101,58 @@ class KMeansCalculator(BaseTool):
         if not isinstance(metadata.get("height"), int) or metadata["height"] <= 0:
             raise ValueError("Invalid height in NIR metadata")
 
+    def _process_pretrained(self) -> np.ndarray:
+        """
+        Assigns every pixel to the clusters of the model saved at model_path.
+
+        Returns:
+            np.ndarray: The image of cluster centers.
+        """
+        self.kmeans, _ = load_model(self.model_path, self.__class__.__name__, ["nir"])
+        labels = predict_chunked(self.kmeans, [self.nir_band], self.chunk_size)
+
+        self._output = self.kmeans.cluster_centers_[labels, 0]
+        return self._output
+
+    def save_model(self, path: BandPathType) -> str:
+        """
+        Saves the fitted KMeans model with its band layout, for reuse through model_path.
+
+        If the output was loaded from the result cache, the model is fitted again
+        first, since the cache only stores outputs.
+
+        Args:
+            path (BandPathType): Path of the file to write, conventionally .joblib.
+
+        Returns:
+            str: The path of the written file.
+
+        Raises:
+            ValueError: If no model was fitted yet.
+        """
+        if getattr(self, "kmeans", None) is None and self._output is not None:
+            self.process()
+        if getattr(self, "kmeans", None) is None:
+            raise ValueError("No fitted model, call process() first.")
+
+        return save_model(
+            path,
+            self.kmeans,
+            tool=self.__class__.__name__,
+            bands=["nir"],
+            dtypes=[str(self.nir_band.dtype)],
+            n_clusters=int(self.kmeans.n_clusters),
+        )
+
     def process(self) -> np.ndarray:
+        if self.model_path is not None:
+            return self._process_pretrained()
+
+        # Fitting on a sample, then assigning every pixel block by block, keeps
+        # the fit independent of the scene size
+        if self.sample_size is not None or self.method != "full":
+            return self._process_sampled()
+
         image_reshape = self.nir_band.reshape(
             self.metadata_bands["nir"]["width"] * self.metadata_bands["nir"]["height"],
             1,
@@ -75,8 +164,8 @@ class KMeansCalculator(BaseTool):
         random_state = self.random_state
 
         # Initialize and fit the KMeans model
-        kmeans = KMeans(n_clusters=n_clusters, random_state=random_state)
-        kmeans.fit(image_reshape)
+        kmeans = fit_kmeans(image_reshape, n_clusters, "full", random_state)
+        self.kmeans = kmeans
 
         # Get cluster centers and labels
         cluster_centers = kmeans.cluster_centers_
@@ -91,6 +180,27 @@ class KMeansCalculator(BaseTool):
 
         return self._output
 
+    def _process_sampled(self) -> np.ndarray:
+        """
+        Fits on a pixel sample, or with mini-batches, and assigns every pixel in chunks.
+
+        Returns:
+            np.ndarray: The image of cluster centers.
+        """
+        samples = sample_pixels(
+            self.nir_band,
+            self.sample_size or self.nir_band.size,
+            self.sampling,
+            self.random_state,
+        )
+        self.kmeans = fit_kmeans(
+            samples, self.n_clusters, self.method, self.random_state, self.batch_size
+        )
+
+        labels = predict_chunked(self.kmeans, [self.nir_band], self.chunk_size)
+        self._output = self.kmeans.cluster_centers_[labels, 0]
+        return self._output
+
     def _customize_export_file(self, ax):
         pass
 
@@ -0,0 +1,89 @@
+# Import packages and libraries
+import numpy as np
+from sklearn.cluster import KMeans, MiniBatchKMeans
+
+# Import module and files
+from fezrs.utils.type_handler import KMeansMethodType, PixelSamplingType
+
+
+def sample_pixels(
+    band: np.ndarray,
+    sample_size: int,
+    sampling: PixelSamplingType = "random",
+    random_state: int | None = None,
+) -> np.ndarray:
+    """
+    Draws a pixel sample of a band as a (pixels, 1) feature matrix.
+
+    Random sampling draws pixels uniformly without replacement. Stratified
+    sampling splits the image into a grid of about sample_size cells and draws
+    one pixel per cell, so every part of the scene is represented.
+
+    Args:
+        band (np.ndarray): 2D band.
+        sample_size (int): Approximate number of pixels to draw.
+        sampling (PixelSamplingType): "random" or "stratified".
+        random_state (int | None): Seed of the draw.
+
+    Returns:
+        np.ndarray: The sampled pixels, every pixel if sample_size >= band.size.
+    """
+    rng = np.random.default_rng(random_state)
+    height, width = band.shape
+    if sample_size >= band.size:
+        return band.reshape(-1, 1)
+
+    match (sampling):
+        case "random":
+            flat = rng.choice(band.size, size=sample_size, replace=False)
+            rows, cols = np.divmod(np.sort(flat), width)
+        case "stratified":
+            step = max(1, int(np.sqrt(band.size / sample_size)))
+            starts_r = np.arange(0, height, step)
+            starts_c = np.arange(0, width, step)
+            starts_r, starts_c = np.meshgrid(starts_r, starts_c, indexing="ij")
+            # Cells on the last row and column may be cut by the image border
+            rows = starts_r + rng.integers(0, np.minimum(step, height - starts_r))
+            cols = starts_c + rng.integers(0, np.minimum(step, width - starts_c))
+            rows, cols = rows.ravel(), cols.ravel()
+        case _:
+            raise ValueError(f"Unsupported sampling '{sampling}'")
+
+    return band[rows, cols].reshape(-1, 1)
+
+
+def fit_kmeans(
+    samples: np.ndarray,
+    n_clusters: int,
+    method: KMeansMethodType = "full",
+    random_state: int | None = None,
+    batch_size: int = 4096,
+):
+    """
+    Fits k-means on a (pixels, features) sample matrix.
+
+    Args:
+        samples (np.ndarray): The pixels to fit on.
+        n_clusters (int): Number of clusters.
+        method (KMeansMethodType): "full" for Lloyd's algorithm on every sample,
+            "minibatch" for mini-batch updates of batch_size samples.
+        random_state (int | None): Seed of the initialization.
+        batch_size (int): Samples per mini-batch.
+
+    Returns:
+        The fitted KMeans or MiniBatchKMeans model.
+    """
+    match (method):
+        case "full":
+            model = KMeans(n_clusters=n_clusters, random_state=random_state)
+        case "minibatch":
+            model = MiniBatchKMeans(
+                n_clusters=n_clusters,
+                random_state=random_state,
+                batch_size=batch_size,
+                n_init="auto",
+            )
+        case _:
+            raise ValueError(f"Unsupported k-means method '{method}'")
+
+    return model.fit(samples)
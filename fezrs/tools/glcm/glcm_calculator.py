@@ -1,7 +1,8 @@
 import numpy as np
 from pathlib import Path
+from typing import List
 from fezrs.base import BaseTool
-from skimage.feature import graycomatrix, graycoprops
+from fezrs.tools.glcm.glcm_engine import glcm_features, glcm_features_tiled
 from fezrs.utils.type_handler import BandPathType, PropertyGLCMType
 
 
@@ -10,7 +11,11 @@ class GLCMCalculator(BaseTool):
         self,
         nir_path: BandPathType,
         window_size: int = 3,
-        propery: PropertyGLCMType = "contrast",
+        propery: PropertyGLCMType | List[PropertyGLCMType] = "contrast",
+        distances: List[int] | None = None,
+        angles: List[float] | None = None,
+        tile_size: int | None = None,
+        workers: int | None = None,
     ):
         super().__init__(nir_path=nir_path)
 
@@ -18,32 +23,101 @@ class GLCMCalculator(BaseTool):
             requested_bands=["nir"]
         )
 
-        self.result = np.empty(
-            (self.metadata_bands["nir"]["width"], self.metadata_bands["nir"]["height"])
-        )
-
-        self.nir_image = np.array(
-            self.metadata_bands["nir"]["image_skimage"], dtype="uint8"
-        )
-
         self.property = propery
+        self.properties = [propery] if isinstance(propery, str) else list(propery)
+        self.distances = [1] if distances is None else list(distances)
+        self.angles = [0] if angles is None else list(angles)
         self.window_size = window_size
+        self.tile_size = tile_size
+        self.workers = workers
+
+        self.feature_names = [
+            f"{prop}_d{distance}_a{np.degrees(angle):g}"
+            for prop in self.properties
+            for distance in self.distances
+            for angle in self.angles
+        ]
+
+    @property
+    def nir_image(self) -> np.ndarray:
+        return np.array(self.metadata_bands["nir"]["image_skimage"], dtype="uint8")
 
     def process(self):
-        for i in range(0, self.metadata_bands["nir"]["width"]):
-            print(f"Processing row {i} of {self.metadata_bands['nir']['width']}")
-            for j in range(0, self.metadata_bands["nir"]["height"]):
-                window = self.nir_image[
-                    i : i + self.window_size, j : j + self.window_size
-                ]
-                glcm = graycomatrix(window, [1], [0], normed=True, symmetric=True)
-                res = graycoprops(glcm, self.property)[0][0]
-                self.result[i, j] = res
+        nir_image = self.nir_image
+        options = {
+            "window_size": self.window_size,
+            "properties": self.properties,
+            "distances": self.distances,
+            "angles": self.angles,
+        }
+
+        if self.tile_size is None:
+            features = glcm_features(nir_image, **options)
+        else:
+            features = glcm_features_tiled(
+                nir_image,
+                tile_size=self.tile_size,
+                workers=self.workers,
+                **options,
+            )
+        features = features.reshape((-1,) + nir_image.shape)
+
+        # A single feature keeps the 2D output, several are stacked as (H, W, F)
+        if len(features) == 1:
+            self.result = features[0]
+        else:
+            self.result = np.moveaxis(features, 0, -1)
+
         self._output = self.result
+        return self._output
 
     def _validate(self):
         pass
 
+    def _export_file(
+        self,
+        output_path,
+        title=None,
+        figsize=(15, 10),
+        show_axis=False,
+        colormap=None,
+        show_colorbar=False,
+        filename_prefix="Tool_output",
+        dpi=500,
+        bbox_inches="tight",
+        grid=False,
+        nrows=None,
+        ncols=None,
+    ):
+        if self._output is None or self._output.ndim == 2:
+            return super()._export_file(
+                output_path,
+                title,
+                figsize,
+                show_axis,
+                colormap,
+                show_colorbar,
+                filename_prefix,
+                dpi,
+                bbox_inches,
+                grid,
+            )
+
+        return self._export_stack(
+            output_path,
+            self.feature_names,
+            title,
+            figsize,
+            show_axis,
+            colormap,
+            show_colorbar,
+            dpi,
+            bbox_inches,
+            grid,
+            nrows,
+            ncols,
+        )
+
     def execute(
         self,
         output_path,
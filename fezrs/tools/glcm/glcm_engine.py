@@ -0,0 +1,492 @@
+# Import packages and libraries
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Sequence, Tuple, get_args
+
+# Import module and files
+from fezrs.utils.type_handler import PropertyGLCMType
+
+
+def _pair_offset(distance: int, angle: float) -> Tuple[int, int]:
+    """
+    Converts a GLCM distance/angle pair into a (row, column) pixel offset.
+
+    Rounds half away from zero, matching the offsets used by
+    skimage.feature.graycomatrix.
+
+    Args:
+        distance (int): Pixel pair distance.
+        angle (float): Pixel pair angle in radians.
+
+    Returns:
+        Tuple[int, int]: The (row, column) offset of the neighbour pixel.
+    """
+
+    def _round(value: float) -> int:
+        return int(np.sign(value) * np.floor(np.abs(value) + 0.5))
+
+    return _round(np.sin(angle) * distance), _round(np.cos(angle) * distance)
+
+
+def _overlap(size: int, shift: int) -> Tuple[slice, slice]:
+    """
+    Finds the positions along an axis whose shifted partner stays in range.
+
+    Args:
+        size (int): Length of the axis.
+        shift (int): Shift applied to every position.
+
+    Returns:
+        Tuple[slice, slice]: The positions and their shifted partners.
+    """
+    start = min(max(0, -shift), size)
+    stop = max(min(size, size - shift), start)
+    return slice(start, stop), slice(start + shift, stop + shift)
+
+
+def _shifted_pairs(
+    image: np.ndarray, offset: Tuple[int, int]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pairs every pixel with its neighbour at the given offset.
+
+    Args:
+        image (np.ndarray): 2D quantized image.
+        offset (Tuple[int, int]): The (row, column) offset of the neighbour.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The reference levels, the
+            neighbour levels and a mask of pixels whose neighbour lies inside
+            the image. Pixels outside the mask hold zero in both level arrays.
+    """
+    height, width = image.shape
+    d_row, d_col = offset
+
+    reference = np.zeros((height, width), dtype=np.int64)
+    neighbour = np.zeros((height, width), dtype=np.int64)
+    valid = np.zeros((height, width), dtype=bool)
+
+    rows, shifted_rows = _overlap(height, d_row)
+    cols, shifted_cols = _overlap(width, d_col)
+
+    reference[rows, cols] = image[rows, cols]
+    neighbour[rows, cols] = image[shifted_rows, shifted_cols]
+    valid[rows, cols] = True
+
+    return reference, neighbour, valid
+
+
+def _running_window_sums(
+    values: np.ndarray,
+    window_size: int,
+    lead: Tuple[int, int],
+    trail: Tuple[int, int],
+) -> np.ndarray:
+    """
+    Sums a floating point map over every sliding window, one axis at a time.
+
+    Every window is accumulated in the same order wherever it lies in the
+    image, so the result does not depend on how the image was tiled.
+
+    Args:
+        values (np.ndarray): 2D floating point map to accumulate.
+        window_size (int): Size of the square window.
+        lead (Tuple[int, int]): Rows/columns skipped at the window start.
+        trail (Tuple[int, int]): Rows/columns skipped at the window end.
+
+    Returns:
+        np.ndarray: Windowed sums with the same shape as values.
+    """
+    result = values
+    for axis in (0, 1):
+        lines = np.moveaxis(result, axis, 0)
+        size = lines.shape[0]
+        kept = max(size - trail[axis], 0)
+
+        # Zero padding past the end stands in for the truncated edge windows
+        padded = np.zeros((size + window_size,) + lines.shape[1:], dtype=lines.dtype)
+        padded[:kept] = lines[:kept]
+
+        summed = np.zeros_like(lines)
+        for step in range(lead[axis], window_size - trail[axis]):
+            summed += padded[step : step + size]
+
+        result = np.moveaxis(summed, 0, axis)
+
+    return result
+
+
+def _window_sums(
+    values: np.ndarray,
+    window_size: int,
+    lead: Tuple[int, int],
+    trail: Tuple[int, int],
+) -> np.ndarray:
+    """
+    Sums a per-pixel map over every sliding window.
+
+    The window anchored at (i, j) spans rows [i, min(i + window_size, height))
+    and the matching columns, like the slicing used by the per-pixel GLCM loop.
+    Only positions in [i + lead, end - trail) along each axis are accumulated,
+    which restricts the sum to pixels whose pair partner stays in the window.
+    Integer maps use an integral image, which is exact; floating point maps use
+    _running_window_sums so tiled and untiled results stay bit-identical.
+
+    Args:
+        values (np.ndarray): 2D map to accumulate.
+        window_size (int): Size of the square window.
+        lead (Tuple[int, int]): Rows/columns skipped at the window start.
+        trail (Tuple[int, int]): Rows/columns skipped at the window end.
+
+    Returns:
+        np.ndarray: Windowed sums with the same shape as values.
+    """
+    if np.issubdtype(values.dtype, np.floating):
+        return _running_window_sums(values, window_size, lead, trail)
+
+    height, width = values.shape
+
+    integral = np.zeros((height + 1, width + 1), dtype=values.dtype)
+    np.cumsum(np.cumsum(values, axis=0), axis=1, out=integral[1:, 1:])
+
+    def _bounds(size, lead_size, trail_size):
+        start = np.arange(size)
+        low = np.minimum(start + lead_size, size)
+        high = np.maximum(low, np.minimum(start + window_size, size) - trail_size)
+        return low, high
+
+    row_low, row_high = _bounds(height, lead[0], trail[0])
+    col_low, col_high = _bounds(width, lead[1], trail[1])
+
+    return (
+        integral[np.ix_(row_high, col_high)]
+        - integral[np.ix_(row_low, col_high)]
+        - integral[np.ix_(row_high, col_low)]
+        + integral[np.ix_(row_low, col_low)]
+    )
+
+
+def _window_asm(
+    reference: np.ndarray,
+    neighbour: np.ndarray,
+    valid: np.ndarray,
+    window_size: int,
+    offset: Tuple[int, int],
+    levels: int,
+) -> np.ndarray:
+    """
+    Computes the un-normalized sum of squared symmetric GLCM entries per window.
+
+    For a symmetric GLCM the squared entries add up to the number of pixel-pair
+    couples sharing the same unordered level pair, weighted by 4 on the
+    diagonal and 2 elsewhere. Those couples are counted displacement by
+    displacement, so the cost depends on the window size and not on levels.
+
+    Args:
+        reference (np.ndarray): Reference levels from _shifted_pairs.
+        neighbour (np.ndarray): Neighbour levels from _shifted_pairs.
+        valid (np.ndarray): Valid pair mask from _shifted_pairs.
+        window_size (int): Size of the square window.
+        offset (Tuple[int, int]): The (row, column) pair offset.
+        levels (int): Number of gray levels.
+
+    Returns:
+        np.ndarray: Sum of squared symmetric co-occurrence counts per window.
+    """
+    height, width = reference.shape
+    d_row, d_col = offset
+    lead = (max(0, -d_row), max(0, -d_col))
+    trail = (max(0, d_row), max(0, d_col))
+
+    low = np.minimum(reference, neighbour)
+    high = np.maximum(reference, neighbour)
+    codes = np.where(valid, low * levels + high, -1)
+    weights = np.where(valid, np.where(low == high, 4, 2), 0).astype(np.int64)
+
+    # Couples of a pair position with itself
+    total = _window_sums(weights, window_size, lead, trail)
+
+    span_rows = max(window_size - abs(d_row), 0)
+    span_cols = max(window_size - abs(d_col), 0)
+
+    for s_row in range(0, span_rows):
+        for s_col in range(-span_cols + 1, span_cols):
+            # Each couple (p, q) is mirrored by (q, p), so visit one half only
+            if s_row == 0 and s_col <= 0:
+                continue
+
+            rows, shifted_rows = _overlap(height, s_row)
+            cols, shifted_cols = _overlap(width, s_col)
+
+            matches = np.zeros((height, width), dtype=np.int64)
+            matches[rows, cols] = np.where(
+                codes[rows, cols] == codes[shifted_rows, shifted_cols],
+                weights[rows, cols],
+                0,
+            )
+
+            total += 2 * _window_sums(
+                matches,
+                window_size,
+                (lead[0], lead[1] + max(0, -s_col)),
+                (trail[0] + s_row, trail[1] + max(0, s_col)),
+            )
+
+    return total
+
+
+def _offset_properties(
+    image: np.ndarray,
+    window_size: int,
+    properties: Sequence[PropertyGLCMType],
+    offset: Tuple[int, int],
+    levels: int,
+) -> List[np.ndarray]:
+    """
+    Computes every requested property for a single pixel pair offset.
+
+    The shifted pairs and the per-window pair counts are accumulated once and
+    shared by all properties.
+
+    Args:
+        image (np.ndarray): 2D image with integer levels in [0, levels).
+        window_size (int): Size of the square window.
+        properties (Sequence[PropertyGLCMType]): Texture properties to compute.
+        offset (Tuple[int, int]): The (row, column) pair offset.
+        levels (int): Number of gray levels.
+
+    Returns:
+        List[np.ndarray]: One float64 property map per requested property.
+    """
+    lead = (max(0, -offset[0]), max(0, -offset[1]))
+    trail = (max(0, offset[0]), max(0, offset[1]))
+
+    reference, neighbour, valid = _shifted_pairs(image, offset)
+    pair_count = _window_sums(valid.astype(np.int64), window_size, lead, trail)
+    difference = reference - neighbour
+
+    results = []
+    for prop in properties:
+        if prop == "contrast":
+            weighted = _window_sums(difference**2, window_size, lead, trail)
+            total = pair_count
+        elif prop == "dissimilarity":
+            weighted = _window_sums(np.abs(difference), window_size, lead, trail)
+            total = pair_count
+        elif prop == "homogeneity":
+            weighted = _window_sums(
+                np.where(valid, 1.0 / (1.0 + difference**2), 0.0),
+                window_size,
+                lead,
+                trail,
+            )
+            total = pair_count
+        elif prop == "ASM":
+            weighted = _window_asm(
+                reference, neighbour, valid, window_size, offset, levels
+            )
+            total = (2 * pair_count) ** 2
+
+        weighted = weighted.astype(np.float64)
+        results.append(
+            np.divide(weighted, total, out=np.zeros_like(weighted), where=total > 0)
+        )
+
+    return results
+
+
+def glcm_features(
+    image: np.ndarray,
+    window_size: int = 3,
+    properties: Sequence[PropertyGLCMType] = ("contrast",),
+    distances: Sequence[int] = (1,),
+    angles: Sequence[float] = (0.0,),
+    levels: int = 256,
+) -> np.ndarray:
+    """
+    Computes sliding-window GLCM texture properties for a whole image at once.
+
+    Produces the same values as running skimage.feature.graycomatrix with
+    symmetric=True and normed=True followed by graycoprops on
+    image[i:i + window_size, j:j + window_size] for every pixel (i, j), but
+    accumulates the co-occurrence statistics with box filters instead of
+    building one matrix per pixel. Every distance/angle pair is accumulated
+    once and shared by all requested properties.
+
+    Args:
+        image (np.ndarray): 2D image with integer levels in [0, levels).
+        window_size (int): Size of the square window.
+        properties (Sequence[PropertyGLCMType]): Texture properties to compute.
+        distances (Sequence[int]): Pixel pair distances.
+        angles (Sequence[float]): Pixel pair angles in radians.
+        levels (int): Number of gray levels.
+
+    Returns:
+        np.ndarray: A float64 cube of shape
+            (len(properties), len(distances), len(angles), height, width),
+            ordered like the output of skimage.feature.graycoprops.
+
+    Raises:
+        ValueError: If the image is not 2D, the window size is not positive,
+            the image holds levels outside [0, levels), a list is empty or a
+            property is unknown.
+    """
+    image = np.asarray(image)
+
+    if image.ndim != 2:
+        raise ValueError(f"Expected a 2D image, got {image.ndim} dimensions")
+    if window_size < 1:
+        raise ValueError(f"'window_size' must be >= 1, got {window_size}")
+    if image.size and (image.min() < 0 or image.max() >= levels):
+        raise ValueError(
+            f"Image levels must be in [0, {levels}), got [{image.min()}, {image.max()}]"
+        )
+    if not len(properties) or not len(distances) or not len(angles):
+        raise ValueError("'properties', 'distances' and 'angles' can not be empty")
+    for prop in properties:
+        if prop not in get_args(PropertyGLCMType):
+            raise ValueError(f"{prop} is an invalid property")
+
+    features = np.empty(
+        (len(properties), len(distances), len(angles)) + image.shape,
+        dtype=np.float64,
+    )
+
+    for d_index, distance in enumerate(distances):
+        for a_index, angle in enumerate(angles):
+            offset = _pair_offset(distance, angle)
+            maps = _offset_properties(image, window_size, properties, offset, levels)
+            for p_index, feature in enumerate(maps):
+                features[p_index, d_index, a_index] = feature
+
+    return features
+
+
+def glcm_property(
+    image: np.ndarray,
+    window_size: int = 3,
+    prop: PropertyGLCMType = "contrast",
+    distance: int = 1,
+    angle: float = 0.0,
+    levels: int = 256,
+) -> np.ndarray:
+    """
+    Computes a single sliding-window GLCM texture property for a whole image.
+
+    Args:
+        image (np.ndarray): 2D image with integer levels in [0, levels).
+        window_size (int): Size of the square window.
+        prop (PropertyGLCMType): Texture property to compute.
+        distance (int): Pixel pair distance.
+        angle (float): Pixel pair angle in radians.
+        levels (int): Number of gray levels.
+
+    Returns:
+        np.ndarray: A float64 array with the property value for every pixel.
+    """
+    return glcm_features(image, window_size, [prop], [distance], [angle], levels)[
+        0, 0, 0
+    ]
+
+
+def _tile_features(arguments: tuple) -> Tuple[int, int, np.ndarray]:
+    """
+    Process pool entry point computing the features of one haloed tile.
+
+    Args:
+        arguments (tuple): The tile origin, the haloed tile, the output tile
+            shape and the glcm_features keyword arguments.
+
+    Returns:
+        Tuple[int, int, np.ndarray]: The tile origin and its feature cube
+            cropped to the output tile.
+    """
+    row, col, tile, (out_height, out_width), options = arguments
+    features = glcm_features(tile, **options)
+    return row, col, features[..., :out_height, :out_width]
+
+
+def glcm_features_tiled(
+    image: np.ndarray,
+    window_size: int = 3,
+    properties: Sequence[PropertyGLCMType] = ("contrast",),
+    distances: Sequence[int] = (1,),
+    angles: Sequence[float] = (0.0,),
+    levels: int = 256,
+    tile_size: int = 1024,
+    workers: int | None = None,
+) -> np.ndarray:
+    """
+    Computes glcm_features tile by tile, optionally on a process pool.
+
+    Each window reaches window_size - 1 pixels below and to the right of its
+    anchor, so every tile is read with a halo of that width on those sides.
+    The stitched cube is bit-identical to glcm_features on the whole image.
+
+    Args:
+        image (np.ndarray): 2D image with integer levels in [0, levels).
+        window_size (int): Size of the square window.
+        properties (Sequence[PropertyGLCMType]): Texture properties to compute.
+        distances (Sequence[int]): Pixel pair distances.
+        angles (Sequence[float]): Pixel pair angles in radians.
+        levels (int): Number of gray levels.
+        tile_size (int): Size of the square output tiles.
+        workers (int | None): Number of worker processes. None uses every CPU,
+            1 runs the tiles in the current process.
+
+    Returns:
+        np.ndarray: A float64 cube of shape
+            (len(properties), len(distances), len(angles), height, width).
+
+    Raises:
+        ValueError: If the image is not 2D or tile_size/workers is not positive.
+    """
+    image = np.asarray(image)
+
+    if image.ndim != 2:
+        raise ValueError(f"Expected a 2D image, got {image.ndim} dimensions")
+    if tile_size < 1:
+        raise ValueError(f"'tile_size' must be >= 1, got {tile_size}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"'workers' must be >= 1, got {workers}")
+
+    height, width = image.shape
+    halo = max(window_size - 1, 0)
+    options = {
+        "window_size": window_size,
+        "properties": list(properties),
+        "distances": list(distances),
+        "angles": list(angles),
+        "levels": levels,
+    }
+
+    tasks = []
+    for row in range(0, height, tile_size):
+        for col in range(0, width, tile_size):
+            out_shape = (min(tile_size, height - row), min(tile_size, width - col))
+            tile = image[row : row + tile_size + halo, col : col + tile_size + halo]
+            tasks.append((row, col, tile, out_shape, options))
+
+    features = np.empty(
+        (len(options["properties"]), len(options["distances"]), len(options["angles"]))
+        + image.shape,
+        dtype=np.float64,
+    )
+
+    def _stitch(results):
+        for row, col, tile_features in results:
+            out_height, out_width = tile_features.shape[-2:]
+            features[..., row : row + out_height, col : col + out_width] = (
+                tile_features
+            )
+
+    if workers == 1 or len(tasks) == 1:
+        _stitch(map(_tile_features, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            _stitch(executor.map(_tile_features, tasks))
+
+    return features
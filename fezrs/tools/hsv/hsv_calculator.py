@@ -18,6 +18,9 @@ HSVChannel = Literal[
 
 # Calculator class
 class HSVCalculator(BaseTool):
+    _block_bands = ("nir", "blue", "green")
+    _block_normalized = True
+
     def __init__(
         self,
         channel: HSVChannel,
@@ -40,10 +43,8 @@ class HSVCalculator(BaseTool):
     def _validate(self):
         pass
 
-    def process(self) -> np.ndarray:
-        nir, blue, green = (
-            self.normalized_bands[band] for band in ("nir", "blue", "green")
-        )
+    def _process_block(self, bands):
+        nir, blue, green = (bands[band] for band in ("nir", "blue", "green"))
 
         hsv_calculated = rgb2hsv(np.dstack((nir, green, blue)))
 
@@ -54,8 +55,10 @@ class HSVCalculator(BaseTool):
             "value": hsv_calculated[:, :, 2],
         }
 
-        self._output = channels[self.selected_channel]
+        return channels[self.selected_channel]
 
+    def process(self) -> np.ndarray:
+        self._output = self._process_block(self.normalized_bands)
         return self._output
 
     def _customize_export_file(self, ax):
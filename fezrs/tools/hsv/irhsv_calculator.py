@@ -17,6 +17,9 @@ IRHSVChannel = Literal[
 
 # Calculator class
 class IRHSVCalculator(BaseTool):
+    _block_bands = ("red", "swir1", "swir2")
+    _block_normalized = True
+
     def __init__(
         self,
         red_path: BandPathType,
@@ -39,10 +42,8 @@ class IRHSVCalculator(BaseTool):
     def _validate(self):
         pass
 
-    def process(self) -> np.ndarray:
-        red, swir1, swir2 = (
-            self.normalized_bands[band] for band in ("red", "swir1", "swir2")
-        )
+    def _process_block(self, bands):
+        red, swir1, swir2 = (bands[band] for band in ("red", "swir1", "swir2"))
 
         hsv_calculated = rgb2hsv(np.dstack((swir2, swir1, red)))
 
@@ -53,8 +54,10 @@ class IRHSVCalculator(BaseTool):
             "irvalue": hsv_calculated[:, :, 2],
         }
 
-        self._output = channels[self.selected_channel]
+        return channels[self.selected_channel]
 
+    def process(self) -> np.ndarray:
+        self._output = self._process_block(self.normalized_bands)
         return self._output
 
     def _customize_export_file(self, ax):
@@ -12,6 +12,8 @@ from fezrs.utils.histogram_handler import HistogramExportMixin
 
 # Calculator class
 class FloatCalculator(BaseTool, HistogramExportMixin):
+    _block_bands = ("nir",)
+
     def __init__(self, nir_path: BandPathType):
         super().__init__(nir_path=nir_path)
         self.metadata_bands = self.files_handler.get_metadata_bands(["nir"])
@@ -19,8 +21,13 @@ class FloatCalculator(BaseTool, HistogramExportMixin):
     def _validate(self):
         pass
 
+    def _process_block(self, bands):
+        return img_as_float(bands["nir"])
+
     def process(self):
-        self._output = img_as_float(self.metadata_bands["nir"]["image_skimage"])
+        self._output = self._process_block(
+            {"nir": self.metadata_bands["nir"]["image_skimage"]}
+        )
         return self._output
 
     def histogram_export(
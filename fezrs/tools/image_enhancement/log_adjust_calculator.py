@@ -12,6 +12,8 @@ from fezrs.utils.histogram_handler import HistogramExportMixin
 
 # Calculator class
 class LogAdjustCalculator(BaseTool):
+    _block_bands = ("nir",)
+
     def __init__(
         self,
         nir_path: BandPathType,
@@ -28,13 +30,17 @@ class LogAdjustCalculator(BaseTool):
     def _validate(self):
         pass
 
-    def process(self):
-        self._output = exposure.adjust_log(
-            img_as_float(self.metadata_bands["nir"]["image_skimage"]),
+    def _process_block(self, bands):
+        return exposure.adjust_log(
+            img_as_float(bands["nir"]),
             gain=self.gain,
             inv=self.inverse,
         )
 
+    def process(self):
+        self._output = self._process_block(
+            {"nir": self.metadata_bands["nir"]["image_skimage"]}
+        )
         return self._output
 
     def _customize_export_file(self, ax):
@@ -12,6 +12,8 @@ from fezrs.utils.histogram_handler import HistogramExportMixin
 
 # Calculator class
 class OriginalCalculator(BaseTool, HistogramExportMixin):
+    _block_bands = ("nir",)
+
     def __init__(
         self,
         nir_path: BandPathType,
@@ -23,8 +25,13 @@ class OriginalCalculator(BaseTool, HistogramExportMixin):
     def _validate(self):
         pass
 
+    def _process_block(self, bands):
+        return img_as_float(bands["nir"])
+
     def process(self):
-        self._output = img_as_float(self.metadata_bands["nir"]["image_skimage"])
+        self._output = self._process_block(
+            {"nir": self.metadata_bands["nir"]["image_skimage"]}
+        )
         return self._output
 
     def _customize_export_file(self, ax):
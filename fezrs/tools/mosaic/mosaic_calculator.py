@@ -1,37 +1,120 @@
-import numpy as np
 from uuid import uuid4
 from typing import List
 from pathlib import Path
 import matplotlib.pyplot as plt
-from rasterio.merge import merge
 from rasterio import open as rio_open
 
 from fezrs.base import BaseTool
-from fezrs.utils.type_handler import BandPathType
+from fezrs.tools.mosaic.mosaic_engine import (
+    build_overviews,
+    build_vrt,
+    mosaic_array,
+    read_preview,
+    stream_mosaic,
+)
+from fezrs.utils.type_handler import BandPathType, MosaicMethodType
 
 
 class MosaicCalculator(BaseTool):
-    def __init__(self, tif_paths: List[BandPathType]):
+    # The export writes the mosaic with the metadata computed by process
+    _cacheable = False
+
+    def __init__(
+        self,
+        tif_paths: List[BandPathType],
+        method: MosaicMethodType = "first",
+        stream: bool = False,
+        block_size: int = 512,
+        preview_size: int = 1024,
+    ):
         super().__init__(tif_paths=tif_paths)
-        self.mosaic_rasterio_tifs = self.files_handler.get_rasterio_tifs()
+
+        self.method: MosaicMethodType = method
+        self.stream = stream
+        self.block_size = block_size
+        self.preview_size = preview_size
+
+    @property
+    def mosaic_rasterio_tifs(self):
+        return self.files_handler.get_rasterio_tifs()
 
     def _validate(self):
-        pass
+        if not self.files_handler.tif_paths:
+            raise ValueError("At least one raster is required to build a mosaic.")
 
     def process(self):
-        meta = self.mosaic_rasterio_tifs[0].meta.copy()
-        mimg, mos_transform = merge(self.mosaic_rasterio_tifs)
-        meta.update(
-            {
-                "driver": "GTiff",
-                "height": mimg.shape[1],
-                "width": mimg.shape[2],
-                "transform": mos_transform,
-                "crs": self.mosaic_rasterio_tifs[0].crs,
-            }
-        )
+        # Streamed mosaics are composed while writing the output file
+        if self.stream:
+            return None
+
+        mimg, meta = mosaic_array(self.files_handler.tif_paths, self.method)
         self.mosaic_meta = meta
         self.mosaic_mimg = mimg
+        return self.mosaic_mimg
+
+    def _write_mosaic(self, tif_filename):
+        if self.stream:
+            return stream_mosaic(
+                self.files_handler.tif_paths,
+                tif_filename,
+                self.method,
+                self.block_size,
+            )
+
+        with rio_open(tif_filename, "w", **self.mosaic_meta) as dest:
+            dest.write(self.mosaic_mimg)
+        build_overviews(tif_filename)
+        return tif_filename
+
+    def execute_stream(self, output_path, block_size=None):
+        """
+        Writes the mosaic window by window to a tiled GeoTIFF with overviews.
+
+        Args:
+            output_path: Directory to save the GeoTIFF.
+            block_size: Size of the output windows, or None for the tool's block_size.
+
+        Returns:
+            self: The instance of the tool. The GeoTIFF path is stored in output_file.
+        """
+        self._validate()
+
+        output_path = Path(output_path)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        self.output_file = stream_mosaic(
+            self.files_handler.tif_paths,
+            f"{output_path}/Mosaic_{uuid4().hex}.tif",
+            self.method,
+            block_size or self.block_size,
+        )
+        self._output = self.output_file
+        return self
+
+    def execute_vrt(self, output_path):
+        """
+        Writes a virtual mosaic (VRT) referencing tif_paths, without reading any pixel.
+
+        The VRT can be passed as a band path to the other calculators.
+
+        Args:
+            output_path: Directory to save the VRT.
+
+        Returns:
+            self: The instance of the tool. The VRT path is stored in output_file.
+        """
+        self._validate()
+
+        output_path = Path(output_path)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        self.output_file = build_vrt(
+            self.files_handler.tif_paths,
+            f"{output_path}/Mosaic_{uuid4().hex}.vrt",
+            self.method,
+        )
+        self._output = self.output_file
+        return self
 
     def _export_file(
         self,
@@ -45,18 +128,18 @@ class MosaicCalculator(BaseTool):
         dpi=100,
         bbox_inches="tight",
         grid=False,
+        nrows=None,
+        ncols=None,
     ):
         filename_prefix = self.__class__.__name__.replace("Calculator", "")
         output_path = Path(output_path)
         output_path.mkdir(parents=True, exist_ok=True)
 
         tif_filename = f"{output_path}/{filename_prefix}_{uuid4().hex}.tif"
-        with rio_open(tif_filename, "w", **self.mosaic_meta) as dest:
-            dest.write(self.mosaic_mimg)
-        self._output = tif_filename
+        self._output = self._write_mosaic(tif_filename)
 
-        with rio_open(str(self._output)) as src:
-            img_data = src.read(1)
+        # The preview is read from the overviews, not the full-resolution mosaic
+        img_data = read_preview(self._output, self.preview_size)
 
         png_filename = f"{output_path}/{filename_prefix}_{uuid4().hex}.png"
 
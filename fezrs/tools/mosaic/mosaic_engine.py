@@ -0,0 +1,415 @@
+import math
+import numpy as np
+import rasterio as rio
+from pathlib import Path
+from xml.etree import ElementTree
+from rasterio import windows
+from rasterio.dtypes import dtype_rev, typename_fwd
+from rasterio.enums import Resampling
+from typing import Any, Dict, Iterator, List, Sequence, Tuple, get_args
+
+from fezrs.utils.stream_handler import _open_raster, block_windows
+from fezrs.utils.type_handler import BandPathType, MosaicMethodType
+
+
+def _mosaic_profile(sources: Sequence, block_size: int) -> Dict[str, Any]:
+    """
+    Computes the output grid covering every source, like rasterio.merge.merge.
+
+    The mosaic takes the resolution, CRS, data type and nodata value of the first source.
+
+    Args:
+        sources (Sequence): The open rasterio datasets.
+        block_size (int): Internal tile size of the output.
+
+    Returns:
+        Dict[str, Any]: The rasterio profile of the mosaic.
+
+    Raises:
+        ValueError: If a source is rotated, not north-up or in another CRS.
+    """
+    first = sources[0]
+    xs, ys = [], []
+    for src in sources:
+        if not src.transform.is_rectilinear or src.transform.a < 0:
+            raise ValueError(f"Source {src.name} must be a non-rotated raster.")
+        if src.transform.e > 0:
+            raise ValueError(f"Source {src.name} must be north-up.")
+        if src.crs != first.crs:
+            raise ValueError(f"Source {src.name} has a different CRS.")
+
+        left, bottom, right, top = src.bounds
+        xs.extend([left, right])
+        ys.extend([bottom, top])
+
+    west, south, east, north = min(xs), min(ys), max(xs), max(ys)
+    x_res, y_res = first.res
+
+    profile = first.profile.copy()
+    profile.update(
+        driver="GTiff",
+        width=int(round((east - west) / x_res)),
+        height=int(round((north - south) / y_res)),
+        transform=rio.Affine.translation(west, north) * rio.Affine.scale(x_res, -y_res),
+        compress="deflate",
+        tiled=True,
+        blockxsize=block_size,
+        blockysize=block_size,
+    )
+    return profile
+
+
+def _align(window: windows.Window) -> windows.Window:
+    """
+    Rounds a window onto the output grid without seams, as rasterio.merge does.
+
+    Args:
+        window (windows.Window): A fractional window.
+
+    Returns:
+        windows.Window: The window with integer offsets and lengths.
+    """
+    return windows.Window(
+        math.floor(window.col_off + 0.1),
+        math.floor(window.row_off + 0.1),
+        math.floor(window.width + 0.5),
+        math.floor(window.height + 0.5),
+    )
+
+
+def _merge(
+    block: np.ndarray,
+    valid: np.ndarray,
+    data: np.ndarray,
+    data_valid: np.ndarray,
+    method: MosaicMethodType,
+    counts: np.ndarray,
+):
+    """
+    Merges a source region into the current block in place.
+
+    Args:
+        block (np.ndarray): Region of the output block, float64 sums for "mean".
+        valid (np.ndarray): Pixels of the region already covered by a source.
+        data (np.ndarray): The source data for the region.
+        data_valid (np.ndarray): Pixels of data that are not nodata.
+        method (MosaicMethodType): The merge rule.
+        counts (np.ndarray): Number of sources per pixel, used by "mean".
+    """
+    match (method):
+        case "first":
+            np.copyto(block, data, casting="unsafe", where=data_valid & ~valid)
+        case "last":
+            np.copyto(block, data, casting="unsafe", where=data_valid)
+        case "min" | "max":
+            both = data_valid & valid
+            reduce = np.minimum if method == "min" else np.maximum
+            reduce(block, data, out=block, casting="unsafe", where=both)
+            np.copyto(block, data, casting="unsafe", where=data_valid & ~valid)
+        case "mean":
+            np.add(block, data, out=block, where=data_valid)
+            counts += data_valid
+
+    valid |= data_valid
+
+
+def _mosaic_blocks(
+    sources: Sequence,
+    profile: Dict[str, Any],
+    method: MosaicMethodType,
+    block_size: int,
+) -> Iterator[Tuple[windows.Window, np.ndarray]]:
+    """
+    Composes the mosaic one output window at a time.
+
+    Only the overlapping window of every source is read for each output block.
+
+    Args:
+        sources (Sequence): The open rasterio datasets, in merge order.
+        profile (Dict[str, Any]): The mosaic profile, see _mosaic_profile.
+        method (MosaicMethodType): The merge rule for overlapping pixels.
+        block_size (int): Size of square output windows.
+
+    Yields:
+        Tuple[windows.Window, np.ndarray]: Each output window and its (bands, rows, cols) block.
+    """
+    dtype = np.dtype(profile["dtype"])
+    nodata = profile["nodata"]
+    fill = 0 if nodata is None else nodata
+
+    grid = windows.Window(0, 0, profile["width"], profile["height"])
+    for window in block_windows(grid, block_size):
+        shape = (profile["count"], window.height, window.width)
+        block = np.zeros(shape, dtype=np.float64 if method == "mean" else dtype)
+        valid = np.zeros(shape, dtype=bool)
+        counts = np.zeros(shape, dtype=np.int32)
+
+        window_transform = windows.transform(window, profile["transform"])
+        west, south, east, north = windows.bounds(window, profile["transform"])
+        for src in sources:
+            left, bottom, right, top = src.bounds
+            bounds = (
+                max(west, left),
+                max(south, bottom),
+                min(east, right),
+                min(north, top),
+            )
+            if bounds[0] >= bounds[2] or bounds[1] >= bounds[3]:
+                continue
+
+            region = _align(windows.from_bounds(*bounds, window_transform))
+            if region.width <= 0 or region.height <= 0:
+                continue
+
+            data = src.read(
+                out_shape=(src.count, region.height, region.width),
+                window=windows.from_bounds(*bounds, src.transform),
+                masked=True,
+            )
+            rows, cols = region.toslices()
+            _merge(
+                block[:, rows, cols],
+                valid[:, rows, cols],
+                data.data,
+                ~np.ma.getmaskarray(data),
+                method,
+                counts[:, rows, cols],
+            )
+
+        if method == "mean":
+            np.divide(block, counts, out=block, where=valid)
+            if np.issubdtype(dtype, np.integer):
+                np.round(block, out=block)
+            block = block.astype(dtype)
+
+        block[~valid] = fill
+        yield window, block
+
+
+def _check_method(method: MosaicMethodType):
+    """
+    Raises a ValueError if method is not a supported merge rule.
+    """
+    if method not in get_args(MosaicMethodType):
+        raise ValueError(
+            f"Unsupported merge method '{method}', "
+            f"expected one of {get_args(MosaicMethodType)}"
+        )
+
+
+def mosaic_array(
+    paths: Sequence[BandPathType], method: MosaicMethodType = "first"
+) -> Tuple[np.ndarray, Dict[str, Any]]:
+    """
+    Builds a mosaic in memory.
+
+    Args:
+        paths (Sequence[BandPathType]): The rasters to merge, in merge order.
+        method (MosaicMethodType): "first" or "last" to keep the first or last valid
+            source, "min", "max" or "mean" to combine overlapping valid pixels.
+
+    Returns:
+        Tuple[np.ndarray, Dict[str, Any]]: The (bands, rows, cols) mosaic and its profile.
+
+    Raises:
+        ValueError: If no path is given, the method is unknown or the grids are incompatible.
+    """
+    _check_method(method)
+    if not paths:
+        raise ValueError("At least one raster is required to build a mosaic.")
+
+    sources = [_open_raster(path) for path in paths]
+    try:
+        profile = _mosaic_profile(sources, 512)
+        size = max(profile["width"], profile["height"])
+        ((_, mosaic),) = _mosaic_blocks(sources, profile, method, size)
+    finally:
+        for src in sources:
+            src.close()
+
+    return mosaic, profile
+
+
+def build_overviews(path: BandPathType, min_size: int = 256) -> List[int]:
+    """
+    Adds internal overviews to a raster, halving it until it fits min_size.
+
+    Args:
+        path (BandPathType): The raster to update.
+        min_size (int): Largest dimension of the smallest overview.
+
+    Returns:
+        List[int]: The decimation factors that were built.
+    """
+    with rio.open(path, "r+") as dst:
+        factors = []
+        factor = 2
+        while max(dst.width, dst.height) / factor >= min_size:
+            factors.append(factor)
+            factor *= 2
+
+        if factors:
+            dst.build_overviews(factors, Resampling.nearest)
+            dst.update_tags(ns="rio_overview", resampling="nearest")
+
+    return factors
+
+
+def read_preview(path: BandPathType, max_size: int = 1024, band: int = 1) -> np.ndarray:
+    """
+    Reads a decimated band for previews.
+
+    Decimated reads are served from the closest overview when the raster has
+    them, so the full-resolution pixels are never read.
+
+    Args:
+        path (BandPathType): The raster to preview.
+        max_size (int): Largest dimension of the preview.
+        band (int): The band to read, starting at 1.
+
+    Returns:
+        np.ndarray: The preview of the band.
+    """
+    with _open_raster(path) as src:
+        factor = max(1, math.ceil(max(src.width, src.height) / max_size))
+        return src.read(
+            band,
+            out_shape=(math.ceil(src.height / factor), math.ceil(src.width / factor)),
+            resampling=Resampling.nearest,
+        )
+
+
+def stream_mosaic(
+    paths: Sequence[BandPathType],
+    output_file: BandPathType,
+    method: MosaicMethodType = "first",
+    block_size: int = 512,
+    overviews: bool = True,
+) -> str:
+    """
+    Writes a mosaic window by window, never holding the full mosaic in memory.
+
+    Args:
+        paths (Sequence[BandPathType]): The rasters to merge, in merge order.
+        output_file (BandPathType): Path of the GeoTIFF to write.
+        method (MosaicMethodType): The merge rule, see mosaic_array.
+        block_size (int): Size of the output windows and internal tiles, a multiple of 16.
+        overviews (bool): Whether to build internal overviews for fast previews.
+
+    Returns:
+        str: The path of the written GeoTIFF.
+
+    Raises:
+        ValueError: If no path is given, the method is unknown or the grids are incompatible.
+    """
+    _check_method(method)
+    if not paths:
+        raise ValueError("At least one raster is required to build a mosaic.")
+
+    sources = [_open_raster(path) for path in paths]
+    try:
+        profile = _mosaic_profile(sources, block_size)
+        with rio.open(output_file, "w", **profile) as dst:
+            for window, block in _mosaic_blocks(sources, profile, method, block_size):
+                dst.write(block, window=window)
+    finally:
+        for src in sources:
+            src.close()
+
+    if overviews:
+        build_overviews(output_file)
+
+    return str(output_file)
+
+
+def build_vrt(
+    paths: Sequence[BandPathType],
+    output_file: BandPathType,
+    method: MosaicMethodType = "first",
+) -> str:
+    """
+    Writes a virtual mosaic (VRT) referencing the sources instead of copying pixels.
+
+    Only the headers of the sources are read, so the VRT is written in
+    milliseconds and takes a few kilobytes whatever the size of the inputs.
+    Pixels are composed by GDAL when the VRT is read, and any FEZrs band path
+    accepts the resulting file.
+
+    Args:
+        paths (Sequence[BandPathType]): The rasters to merge, in merge order.
+        output_file (BandPathType): Path of the .vrt file to write.
+        method (MosaicMethodType): "first" or "last" to keep the first or last valid
+            source. Combining rules need pixel access and are not supported.
+
+    Returns:
+        str: The path of the written VRT.
+
+    Raises:
+        ValueError: If no path is given, the method is not "first" or "last" or the
+            grids are incompatible.
+    """
+    if method not in ("first", "last"):
+        raise ValueError(
+            f"Virtual mosaics support the 'first' and 'last' methods, not '{method}'"
+        )
+    if not paths:
+        raise ValueError("At least one raster is required to build a mosaic.")
+
+    sources = [_open_raster(path) for path in paths]
+    try:
+        profile = _mosaic_profile(sources, 512)
+
+        dataset = ElementTree.Element(
+            "VRTDataset",
+            rasterXSize=str(profile["width"]),
+            rasterYSize=str(profile["height"]),
+        )
+        if profile["crs"] is not None:
+            ElementTree.SubElement(dataset, "SRS").text = profile["crs"].to_wkt()
+        ElementTree.SubElement(dataset, "GeoTransform").text = ", ".join(
+            repr(value) for value in profile["transform"].to_gdal()
+        )
+
+        # GDAL paints sources in order, so the first valid source is listed last
+        ordered = sources[::-1] if method == "first" else sources
+        data_type = typename_fwd[dtype_rev[np.dtype(profile["dtype"]).name]]
+        for band in range(1, profile["count"] + 1):
+            raster_band = ElementTree.SubElement(
+                dataset, "VRTRasterBand", dataType=data_type, band=str(band)
+            )
+            if profile["nodata"] is not None:
+                ElementTree.SubElement(raster_band, "NoDataValue").text = repr(
+                    profile["nodata"]
+                )
+
+            for src in ordered:
+                region = _align(windows.from_bounds(*src.bounds, profile["transform"]))
+                source = ElementTree.SubElement(raster_band, "ComplexSource")
+                ElementTree.SubElement(
+                    source, "SourceFilename", relativeToVRT="0"
+                ).text = str(Path(src.name).resolve())
+                ElementTree.SubElement(source, "SourceBand").text = str(band)
+                ElementTree.SubElement(
+                    source,
+                    "SrcRect",
+                    xOff="0",
+                    yOff="0",
+                    xSize=str(src.width),
+                    ySize=str(src.height),
+                )
+                ElementTree.SubElement(
+                    source,
+                    "DstRect",
+                    xOff=str(region.col_off),
+                    yOff=str(region.row_off),
+                    xSize=str(region.width),
+                    ySize=str(region.height),
+                )
+                if src.nodata is not None:
+                    ElementTree.SubElement(source, "NODATA").text = repr(src.nodata)
+    finally:
+        for src in sources:
+            src.close()
+
+    ElementTree.ElementTree(dataset).write(output_file)
+    return str(output_file)
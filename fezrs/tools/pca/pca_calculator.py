@@ -2,11 +2,17 @@
 import numpy as np
 from uuid import uuid4
 from pathlib import Path
+from typing import Dict, List
 import matplotlib.pyplot as plt
-from sklearn.decomposition import PCA as skpc
 
 # Import module and files
 from fezrs.base import BaseTool
+from fezrs.tools.pca.pca_engine import (
+    CovarianceAccumulator,
+    band_samples,
+    project_bands,
+)
+from fezrs.utils.cache_handler import file_fingerprint
 from fezrs.utils.type_handler import BandPathType, BandNamePCAType
 from fezrs.utils.histogram_handler import HistogramExportMixin
 
@@ -22,6 +28,10 @@ class PCACalculator(BaseTool, HistogramExportMixin):
         swir1_path: BandPathType,
         swir2_path: BandPathType,
         selectBand: BandNamePCAType | None = None,
+        n_components: int = 6,
+        sample_step: int = 1,
+        block_rows: int = 1024,
+        basis: CovarianceAccumulator | BandPathType | None = None,
     ):
         super().__init__(
             red_path=red_path,
@@ -44,11 +54,19 @@ class PCACalculator(BaseTool, HistogramExportMixin):
         )
 
         self.image_shape = (
-            self.metadata_bands["red"]["width"],
             self.metadata_bands["red"]["height"],
+            self.metadata_bands["red"]["width"],
         )
 
         self.selectBand = selectBand
+        self.n_components = n_components
+        self.sample_step = sample_step
+        self.block_rows = block_rows
+
+        # A basis fitted on other scenes replaces the fit on this one
+        if basis is not None and not isinstance(basis, CovarianceAccumulator):
+            basis = CovarianceAccumulator.load(basis)
+        self.basis = basis
 
         self.bindTheBandsToNumber = {
             "red": 0,
@@ -60,17 +78,121 @@ class PCACalculator(BaseTool, HistogramExportMixin):
         }
 
     def _validate(self):
-        pass
+        bands_count = len(self.bindTheBandsToNumber)
+        if not 1 <= self.n_components <= bands_count:
+            raise ValueError(
+                f"'n_components' must be between 1 and {bands_count}, "
+                f"got {self.n_components}"
+            )
+
+        # Components are indexed by band, only the first n_components exist
+        if (
+            self.selectBand is not None
+            and self.bindTheBandsToNumber[self.selectBand] >= self.n_components
+        ):
+            raise ValueError(
+                f"'selectBand' {self.selectBand} is component "
+                f"{self.bindTheBandsToNumber[self.selectBand] + 1}, but only "
+                f"{self.n_components} components are computed"
+            )
+
+    @property
+    def _bands(self):
+        # Bands in the order of bindTheBandsToNumber, read once from the shared cache
+        return [
+            self.files_handler.bands[band]
+            for band in sorted(
+                self.bindTheBandsToNumber, key=self.bindTheBandsToNumber.get
+            )
+        ]
+
+    @property
+    def scene_key(self) -> str:
+        # Size and modification time make a rewritten scene a new source
+        return "|".join(
+            ":".join(map(str, file_fingerprint(self.files_handler.band_paths[band])))
+            for band in sorted(
+                self.bindTheBandsToNumber, key=self.bindTheBandsToNumber.get
+            )
+        )
+
+    def partial_fit(
+        self, state: CovarianceAccumulator | None = None
+    ) -> CovarianceAccumulator:
+        """
+        Adds the pixels of this scene to a running PCA fit.
+
+        Args:
+            state: The running fit, or None to start a new one.
+
+        Returns:
+            CovarianceAccumulator: The updated fit; this scene is recorded in its sources.
+        """
+        if state is None:
+            state = CovarianceAccumulator(len(self.bindTheBandsToNumber))
+
+        # Pixel-wise PCA: a streaming pass accumulates the band covariance
+        for _, samples in band_samples(self._bands, self.block_rows, self.sample_step):
+            state.update(samples)
+        state.sources.append(self.scene_key)
+        return state
+
+    @classmethod
+    def fit_scenes(
+        cls,
+        scenes: List[Dict[str, BandPathType]],
+        state_path: BandPathType | None = None,
+        sample_step: int = 1,
+        block_rows: int = 1024,
+    ) -> CovarianceAccumulator:
+        """
+        Fits one PCA basis over many scenes, one scene in memory at a time.
+
+        With state_path the fit is saved after every scene and resumed from the
+        saved state, skipping the scenes it already contains.
+
+        Args:
+            scenes: Keyword arguments of the calculator (band paths) for each scene.
+            state_path: Optional .npz checkpoint of the running fit.
+            sample_step: Keep every sample_step-th row and column of each scene.
+            block_rows: Number of image rows per block.
+
+        Returns:
+            CovarianceAccumulator: The fit, usable as the basis of any PCACalculator.
+
+        Raises:
+            ValueError: If scenes is empty.
+        """
+        if not scenes:
+            raise ValueError("At least one scene is required to fit a PCA basis.")
+
+        state = None
+        if state_path is not None and Path(state_path).exists():
+            state = CovarianceAccumulator.load(state_path)
+
+        for scene in scenes:
+            calculator = cls(**scene, sample_step=sample_step, block_rows=block_rows)
+            if state is not None and calculator.scene_key in state.sources:
+                continue
+
+            state = calculator.partial_fit(state)
+            if state_path is not None:
+                state.save(state_path)
+
+        return state
 
     def process(self):
-        image_columns = []
-        image_columns_filtered = self.files_handler.get_images_collection()
-        for i in range(len(image_columns_filtered)):
-            image_columns.append(image_columns_filtered[i].flatten())
-        images = np.array(image_columns)
-        pca = skpc(n_components=6)
-        pca.fit(images)
-        self._output = pca.components_[:6]
+        state = self.basis if self.basis is not None else self.partial_fit()
+
+        variances, components = state.components()
+        self.mean = state.mean
+        self.components = components[: self.n_components]
+        self.explained_variance = variances[: self.n_components]
+
+        # Every block is projected on the principal axes
+        self._output = project_bands(
+            self._bands, self.mean, self.components, self.block_rows
+        )
         return self._output
 
     def _customize_export_file(self, ax):
@@ -131,10 +253,15 @@ class PCACalculator(BaseTool, HistogramExportMixin):
         dpi=1000,
         bbox_inches="tight",
         grid=False,
-        nrows=6,
+        nrows=None,
         ncols=2,
     ):
-        fig, ax = plt.subplots(nrows=nrows, ncols=ncols, figsize=figsize)
+        output_path = Path(output_path)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        # One row per component: its image and its histogram
+        nrows = nrows or len(self._output)
+        fig, ax = plt.subplots(nrows=nrows, ncols=ncols, figsize=figsize, squeeze=False)
         plt.title(title)
         for i, pca_component in enumerate(self._output):
             reshaped_component = pca_component.reshape(self.image_shape)
@@ -169,7 +296,7 @@ class PCACalculator(BaseTool, HistogramExportMixin):
         dpi=500,
         bbox_inches="tight",
         grid=True,
-        nrows=6,
+        nrows=None,
         ncols=2,
     ):
         return super().execute(
@@ -0,0 +1,213 @@
+# Import packages and libraries
+import os
+import tempfile
+import numpy as np
+from typing import Iterator, List, Sequence, Tuple
+
+# Import module and files
+from fezrs.utils.type_handler import BandPathType
+
+
+def band_samples(
+    bands: Sequence[np.ndarray], block_rows: int = 1024, sample_step: int = 1
+) -> Iterator[Tuple[slice, np.ndarray]]:
+    """
+    Iterates over co-registered bands as pixel sample matrices, block by block.
+
+    Args:
+        bands (Sequence[np.ndarray]): 2D bands of the same shape, in any dtype.
+        block_rows (int): Number of image rows per block.
+        sample_step (int): Keep every sample_step-th row and column, 1 for every pixel.
+
+    Yields:
+        Tuple[slice, np.ndarray]: The rows of each block and its (pixels, bands) float64 matrix.
+
+    Raises:
+        ValueError: If the bands differ in shape.
+    """
+    shape = np.shape(bands[0])
+    for band in bands:
+        if np.shape(band) != shape:
+            raise ValueError(f"Expected bands of shape {shape}, got {np.shape(band)}.")
+
+    # Start every block on a sampled row so the sampling grid does not drift
+    block_rows = max(sample_step, block_rows - block_rows % sample_step)
+    for row in range(0, shape[0], block_rows):
+        rows = slice(row, row + block_rows)
+        samples = np.stack(
+            [np.asarray(band[rows][::sample_step, ::sample_step]) for band in bands],
+            axis=-1,
+        ).astype(np.float64)
+        yield rows, samples.reshape(-1, len(bands))
+
+
+class CovarianceAccumulator:
+    """
+    Running band mean and scatter matrix, updated one block of pixels at a time.
+
+    Blocks are merged with the pairwise update of Chan et al., which stays
+    accurate for large pixel counts where a plain sum of squares would lose
+    precision. Memory use is independent of the number of pixels.
+
+    The state can be saved and loaded, so a fit spanning many scenes can be
+    resumed; sources records the scenes already consumed.
+    """
+
+    def __init__(self, bands_count: int):
+        """
+        Initialize an empty accumulator.
+
+        Args:
+            bands_count (int): Number of bands per pixel.
+        """
+        self.count = 0
+        self.mean = np.zeros(bands_count)
+        self.scatter = np.zeros((bands_count, bands_count))
+        self.sources: List[str] = []
+
+    def update(self, samples: np.ndarray) -> "CovarianceAccumulator":
+        """
+        Add a (pixels, bands) matrix of samples.
+
+        Args:
+            samples (np.ndarray): The samples to add.
+
+        Returns:
+            CovarianceAccumulator: The accumulator itself.
+        """
+        samples = np.asarray(samples, dtype=np.float64)
+        if len(samples) == 0:
+            return self
+
+        mean = samples.mean(axis=0)
+        centered = samples - mean
+        return self._combine(len(samples), mean, centered.T @ centered)
+
+    def merge(self, other: "CovarianceAccumulator") -> "CovarianceAccumulator":
+        """
+        Add the samples of another accumulator, e.g. one fitted on another tile.
+
+        Args:
+            other (CovarianceAccumulator): The accumulator to merge.
+
+        Returns:
+            CovarianceAccumulator: The accumulator itself.
+        """
+        self.sources.extend(other.sources)
+        if other.count == 0:
+            return self
+        return self._combine(other.count, other.mean, other.scatter)
+
+    def _combine(
+        self, count: int, mean: np.ndarray, scatter: np.ndarray
+    ) -> "CovarianceAccumulator":
+        total = self.count + count
+        delta = mean - self.mean
+        self.scatter += scatter + np.outer(delta, delta) * (self.count * count / total)
+        self.mean += delta * (count / total)
+        self.count = total
+        return self
+
+    def save(self, path: BandPathType) -> str:
+        """
+        Save the state to a .npz file.
+
+        The state is written next to path and moved over it once complete, so an
+        interrupted save keeps the previous checkpoint intact.
+
+        Args:
+            path (BandPathType): Path of the file to write.
+
+        Returns:
+            str: The path of the written file.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        descriptor, temporary = tempfile.mkstemp(suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                np.savez(
+                    file,
+                    count=self.count,
+                    mean=self.mean,
+                    scatter=self.scatter,
+                    sources=np.array(self.sources, dtype=str),
+                )
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        return str(path)
+
+    @classmethod
+    def load(cls, path: BandPathType) -> "CovarianceAccumulator":
+        """
+        Load a state written by save.
+
+        Args:
+            path (BandPathType): Path of the .npz file.
+
+        Returns:
+            CovarianceAccumulator: The restored accumulator.
+        """
+        with np.load(path) as state:
+            accumulator = cls(len(state["mean"]))
+            accumulator.count = int(state["count"])
+            accumulator.mean = state["mean"].copy()
+            accumulator.scatter = state["scatter"].copy()
+            accumulator.sources = state["sources"].tolist()
+        return accumulator
+
+    @property
+    def covariance(self) -> np.ndarray:
+        """
+        The sample covariance matrix of the bands (normalized by count - 1).
+        """
+        if self.count < 2:
+            raise ValueError("At least two samples are required for a covariance.")
+        return self.scatter / (self.count - 1)
+
+    def components(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute the principal axes of the accumulated samples.
+
+        Each axis is signed so that its largest loading is positive, which makes
+        the result deterministic.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The explained variances in decreasing
+                order and the (components, bands) matrix of principal axes.
+        """
+        variances, axes = np.linalg.eigh(self.covariance)
+        order = np.argsort(variances)[::-1]
+        variances, axes = variances[order], axes[:, order].T
+
+        signs = np.sign(axes[np.arange(len(axes)), np.argmax(np.abs(axes), axis=1)])
+        return variances, axes * signs[:, np.newaxis]
+
+
+def project_bands(
+    bands: Sequence[np.ndarray],
+    mean: np.ndarray,
+    components: np.ndarray,
+    block_rows: int = 1024,
+) -> np.ndarray:
+    """
+    Projects bands onto principal axes block by block.
+
+    Args:
+        bands (Sequence[np.ndarray]): 2D bands of the same shape.
+        mean (np.ndarray): Mean of each band.
+        components (np.ndarray): The (components, bands) principal axes.
+        block_rows (int): Number of image rows per block.
+
+    Returns:
+        np.ndarray: The (components, rows, cols) component images.
+    """
+    height, width = np.shape(bands[0])
+    output = np.empty((len(components), height, width))
+    for rows, samples in band_samples(bands, block_rows):
+        samples -= mean
+        block = samples @ components.T
+        output[:, rows] = block.T.reshape(len(components), -1, width)
+
+    return output
@@ -3,4 +3,5 @@ from .bi_calculator import BICalculator
 from .ndvi_calculator import NDVICalculator
 from .ndwi_calculator import NDWICalculator
 from .savi_calculator import SAVICalculator
+from .spectral_indices_calculator import SpectralIndicesCalculator
 from .ui_calculator import UICalculator
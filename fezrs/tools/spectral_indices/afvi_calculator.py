@@ -8,6 +8,9 @@ from fezrs.utils.type_handler import BandPathType
 
 # Calculator class
 class AFVICalculator(BaseTool):
+    _block_bands = ("nir", "swir1")
+    _block_normalized = True
+
     def __init__(self, nir_path: BandPathType, swir1_path: BandPathType):
         super().__init__(nir_path=nir_path, swir1_path=swir1_path)
         self.normalized_bands = self.files_handler.get_normalized_bands(
@@ -17,10 +20,13 @@ class AFVICalculator(BaseTool):
     def _validate(self):
         pass
 
-    def process(self):
-        nir, swir1 = (self.normalized_bands[band] for band in ("nir", "swir1"))
+    def _process_block(self, bands):
+        nir, swir1 = (bands[band] for band in ("nir", "swir1"))
 
-        self._output = (nir - 0.66) * (swir1 / (nir + (0.66 * swir1)))
+        return (nir - 0.66) * (swir1 / (nir + (0.66 * swir1)))
+
+    def process(self):
+        self._output = self._process_block(self.normalized_bands)
         return self._output
 
     def execute(
@@ -8,6 +8,9 @@ from fezrs.utils.type_handler import BandPathType
 
 # Calculator class
 class BICalculator(BaseTool):
+    _block_bands = ("nir", "red", "green")
+    _block_normalized = True
+
     def __init__(
         self,
         nir_path: BandPathType,
@@ -22,12 +25,13 @@ class BICalculator(BaseTool):
     def _validate(self):
         pass
 
-    def process(self):
-        nir, red, green = (
-            self.normalized_bands[band] for band in ("nir", "red", "green")
-        )
+    def _process_block(self, bands):
+        nir, red, green = (bands[band] for band in ("nir", "red", "green"))
 
-        self._output = ((nir - green) - red) / ((nir + green) + red)
+        return ((nir - green) - red) / ((nir + green) + red)
+
+    def process(self):
+        self._output = self._process_block(self.normalized_bands)
         return self._output
 
     def execute(
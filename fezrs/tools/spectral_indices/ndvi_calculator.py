@@ -4,11 +4,16 @@ from matplotlib.pyplot import cm
 
 # Import module and files
 from fezrs.base import BaseTool
+from fezrs.tools.spectral_indices.spectral_engine import normalized_difference
 from fezrs.utils.type_handler import BandPathType
 
 
 # Calculator class
 class NDVICalculator(BaseTool):
+    _block_bands = ("nir", "red")
+    _block_normalized = True
+    _block_intermediates = {"ndvi": (normalized_difference, ("nir", "red"))}
+
     def __init__(
         self,
         nir_path: BandPathType,
@@ -22,10 +27,11 @@ class NDVICalculator(BaseTool):
     def _validate(self):
         pass
 
-    def process(self):
-        nir, red = (self.normalized_bands[band] for band in ("nir", "red"))
+    def _process_block(self, bands):
+        return self._intermediate(bands, "ndvi")
 
-        self._output = (nir - red) / (nir + red)
+    def process(self):
+        self._output = self._process_block(self.normalized_bands)
         return self._output
 
     def execute(
@@ -9,6 +9,9 @@ from fezrs.utils.type_handler import BandPathType
 
 # Calculator class
 class NDWICalculator(BaseTool):
+    _block_bands = ("nir", "green")
+    _block_normalized = True
+
     def __init__(
         self,
         nir_path: BandPathType,
@@ -22,10 +25,13 @@ class NDWICalculator(BaseTool):
     def _validate(self):
         pass
 
-    def process(self):
-        nir, green = (self.normalized_bands[band] for band in ("nir", "green"))
+    def _process_block(self, bands):
+        nir, green = (bands[band] for band in ("nir", "green"))
 
-        self._output = (green - nir) / (nir + green)
+        return (green - nir) / (nir + green)
+
+    def process(self):
+        self._output = self._process_block(self.normalized_bands)
         return self._output
 
     def execute(
@@ -9,6 +9,9 @@ from fezrs.utils.type_handler import BandPathType
 
 # Calculator class
 class SAVICalculator(BaseTool):
+    _block_bands = ("nir", "red")
+    _block_normalized = True
+
     def __init__(
         self,
         nir_path: BandPathType,
@@ -22,10 +25,13 @@ class SAVICalculator(BaseTool):
     def _validate(self):
         pass
 
-    def process(self):
-        nir, red = (self.normalized_bands[band] for band in ("nir", "red"))
+    def _process_block(self, bands):
+        nir, red = (bands[band] for band in ("nir", "red"))
 
-        self._output = ((nir - red) / (nir + red + 0.5)) * 1.5
+        return ((nir - red) / (nir + red + 0.5)) * 1.5
+
+    def process(self):
+        self._output = self._process_block(self.normalized_bands)
         return self._output
 
     def execute(
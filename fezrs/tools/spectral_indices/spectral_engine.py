@@ -0,0 +1,204 @@
+# Import packages and libraries
+import numpy as np
+from typing import Dict, Mapping, Sequence, Tuple, get_args
+
+# Import module and files
+from fezrs.utils.stream_handler import normalize_block
+from fezrs.utils.type_handler import SpectralIndexType
+
+SPECTRAL_INDEX_BANDS: Dict[str, Tuple[str, ...]] = {
+    "ndvi": ("nir", "red"),
+    "ndwi": ("nir", "green"),
+    "savi": ("nir", "red"),
+    "bi": ("nir", "red", "green"),
+    "ui": ("nir", "swir2"),
+    "afvi": ("nir", "swir1"),
+}
+"""Normalized bands required by each spectral index."""
+
+
+def normalized_difference(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Computes the normalized difference (a - b) / (a + b) of two bands, e.g. NDVI or NBR.
+
+    Args:
+        a (np.ndarray): The first band.
+        b (np.ndarray): The second band.
+
+    Returns:
+        np.ndarray: The normalized difference.
+    """
+    return (a - b) / (a + b)
+
+
+# Each formula writes into out and may use tmp as scratch, following the
+# operation order of the matching calculator so results are bit-identical.
+def _ndvi(bands, out, tmp):
+    nir, red = bands["nir"], bands["red"]
+    np.subtract(nir, red, out=out)
+    np.add(nir, red, out=tmp)
+    return np.divide(out, tmp, out=out)
+
+
+def _ndwi(bands, out, tmp):
+    nir, green = bands["nir"], bands["green"]
+    np.subtract(green, nir, out=out)
+    np.add(nir, green, out=tmp)
+    return np.divide(out, tmp, out=out)
+
+
+def _savi(bands, out, tmp):
+    nir, red = bands["nir"], bands["red"]
+    np.subtract(nir, red, out=out)
+    np.add(nir, red, out=tmp)
+    np.add(tmp, 0.5, out=tmp)
+    np.divide(out, tmp, out=out)
+    return np.multiply(out, 1.5, out=out)
+
+
+def _bi(bands, out, tmp):
+    nir, red, green = bands["nir"], bands["red"], bands["green"]
+    np.subtract(nir, green, out=out)
+    np.subtract(out, red, out=out)
+    np.add(nir, green, out=tmp)
+    np.add(tmp, red, out=tmp)
+    return np.divide(out, tmp, out=out)
+
+
+def _ui(bands, out, tmp):
+    nir, swir2 = bands["nir"], bands["swir2"]
+    np.subtract(swir2, nir, out=out)
+    np.add(nir, swir2, out=tmp)
+    return np.divide(out, tmp, out=out)
+
+
+def _afvi(bands, out, tmp):
+    nir, swir1 = bands["nir"], bands["swir1"]
+    np.multiply(swir1, 0.66, out=tmp)
+    np.add(nir, tmp, out=tmp)
+    np.divide(swir1, tmp, out=tmp)
+    np.subtract(nir, 0.66, out=out)
+    return np.multiply(out, tmp, out=out)
+
+
+_FORMULAS = {
+    "ndvi": _ndvi,
+    "ndwi": _ndwi,
+    "savi": _savi,
+    "bi": _bi,
+    "ui": _ui,
+    "afvi": _afvi,
+}
+
+
+def index_bands(indices: Sequence[SpectralIndexType]) -> Tuple[str, ...]:
+    """
+    Lists the bands needed to compute a set of spectral indices.
+
+    Args:
+        indices (Sequence[SpectralIndexType]): The requested indices.
+
+    Returns:
+        Tuple[str, ...]: Every required band once, in order of first use.
+
+    Raises:
+        ValueError: If an index is not supported.
+    """
+    bands = []
+    for index in indices:
+        if index not in SPECTRAL_INDEX_BANDS:
+            raise ValueError(
+                f"Unsupported spectral index '{index}', "
+                f"expected one of {get_args(SpectralIndexType)}"
+            )
+        bands.extend(b for b in SPECTRAL_INDEX_BANDS[index] if b not in bands)
+
+    return tuple(bands)
+
+
+def evaluate_indices(
+    bands: Mapping[str, np.ndarray],
+    indices: Sequence[SpectralIndexType],
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Evaluates several spectral indices over the same normalized bands.
+
+    Each index is written in place into its slice of the output, reusing a
+    single scratch buffer, so no full-size temporaries are allocated per index.
+
+    Args:
+        bands (Mapping[str, np.ndarray]): Normalized bands (or blocks) by name.
+        indices (Sequence[SpectralIndexType]): The indices to compute.
+        out (np.ndarray | None): Optional (rows, cols, len(indices)) output buffer.
+
+    Returns:
+        np.ndarray: The indices stacked along the last axis.
+
+    Raises:
+        ValueError: If an index is not supported.
+    """
+    required = index_bands(indices)
+    dtype = np.result_type(*(bands[band] for band in required))
+    shape = np.shape(bands[required[0]])
+
+    if out is None:
+        out = np.empty(shape + (len(indices),), dtype=dtype)
+
+    result = np.empty(shape, dtype=dtype)
+    tmp = np.empty(shape, dtype=dtype)
+    for position, index in enumerate(indices):
+        _FORMULAS[index](bands, result, tmp)
+        out[..., position] = result
+
+    return out
+
+
+def spectral_indices(
+    bands: Mapping[str, np.ndarray],
+    statistics: Mapping[str, Tuple[float, float]],
+    indices: Sequence[SpectralIndexType],
+    block_rows: int = 1024,
+) -> np.ndarray:
+    """
+    Computes a stack of spectral indices in one blocked pass over raw bands.
+
+    Every band is read once per block and normalized once with its whole-image
+    statistics, then shared by all indices. Memory beyond the output stack is
+    bounded by a few blocks, so memory-mapped bands are never fully decoded.
+
+    Args:
+        bands (Mapping[str, np.ndarray]): Raw bands by name, in their native dtype.
+        statistics (Mapping[str, Tuple[float, float]]): Minimum and maximum of each band.
+        indices (Sequence[SpectralIndexType]): The indices to compute.
+        block_rows (int): Number of rows processed per block.
+
+    Returns:
+        np.ndarray: A (rows, cols, len(indices)) stack, matching the output of
+            the individual index calculators.
+
+    Raises:
+        ValueError: If an index is not supported or the bands differ in shape.
+    """
+    required = index_bands(indices)
+    shape = np.shape(bands[required[0]])
+    for band in required:
+        if np.shape(bands[band]) != shape:
+            raise ValueError(
+                f"Band '{band}' has shape {np.shape(bands[band])}, expected {shape}."
+            )
+
+    out = None
+    for row in range(0, shape[0], block_rows):
+        rows = slice(row, row + block_rows)
+        blocks = {
+            band: normalize_block(bands[band][rows], statistics[band])
+            for band in required
+        }
+        if out is None:
+            dtype = np.result_type(*blocks.values())
+            out = np.empty(shape + (len(indices),), dtype=dtype)
+
+        evaluate_indices(blocks, indices, out=out[rows])
+
+    return out
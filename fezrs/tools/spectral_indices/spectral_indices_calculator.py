@@ -0,0 +1,152 @@
+# Import packages and libraries
+from pathlib import Path
+from typing import List
+
+# Import module and files
+from fezrs.base import BaseTool
+from fezrs.tools.spectral_indices.spectral_engine import (
+    SPECTRAL_INDEX_BANDS,
+    evaluate_indices,
+    index_bands,
+    spectral_indices,
+)
+from fezrs.utils.type_handler import BandPathType, SpectralIndexType
+
+
+# Calculator class
+class SpectralIndicesCalculator(BaseTool):
+    _block_normalized = True
+
+    def __init__(
+        self,
+        nir_path: BandPathType,
+        red_path: BandPathType | None = None,
+        green_path: BandPathType | None = None,
+        swir1_path: BandPathType | None = None,
+        swir2_path: BandPathType | None = None,
+        indices: List[SpectralIndexType] | None = None,
+        block_rows: int = 1024,
+    ):
+        super().__init__(
+            nir_path=nir_path,
+            red_path=red_path,
+            green_path=green_path,
+            swir1_path=swir1_path,
+            swir2_path=swir2_path,
+        )
+
+        # Without an explicit list, compute every index the given bands allow
+        if indices is None:
+            indices = [
+                index
+                for index, bands in SPECTRAL_INDEX_BANDS.items()
+                if all(self.files_handler.band_paths[band] for band in bands)
+            ]
+
+        self.indices = list(indices)
+        self.block_rows = block_rows
+        self.feature_names = [index.upper() for index in self.indices]
+
+    @property
+    def _block_bands(self):
+        return index_bands(self.indices)
+
+    def _validate(self):
+        if not self.indices:
+            raise ValueError("At least one spectral index is required.")
+
+        missing = [
+            band
+            for band in self._block_bands
+            if self.files_handler.band_paths[band] is None
+        ]
+        if missing:
+            raise ValueError(f"Bands {missing} are required to compute {self.indices}.")
+
+    def _process_block(self, bands):
+        return evaluate_indices(bands, self.indices)
+
+    def process(self):
+        self._validate()
+
+        # Decode every band once; statistics then come from the cached arrays
+        bands = {band: self.files_handler.bands[band] for band in self._block_bands}
+        statistics = {
+            band: self.files_handler.get_band_statistics(band) for band in bands
+        }
+
+        self._output = spectral_indices(
+            bands, statistics, self.indices, block_rows=self.block_rows
+        )
+        return self._output
+
+    def _export_file(
+        self,
+        output_path,
+        title=None,
+        figsize=(15, 10),
+        show_axis=False,
+        colormap="gray",
+        show_colorbar=True,
+        filename_prefix="Tool_output",
+        dpi=500,
+        bbox_inches="tight",
+        grid=False,
+        nrows=None,
+        ncols=None,
+    ):
+        return self._export_stack(
+            output_path,
+            self.feature_names,
+            title,
+            figsize,
+            show_axis,
+            colormap,
+            show_colorbar,
+            dpi,
+            bbox_inches,
+            grid,
+            nrows,
+            ncols,
+        )
+
+    def execute(
+        self,
+        output_path,
+        title=None,
+        figsize=(15, 10),
+        show_axis=False,
+        colormap="gray",
+        show_colorbar=True,
+        filename_prefix="Tool_output",
+        dpi=500,
+        bbox_inches="tight",
+        grid=False,
+        nrows=None,
+        ncols=None,
+    ):
+        return super().execute(
+            output_path,
+            title,
+            figsize,
+            show_axis,
+            colormap,
+            show_colorbar,
+            filename_prefix,
+            dpi,
+            bbox_inches,
+            grid,
+            nrows,
+            ncols,
+        )
+
+
+# NOTE - These block code for test the tools, delete before publish product
+if __name__ == "__main__":
+    nir_path = Path.cwd() / "data/NIR.tif"
+    red_path = Path.cwd() / "data/Red.tif"
+    green_path = Path.cwd() / "data/Green.tif"
+
+    calculator = SpectralIndicesCalculator(
+        nir_path=nir_path, red_path=red_path, green_path=green_path
+    ).execute(output_path="./", title="Spectral indices output")
@@ -9,6 +9,9 @@ from fezrs.utils.type_handler import BandPathType
 
 # Calculator class
 class UICalculator(BaseTool):
+    _block_bands = ("nir", "swir2")
+    _block_normalized = True
+
     def __init__(
         self,
         nir_path: BandPathType,
@@ -22,10 +25,13 @@ class UICalculator(BaseTool):
     def _validate(self):
         pass
 
-    def process(self):
-        nir, swir2 = (self.normalized_bands[band] for band in ("nir", "swir2"))
+    def _process_block(self, bands):
+        nir, swir2 = (bands[band] for band in ("nir", "swir2"))
 
-        self._output = (swir2 - nir) / (nir + swir2)
+        return (swir2 - nir) / (nir + swir2)
+
+    def process(self):
+        self._output = self._process_block(self.normalized_bands)
         return self._output
 
     def execute(
@@ -51,7 +51,9 @@ class SpectralProfileCalculator(BaseTool, HistogramExportMixin):
         if len(image_columns_filtered) > 4 and isinstance(
             image_columns_filtered[4], np.ndarray
         ):
-            self._output = exposure.adjust_log(image_columns_filtered[4])
+            self._output = exposure.adjust_log(
+                image_columns_filtered[4].astype(float)
+            )
         else:
             raise ValueError("Invalid image data at index 4.")
 
@@ -1,13 +1,13 @@
-import cv2
 import itertools
 import numpy as np
-import pandas as pd
 
-from skimage import io
 from sklearn import svm
 from pathlib import Path
 
 from fezrs.base import BaseTool
+from fezrs.utils.model_handler import load_model, save_model
+from fezrs.utils.predict_handler import open_labels, predict_chunked
+from fezrs.utils.sample_handler import read_training_samples
 from fezrs.utils.type_handler import BandPathType
 
 
@@ -22,6 +22,12 @@ class SVMCalculator(BaseTool):
         swir2_path: BandPathType,
         class_number: int = 4,
         sample_number: int = 10,
+        training_path: BandPathType | None = None,
+        label_field: str = "class",
+        chunk_size: int = 1_000_000,
+        workers: int | None = 1,
+        labels_path: BandPathType | None = None,
+        model_path: BandPathType | None = None,
     ):
         super().__init__(
             red_path=red_path,
@@ -36,15 +42,57 @@ class SVMCalculator(BaseTool):
         )
 
         self.metadata_shape = self.files_handler.get_metadata_bands(["blue"])
-        self.collection_bands = self.files_handler.get_images_collection()
         self.index_loop = 0
 
         self.is_finished_click_event = False
 
         self.class_number = class_number
         self.sample_number = sample_number
+        self.training_path = training_path
+        self.label_field = label_field
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.labels_path = labels_path
+        self.model_path = model_path
+
+    @property
+    def _cacheable(self) -> bool:
+        # Samples picked with the mouse are not part of the result cache key
+        return self.training_path is not None or self.model_path is not None
+
+    @property
+    def collection_bands(self):
+        return self.files_handler.get_images_collection()
+
+    @property
+    def feature_bands(self) -> list:
+        """
+        Names of the bands in collection_bands order, i.e. the classifier's features.
+        """
+        return [
+            key
+            for key, value in self.files_handler.band_paths.items()
+            if value is not None
+        ]
 
     def _validate(self) -> None:
+        if not isinstance(self.chunk_size, int) or self.chunk_size < 1:
+            raise ValueError("chunk_size must be a positive int.")
+        if self.workers is not None and (
+            not isinstance(self.workers, int) or self.workers < 1
+        ):
+            raise ValueError("workers must be a positive int or None.")
+
+        # A saved model or headless training only need an existing file
+        if self.model_path is not None:
+            if not Path(self.model_path).exists():
+                raise FileNotFoundError(f"File {self.model_path} not found")
+            return
+        if self.training_path is not None:
+            if not Path(self.training_path).exists():
+                raise FileNotFoundError(f"File {self.training_path} not found")
+            return
+
         # 1) class_number: must be an int ≥ 2 (at least binary classification)
         if not isinstance(self.class_number, int):
             raise ValueError("class_number must be an int.")
@@ -83,24 +131,109 @@ class SVMCalculator(BaseTool):
                 f"Warning: selecting {requested_samples} pixels manually may be impractical."
             )
 
+    def _predict(self, clf) -> np.ndarray:
+        """
+        Classifies every pixel, a chunk of about chunk_size pixels at a time.
+
+        Chunks are spread over workers processes and written into a label image
+        allocated up front, memory-mapped to labels_path when it is set, so only
+        a few chunks of features and kernel evaluations are held in memory.
+
+        Args:
+            clf: The fitted classifier.
+
+        Returns:
+            np.ndarray: The (rows, cols) label image.
+        """
+        bands = self.collection_bands
+        labels = open_labels(bands[0].shape, clf.classes_.dtype, self.labels_path)
+        return predict_chunked(clf, bands, self.chunk_size, self.workers, labels)
+
+    def _process_headless(self):
+        """
+        Trains from the sample file and classifies the image without any window.
+
+        Returns:
+            np.ndarray: The (rows, cols) label image.
+        """
+        bands = self.collection_bands
+        header = self.files_handler.get_profile("blue")
+        rows, cols, labels = read_training_samples(
+            self.training_path,
+            bands[0].shape,
+            header.get("transform"),
+            self.label_field,
+        )
+
+        features = np.stack([band[rows, cols] for band in bands], axis=-1)
+        self.classifier = svm.SVC(gamma="scale")
+        self.classifier.fit(features, labels)
+
+        self._output = self._predict(self.classifier)
+        return self._output
+
+    def _process_pretrained(self):
+        """
+        Classifies the image with the model saved at model_path, without training.
+
+        Returns:
+            np.ndarray: The (rows, cols) label image.
+        """
+        self.classifier, _ = load_model(
+            self.model_path, self.__class__.__name__, self.feature_bands
+        )
+        self._output = self._predict(self.classifier)
+        return self._output
+
+    def save_model(self, path: BandPathType) -> str:
+        """
+        Saves the fitted classifier with its band layout, for reuse through model_path.
+
+        If the output was loaded from the result cache, the classifier is fitted
+        again first, since the cache only stores outputs.
+
+        Args:
+            path (BandPathType): Path of the file to write, conventionally .joblib.
+
+        Returns:
+            str: The path of the written file.
+
+        Raises:
+            ValueError: If no classifier was fitted yet.
+        """
+        if getattr(self, "classifier", None) is None and self._output is not None:
+            self.process()
+        if getattr(self, "classifier", None) is None:
+            raise ValueError("No fitted classifier, call process() first.")
+
+        return save_model(
+            path,
+            self.classifier,
+            tool=self.__class__.__name__,
+            bands=self.feature_bands,
+            dtypes=[str(band.dtype) for band in self.collection_bands],
+            classes=self.classifier.classes_.tolist(),
+        )
+
     def process(self):
 
         self._validate()
 
+        if self.model_path is not None:
+            return self._process_pretrained()
+        if self.training_path is not None:
+            return self._process_headless()
+
+        # OpenCV and pandas are only needed to pick the samples interactively
+        import cv2
+        import pandas as pd
+
         red_normalized = self.normalized_bands["red"]
         green_normalized = self.normalized_bands["green"]
         blue_normalized = self.normalized_bands["blue"]
 
-        width = self.metadata_shape["blue"]["width"]
-        height = self.metadata_shape["blue"]["height"]
-
         rgb = np.stack([red_normalized, green_normalized, blue_normalized], axis=2)
 
-        all_images = io.concatenate_images(self.collection_bands).transpose()
-        all_image_reshape = all_images.reshape(
-            (height * width, len(self.collection_bands))
-        )
-
         class_num = self.class_number
         sample_num = self.sample_number
 
@@ -116,7 +249,7 @@ class SVMCalculator(BaseTool):
                 if self.index_loop < class_num * sample_num:
                     mylist = []
                     for j in self.collection_bands:
-                        mylist.append(j[x][y])
+                        mylist.append(j[y][x])
                     classes_df.iloc[self.index_loop, 0 : len(self.collection_bands)] = (
                         mylist
                     )
@@ -130,9 +263,8 @@ class SVMCalculator(BaseTool):
 
                     clf = svm.SVC(gamma="scale")
                     clf.fit(X, Y)
-                    pred = clf.predict(all_image_reshape)
-                    svm_output = pred.reshape((height, width)).transpose()
-                    self._output = svm_output
+                    self.classifier = clf
+                    self._output = self._predict(clf)
                     return self._output
 
         cv2.namedWindow("mouseClick", cv2.WINDOW_NORMAL)
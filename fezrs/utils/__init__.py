@@ -1,3 +1,9 @@
 from .file_handler import *
 from .type_handler import *
 from .histogram_handler import *
+from .stream_handler import *
+from .raster_handler import *
+from .sample_handler import *
+from .predict_handler import *
+from .model_handler import *
+from .cache_handler import *
@@ -0,0 +1,232 @@
+# Import packages and libraries
+import os
+import sys
+import json
+import hashlib
+import tempfile
+import numpy as np
+from pathlib import Path
+from functools import lru_cache
+from importlib import metadata
+from typing import Any, Optional
+
+from fezrs.utils.file_handler import LazyMapping
+from fezrs.utils.type_handler import BandPathType
+
+CACHE_FORMAT = 1
+"""Version of the cache keys and files, bumped on incompatible changes."""
+
+
+@lru_cache(maxsize=None)
+def _package_version() -> str:
+    try:
+        return metadata.version("fezrs")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+@lru_cache(maxsize=None)
+def _module_digest(module: str) -> Optional[str]:
+    # Source of the tool's module, so editing a tool invalidates its outputs
+    path = getattr(sys.modules.get(module), "__file__", None)
+    if path is None or not os.path.isfile(path):
+        return None
+    with open(path, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def file_fingerprint(path: BandPathType, hash_contents: bool = False) -> list:
+    """
+    Identifies the content of an input file.
+
+    Args:
+        path (BandPathType): The file.
+        hash_contents (bool): Hash the whole file instead of trusting its size and
+            modification time, which is slower but survives copies and touches.
+
+    Returns:
+        list: The absolute path with the size and modification time, or the SHA-256 of the contents.
+    """
+    path = os.path.abspath(path)
+    if not hash_contents:
+        stat = os.stat(path)
+        return [path, stat.st_size, stat.st_mtime_ns]
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(2**20), b""):
+            digest.update(chunk)
+    return [digest.hexdigest()]
+
+
+class ResultCache:
+    """
+    Persistent cache of tool outputs, keyed by the content of their inputs.
+
+    A key covers the package version, the tool class and the source of its
+    module, a fingerprint of every input file and the tool's public attributes,
+    i.e. its parameters. A tool with a parameter that can not be fingerprinted
+    is not cached. Outputs are stored as
+    compressed .npz files and evicted least recently used first once the
+    directory grows beyond max_bytes. Writes are atomic, so a cache directory
+    can be shared by several processes and survives interrupted runs.
+    """
+
+    def __init__(
+        self,
+        directory: BandPathType,
+        max_bytes: int = 2**30,
+        hash_inputs: bool = False,
+        compress: bool = True,
+    ):
+        """
+        Initialize a cache stored in directory, creating it if needed.
+
+        Args:
+            directory (BandPathType): Folder of the cached outputs.
+            max_bytes (int): Total size of the cached files kept after each store.
+            hash_inputs (bool): Fingerprint inputs by content instead of size and
+                modification time, see file_fingerprint.
+            compress (bool): Compress the stored outputs.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hash_inputs = hash_inputs
+        self.compress = compress
+        self.hits = 0
+        self.misses = 0
+
+    def _plain(self, value: Any) -> Any:
+        # Parameters that can be written to JSON; existing files are fingerprinted
+        if value is None or isinstance(value, (bool, int, float, str)):
+            if isinstance(value, str) and os.path.isfile(value):
+                return file_fingerprint(value, self.hash_inputs)
+            return value
+        # Band data served by a FileHandler is covered by the input fingerprints
+        if isinstance(value, LazyMapping):
+            return None
+        if isinstance(value, np.generic):
+            return self._plain(value.item())
+        if isinstance(value, Path):
+            return self._plain(str(value))
+        if isinstance(value, (list, tuple)):
+            return [self._plain(item) for item in value]
+        if isinstance(value, dict):
+            return {str(key): self._plain(item) for key, item in value.items()}
+        raise TypeError(type(value).__name__)
+
+    def key(self, tool) -> Optional[str]:
+        """
+        Compute the cache key of a tool before it is processed.
+
+        Args:
+            tool (BaseTool): The configured tool.
+
+        Returns:
+            Optional[str]: The hexadecimal key, or None if a parameter of the tool
+                can not be fingerprinted and its output must not be cached.
+        """
+        handler = tool.files_handler
+        inputs = {
+            band: file_fingerprint(path, self.hash_inputs)
+            for band, path in handler.band_paths.items()
+            if path is not None
+        }
+        inputs["tif_paths"] = [
+            file_fingerprint(path, self.hash_inputs) for path in handler.tif_paths or []
+        ]
+
+        params = {}
+        for name, value in sorted(vars(tool).items()):
+            if name.startswith("_") or name in (
+                "files_handler",
+                "output_file",
+                "result_cache",
+            ):
+                continue
+            try:
+                params[name] = self._plain(value)
+            except TypeError:
+                return None
+
+        module = type(tool).__module__
+        description = {
+            "format": CACHE_FORMAT,
+            "version": _package_version(),
+            "tool": f"{module}.{type(tool).__qualname__}",
+            "source": _module_digest(module),
+            "memmap": handler.memmap,
+            "inputs": inputs,
+            "params": params,
+        }
+        encoded = json.dumps(description, sort_keys=True).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.npz"
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """
+        Load a cached output and mark it as recently used.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[np.ndarray]: The output, or None if it is not cached.
+        """
+        path = self._path(key)
+        try:
+            with np.load(path) as stored:
+                output = stored["output"]
+            os.utime(path)
+        except (FileNotFoundError, OSError, ValueError, KeyError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return output
+
+    def put(self, key: str, output: np.ndarray) -> None:
+        """
+        Store an output, then evict the least recently used outputs beyond max_bytes.
+
+        Args:
+            key (str): The cache key.
+            output (np.ndarray): The output to store.
+        """
+        descriptor, temporary = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                save = np.savez_compressed if self.compress else np.savez
+                save(file, output=np.asarray(output))
+            os.replace(temporary, self._path(key))
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self.directory.glob("*.npz"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        """
+        Remove every cached output.
+        """
+        for path in self.directory.glob("*.npz"):
+            path.unlink(missing_ok=True)
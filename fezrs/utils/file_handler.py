@@ -1,10 +1,17 @@
 import os
+import copy
+import hashlib
+import tempfile
+import warnings
+import tifffile
 import numpy as np
-from skimage import io
+from pathlib import Path
 import rasterio as rio
-import matplotlib.pyplot as plt
-from typing import Optional, Dict, List
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Callable, Optional, Dict, List
 
+from fezrs.utils.stream_handler import _open_raster, band_statistics
 from fezrs.utils.type_handler import BandPathType, BandNameType, BandTypes
 
 
@@ -16,7 +23,7 @@ def _load_image(path: Optional[BandPathType]) -> Optional[np.ndarray]:
         path (Optional[str]): The file path to the image. If None, the function returns None.
 
     Returns:
-        Optional[np.ndarray]: The loaded image as a NumPy array with float type, or None if the path is None.
+        Optional[np.ndarray]: The loaded image as a NumPy array in its native dtype, or None if the path is None.
 
     Raises:
         FileNotFoundError: If the specified file path does not exist.
@@ -24,13 +31,191 @@ def _load_image(path: Optional[BandPathType]) -> Optional[np.ndarray]:
     # TODO - Add a check for file type, files must be in (*.tiff | *.tif) format
 
     if path and os.path.exists(path):
-        return io.imread(path).astype(float)
+        # Virtual rasters are composed by GDAL, scikit-image can not read them
+        if Path(path).suffix.lower() == ".vrt":
+            with _open_raster(path) as src:
+                image = src.read()
+            return image[0] if len(image) == 1 else np.moveaxis(image, 0, -1)
+        # scikit-image is heavy to import, load it with the first decoded file
+        from skimage import io
+
+        return io.imread(path)
     elif path is None:
         return None
     else:
         raise FileNotFoundError(f"File {path} not found")
 
 
+_BLOCK_ROWS = 1024
+"""Number of rows processed at a time by the memory-mapped helpers."""
+
+
+def _memmap_sidecar_path(
+    path: BandPathType, memmap_dir: BandPathType, suffix: str = ""
+) -> Path:
+    """
+    Builds the path of the .npy sidecar caching a band file.
+
+    The name is derived from the absolute path, size and modification time of
+    the source, so an edited source never reuses a stale sidecar.
+
+    Args:
+        path (BandPathType): The file path to the source image.
+        memmap_dir (BandPathType): Directory holding the sidecar files.
+        suffix (str): Extra tag appended to the name, e.g. "_normalized".
+
+    Returns:
+        Path: The sidecar file path.
+    """
+    stat = os.stat(path)
+    key = f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}"
+    digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+    return Path(memmap_dir) / f"{Path(path).stem}_{digest}{suffix}.npy"
+
+
+def _write_sidecar(
+    sidecar: Path, dtype: Any, shape: tuple, fill: Callable[[np.ndarray], None]
+) -> None:
+    """
+    Writes a .npy sidecar through a uniquely named staging file.
+
+    The staging file is moved over the sidecar once complete, so concurrent
+    processes never read a partial sidecar, and removed if filling fails.
+
+    Args:
+        sidecar (Path): The sidecar file path.
+        dtype (Any): Data type of the array.
+        shape (tuple): Shape of the array.
+        fill (Callable[[np.ndarray], None]): Writes the data into the memory-mapped array.
+    """
+    sidecar.parent.mkdir(parents=True, exist_ok=True)
+    descriptor, partial = tempfile.mkstemp(suffix=".npy", dir=sidecar.parent)
+    os.close(descriptor)
+    try:
+        out = np.lib.format.open_memmap(partial, mode="w+", dtype=dtype, shape=shape)
+        try:
+            fill(out)
+            out.flush()
+        finally:
+            del out
+        os.replace(partial, sidecar)
+    except BaseException:
+        os.unlink(partial)
+        raise
+
+
+def clear_memmap_dir(memmap_dir: Optional[BandPathType] = None) -> int:
+    """
+    Removes the .npy sidecars written by the memory-mapped band backend.
+
+    Sidecars are kept across runs and never evicted, so the directory grows
+    with every compressed band and every normalized band served memory-mapped;
+    a normalized float64 sidecar is four times the size of a uint16 band.
+    Call this once the outputs are written, while no handler maps the files.
+
+    Args:
+        memmap_dir (Optional[BandPathType]): Directory of the sidecars. Defaults
+            to the "fezrs" folder in the system temporary directory.
+
+    Returns:
+        int: The number of bytes freed.
+    """
+    memmap_dir = Path(memmap_dir or Path(tempfile.gettempdir()) / "fezrs")
+    freed = 0
+    for path in memmap_dir.glob("*.npy"):
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except FileNotFoundError:
+            continue
+        freed += size
+    return freed
+
+
+def _memmap_image(path: BandPathType, memmap_dir: BandPathType) -> np.memmap:
+    """
+    Opens an image as a read-only memory map in its native dtype.
+
+    Uncompressed TIFF files are mapped in place. Any other file is decoded once,
+    window by window through rasterio, into a .npy sidecar in memmap_dir which
+    is then mapped and reused by later calls.
+
+    Args:
+        path (BandPathType): The file path to the image.
+        memmap_dir (BandPathType): Directory holding the .npy sidecar files.
+
+    Returns:
+        np.memmap: The memory-mapped image, shaped like skimage.io.imread output.
+    """
+    try:
+        return tifffile.memmap(path, mode="r")
+    except (ValueError, tifffile.TiffFileError):
+        pass
+
+    sidecar = _memmap_sidecar_path(path, memmap_dir)
+    if not sidecar.exists():
+        header = _header_image(path)
+        shape = (header["height"], header["width"])
+        if header["count"] > 1:
+            shape += (header["count"],)
+
+        def fill(out):
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", rio.errors.NotGeoreferencedWarning)
+                with rio.open(path) as src:
+                    for row in range(0, src.height, _BLOCK_ROWS):
+                        window = rio.windows.Window(
+                            0, row, src.width, min(_BLOCK_ROWS, src.height - row)
+                        )
+                        block = src.read(window=window)
+                        if header["count"] > 1:
+                            out[row : row + window.height] = np.moveaxis(block, 0, -1)
+                        else:
+                            out[row : row + window.height] = block[0]
+
+        _write_sidecar(sidecar, header["dtype"], shape, fill)
+
+    return np.load(sidecar, mmap_mode="r")
+
+
+def _normalize_memmap(
+    image: np.ndarray, path: BandPathType, memmap_dir: BandPathType
+) -> np.memmap:
+    """
+    Normalizes a memory-mapped image into a float64 .npy sidecar, block by block.
+
+    Produces the same values as _normalize while only holding _BLOCK_ROWS rows
+    of the image in memory at a time.
+
+    Args:
+        image (np.ndarray): The (memory-mapped) image to normalize.
+        path (BandPathType): The file path the image was read from.
+        memmap_dir (BandPathType): Directory holding the .npy sidecar files.
+
+    Returns:
+        np.memmap: The memory-mapped normalized image.
+    """
+    sidecar = _memmap_sidecar_path(path, memmap_dir, suffix="_normalized")
+    if not sidecar.exists():
+        minimum = min(
+            np.min(image[row : row + _BLOCK_ROWS])
+            for row in range(0, image.shape[0], _BLOCK_ROWS)
+        )
+        maximum = max(
+            np.max(image[row : row + _BLOCK_ROWS])
+            for row in range(0, image.shape[0], _BLOCK_ROWS)
+        )
+
+        def fill(out):
+            for row in range(0, image.shape[0], _BLOCK_ROWS):
+                block = image[row : row + _BLOCK_ROWS]
+                out[row : row + _BLOCK_ROWS] = (block - minimum) / (maximum - minimum)
+
+        _write_sidecar(sidecar, np.float64, image.shape, fill)
+
+    return np.load(sidecar, mmap_mode="r")
+
+
 def _normalize(image: Optional[np.ndarray]) -> Optional[np.ndarray]:
     """
     Normalize a given image array to the range [0, 1].
@@ -55,32 +240,187 @@ def _normalize(image: Optional[np.ndarray]) -> Optional[np.ndarray]:
     return (image - np.min(image)) / (np.max(image) - np.min(image))
 
 
-def _metadata_image(path: str) -> Dict[str, np.ndarray]:
+class LazyMapping(Mapping):
+    """
+    Read-only mapping whose values are computed on first access and then kept.
+
+    Iterating over the keys or checking membership never triggers a load.
+
+    Attributes:
+        loaders (Dict[str, Callable[[], Any]]):
+            A dictionary mapping each key to the function that produces its value.
+    """
+
+    def __init__(self, loaders: Dict[str, Callable[[], Any]]):
+        """
+        Initialize the LazyMapping with one loader per key.
+
+        Args:
+            loaders (Dict[str, Callable[[], Any]]): Functions producing the values.
+        """
+        self.loaders = loaders
+        self._values: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._values:
+            self._values[key] = self.loaders[key]()
+        return self._values[key]
+
+    def __iter__(self):
+        return iter(self.loaders)
+
+    def __len__(self) -> int:
+        return len(self.loaders)
+
+    def reset(self) -> None:
+        """
+        Drop every cached value so the next access runs the loaders again.
+        """
+        self._values.clear()
+
+    def release(self, key: str) -> None:
+        """
+        Drop the cached value of a key so its memory can be freed.
+
+        Args:
+            key (str): The key to release.
+        """
+        self._values.pop(key, None)
+
+    def is_loaded(self, key: str) -> bool:
+        """
+        Check whether the value of a key has already been computed.
+
+        Args:
+            key (str): The key to check.
+
+        Returns:
+            bool: True if the value is cached, False otherwise.
+        """
+        return key in self._values
+
+
+class BandCache:
+    """
+    Least recently used cache of decoded bands, bounded in bytes.
+
+    Set as FileHandler.band_cache, it is shared by every handler of the process,
+    so tools run on the same scene decode each band file once. Cached bands are
+    read-only since several tools share them.
+    """
+
+    def __init__(self, max_bytes: int = 2**30):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_bytes (int): Total size of the cached bands, 0 disables caching.
+        """
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._bands: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+
+    def get(self, key: tuple, loader) -> Optional[np.ndarray]:
+        """
+        Return the band cached under key, decoding it with loader on a miss.
+
+        Args:
+            key (tuple): Identifies the band file and backend.
+            loader: Function decoding the band.
+
+        Returns:
+            Optional[np.ndarray]: The band.
+        """
+        if key in self._bands:
+            self.hits += 1
+            self._bands.move_to_end(key)
+            return self._bands[key]
+
+        self.misses += 1
+        band = loader()
+        if band is None or band.nbytes > self.max_bytes:
+            return band
+
+        band.setflags(write=False)
+        self._bands[key] = band
+        self.nbytes += band.nbytes
+        while self.nbytes > self.max_bytes:
+            _, evicted = self._bands.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+        return band
+
+
+def _header_image(path: BandPathType) -> Dict[str, Any]:
+    """
+    Reads the header of a raster file without decoding any pixel data.
+
+    Args:
+        path (BandPathType): The file path to the image.
+
+    Returns:
+        Dict[str, Any]: A dictionary containing:
+            - "height": The height of the image (number of rows).
+            - "width": The width of the image (number of columns).
+            - "count": The number of bands stored in the file.
+            - "dtype": The native data type of the pixels.
+            - "crs": The coordinate reference system, or None.
+            - "transform": The affine geotransform of the raster.
+            - "nodata": The value marking missing pixels, or None.
+            - "profile": The full rasterio profile of the file.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", rio.errors.NotGeoreferencedWarning)
+        with rio.open(path) as src:
+            return {
+                "height": src.height,
+                "width": src.width,
+                "count": src.count,
+                "dtype": np.dtype(src.dtypes[0]),
+                "crs": src.crs,
+                "transform": src.transform,
+                "nodata": src.nodata,
+                "profile": dict(src.profile),
+            }
+
+
+def _metadata_image(
+    header: Callable[[], Dict[str, Any]], image: Callable[[], np.ndarray]
+) -> LazyMapping:
     """
-    Extracts metadata for a given image file.
+    Builds the metadata mapping of an image file.
 
-    This function reads an image from the specified file path using both Matplotlib
-    and scikit-image libraries. It returns a dictionary containing the image data
-    from both libraries, as well as the image's height and width.
+    Dimensions, data type and georeferencing come from the file header. The
+    image data is served by the given loader when the corresponding key is
+    accessed; "image_plt" and "image_skimage" share the same decoded array.
 
     Args:
-        path (str): The file path to the image.
+        header (Callable[[], Dict[str, Any]]): Returns the header, see _header_image.
+        image (Callable[[], np.ndarray]): Returns the decoded image data.
 
     Returns:
-        Dict[str, np.ndarray]: A dictionary containing:
-            - "image_plt": The image data read using Matplotlib.
-            - "image_skimage": The image data read using scikit-image.
+        LazyMapping: A mapping containing:
+            - "image_plt": The image data.
+            - "image_skimage": The image data.
             - "height": The height of the image (number of rows).
             - "width": The width of the image (number of columns).
+            - "count", "dtype", "crs", "transform", "nodata", "profile": See _header_image.
     """
-    image_plt = plt.imread(path)
-    image_skimage = io.imread(path)
-    return {
-        "image_plt": image_plt,
-        "image_skimage": image_skimage,
-        "height": image_plt.shape[0],
-        "width": image_plt.shape[1],
-    }
+    loaders = {"image_plt": image, "image_skimage": image}
+    for key in (
+        "height",
+        "width",
+        "count",
+        "dtype",
+        "crs",
+        "transform",
+        "nodata",
+        "profile",
+    ):
+        loaders[key] = lambda key=key: header()[key]
+
+    return LazyMapping(loaders)
 
 
 def _rasterio_image_tifs(path: str):
@@ -107,8 +447,17 @@ class FileHandler:
             List of file paths for multi-band TIFF images.
         band_paths (Dict[str, Optional[BandPathType]]):
             A dictionary mapping band names (e.g., "red", "nir") to their respective file paths.
-        bands (Dict[str, Optional[np.ndarray]]):
-            A dictionary mapping band names to their loaded image data as NumPy arrays.
+        bands (LazyMapping):
+            A mapping of band names to their image data as NumPy arrays. Each band is read
+            in its native dtype on first access only.
+        read_counts (Dict[str, int]):
+            Number of times each band file has been decoded by this handler.
+        memmap (bool):
+            Whether bands are served as read-only np.memmap views instead of in-memory arrays.
+        memmap_dir (Path):
+            Directory holding the .npy sidecar files of the memory-mapped backend.
+        band_cache (Optional[BandCache]):
+            Class-wide cache of decoded bands shared by every handler, e.g. in batch workers.
 
     Methods:
         get_normalized_bands(requested_bands: Optional[List[BandNameType]] = None) -> Dict[str, Optional[np.ndarray]]:
@@ -117,13 +466,31 @@ class FileHandler:
         get_metadata_bands(requested_bands: Optional[List[BandNameType]] = None) -> Dict[str, Dict]:
             Retrieve metadata (image data and dimensions) for the requested image bands. If no bands are specified, metadata for all available bands is returned.
 
-        get_images_collection() -> skimage.io.ImageCollection:
-            Retrieve a collection of all available image bands as an ImageCollection.
+        get_images_collection() -> List[np.ndarray]:
+            Retrieve a list of all available image bands.
 
         get_rasterio_tifs(requested_bands: Optional[List[BandNameType]] = None):
             Retrieve rasterio objects for all TIFF paths in tif_paths. Raises ValueError if tif_paths is None.
+
+        use_memmap(memmap_dir: Optional[BandPathType] = None):
+            Switch to the memory-mapped band backend.
+
+        get_band_statistics(band: BandNameType):
+            Retrieve the minimum and maximum of a band without decoding it at once.
+
+        get_profile(band: Optional[BandNameType] = None) -> Dict[str, Any]:
+            Retrieve the rasterio profile (CRS, transform, nodata, ...) of a band from its header.
+
+        view(**bands_path) -> FileHandler:
+            Create a handler serving a subset of the bands from the same caches.
+
+        release(band: BandNameType):
+            Drop the decoded and normalized data of a band.
     """
 
+    band_cache: Optional[BandCache] = None
+    """Process-wide cache of decoded bands shared by every handler, disabled if None."""
+
     def __init__(
         self,
         red_path: Optional[BandPathType] = None,
@@ -139,6 +506,8 @@ class FileHandler:
         before_nir_path: Optional[BandPathType] = None,
         before_swir1_path: Optional[BandPathType] = None,
         before_swir2_path: Optional[BandPathType] = None,
+        memmap: bool = False,
+        memmap_dir: Optional[BandPathType] = None,
     ):
         """
         Initialize the FileHandler with paths to various image bands.
@@ -155,8 +524,16 @@ class FileHandler:
             before_nir_path (Optional[BandPathType]): Path to the "before" NIR band image.
             before_swir1_path (Optional[BandPathType]): Path to the "before" SWIR1 band image.
             before_swir2_path (Optional[BandPathType]): Path to the "before" SWIR2 band image.
+            memmap (bool): Serve bands as read-only np.memmap views. Uncompressed TIFF files
+                are mapped in place, other files are decoded once into a .npy sidecar.
+            memmap_dir (Optional[BandPathType]): Directory for the .npy sidecar files.
+                Defaults to a "fezrs" folder in the system temporary directory. The
+                sidecars are kept for later runs, see clear_memmap_dir.
         """
         self.tif_paths = tif_paths
+        self.memmap = memmap
+        self._parent: Optional["FileHandler"] = None
+        self.memmap_dir = Path(memmap_dir or Path(tempfile.gettempdir()) / "fezrs")
 
         self.band_paths: BandTypes = {
             "tif": tif_path,
@@ -171,9 +548,240 @@ class FileHandler:
             "before_swir2": before_swir2_path,
         }
 
-        self.bands: BandTypes = {
-            key: _load_image(path) for key, path in self.band_paths.items()
-        }
+        for path in self.band_paths.values():
+            if path is not None and not os.path.exists(path):
+                raise FileNotFoundError(f"File {path} not found")
+
+        self.read_counts: Dict[str, int] = {key: 0 for key in self.band_paths}
+
+        # Every accessor below is served from these shared, lazily filled caches
+        self.bands: LazyMapping = LazyMapping(
+            {key: lambda key=key: self._read_band(key) for key in self.band_paths}
+        )
+        self._headers = LazyMapping(
+            {
+                key: lambda path=path: _header_image(path)
+                for key, path in self.band_paths.items()
+                if path is not None
+            }
+        )
+        self._statistics = LazyMapping(
+            {
+                key: lambda key=key: self._band_statistics(key)
+                for key, path in self.band_paths.items()
+                if path is not None
+            }
+        )
+        self._tif_paths_header: Optional[Dict[str, Any]] = None
+        self._normalized_bands = LazyMapping(
+            {
+                key: lambda key=key: self._normalize_band(key)
+                for key, path in self.band_paths.items()
+                if path is not None
+            }
+        )
+
+    def use_memmap(self, memmap_dir: Optional[BandPathType] = None) -> "FileHandler":
+        """
+        Switch to the memory-mapped band backend, dropping any band already cached.
+
+        Args:
+            memmap_dir (Optional[BandPathType]): Directory for the .npy sidecar files.
+                Keeps the current directory if None.
+
+        Returns:
+            FileHandler: The handler itself.
+
+        Raises:
+            ValueError: If the handler is a view, which uses the backend of its handler.
+        """
+        if self._parent is not None:
+            raise ValueError(
+                "A view serves the bands of its handler, switch that handler instead."
+            )
+
+        self.memmap = True
+        if memmap_dir is not None:
+            self.memmap_dir = Path(memmap_dir)
+
+        self.bands.reset()
+        self._normalized_bands.reset()
+        return self
+
+    def view(self, **bands_path: BandPathType) -> "FileHandler":
+        """
+        Create a handler serving a subset of this handler's bands from the same caches.
+
+        Bands read or normalized through the view are shared with this handler
+        and its other views, which decode them with this handler's backend. The
+        view only exposes its own bands, and its read_counts only count the
+        decodes it triggered.
+
+        Args:
+            **bands_path (BandPathType): Band paths by parameter name, e.g. nir_path.
+                Each path must be the one this handler has for the band.
+
+        Returns:
+            FileHandler: The view.
+
+        Raises:
+            ValueError: If a band is not served by this handler.
+        """
+        view = copy.copy(self)
+        view._parent = self
+        view.tif_paths = None
+        view.band_paths = {key: None for key in self.band_paths}
+        for param, path in bands_path.items():
+            band = param.removesuffix("_path")
+            own_path = self.band_paths.get(band)
+            if (
+                path is None
+                or own_path is None
+                or Path(path).resolve() != Path(own_path).resolve()
+            ):
+                raise ValueError(f"Band '{param}' is not served by this handler.")
+            view.band_paths[band] = own_path
+
+        view.read_counts = {key: 0 for key in view.band_paths}
+        own = [key for key, path in view.band_paths.items() if path is not None]
+
+        def read(key):
+            decoded = self.read_counts[key]
+            image = self.bands[key]
+            view.read_counts[key] += self.read_counts[key] - decoded
+            return image
+
+        view.bands = LazyMapping(
+            {
+                key: (lambda key=key: read(key)) if key in own else (lambda: None)
+                for key in view.band_paths
+            }
+        )
+        view._headers = LazyMapping(
+            {key: lambda key=key: self._headers[key] for key in own}
+        )
+        view._statistics = LazyMapping(
+            {key: lambda key=key: self._statistics[key] for key in own}
+        )
+        view._normalized_bands = LazyMapping(
+            {key: lambda key=key: self._normalized_bands[key] for key in own}
+        )
+        return view
+
+    def release(self, band: BandNameType) -> None:
+        """
+        Drop the decoded and normalized data of a band, keeping its header and statistics.
+
+        Args:
+            band (BandNameType): The band to release.
+        """
+        self.bands.release(band)
+        self._normalized_bands.release(band)
+
+    def _band_statistics(self, band: BandNameType):
+        """
+        Compute the minimum and maximum of a band.
+
+        Uses the cached band if it is already decoded, otherwise streams the file block by block.
+
+        Args:
+            band (BandNameType): The band name.
+
+        Returns:
+            Tuple: The minimum and maximum pixel values.
+        """
+        if self.bands.is_loaded(band):
+            image = self.bands[band]
+            return np.min(image), np.max(image)
+        return band_statistics(self.band_paths[band])
+
+    def get_band_statistics(self, band: BandNameType):
+        """
+        Retrieve the minimum and maximum of a band, computed once per handler.
+
+        Args:
+            band (BandNameType): The band name.
+
+        Returns:
+            Tuple: The minimum and maximum pixel values.
+        """
+        return self._statistics[band]
+
+    def get_profile(self, band: Optional[BandNameType] = None) -> Dict[str, Any]:
+        """
+        Retrieve the rasterio profile of a band, read once from its header.
+
+        The profile carries the CRS, transform and nodata value, so outputs can be
+        written georeferenced without opening the inputs again.
+
+        Args:
+            band (Optional[BandNameType]): The band name. If None, the first available
+                band is used, falling back to the first file of tif_paths.
+
+        Returns:
+            Dict[str, Any]: A copy of the profile, or an empty dictionary if no input is available.
+
+        Raises:
+            ValueError: If the requested band has no path.
+        """
+        if band is not None:
+            if self.band_paths.get(band) is None:
+                raise ValueError(f"The band '{band}' has no path.")
+            return dict(self._headers[band]["profile"])
+
+        for key in self._headers.keys():
+            return dict(self._headers[key]["profile"])
+
+        if self.tif_paths:
+            if self._tif_paths_header is None:
+                self._tif_paths_header = _header_image(self.tif_paths[0])
+            return dict(self._tif_paths_header["profile"])
+
+        return {}
+
+    def _normalize_band(self, band: BandNameType) -> Optional[np.ndarray]:
+        """
+        Normalize a band with the active backend.
+
+        Args:
+            band (BandNameType): The band name to normalize.
+
+        Returns:
+            Optional[np.ndarray]: The normalized band, memory-mapped when the memmap backend is active.
+        """
+        image = self.bands[band]
+        if self.memmap and image is not None:
+            return _normalize_memmap(image, self.band_paths[band], self.memmap_dir)
+        return _normalize(image)
+
+    def _read_band(self, band: BandNameType) -> Optional[np.ndarray]:
+        """
+        Decode a band file and record the read in read_counts.
+
+        The band is served from band_cache when one is set, decoding the file
+        only if no other handler of the process has decoded it yet.
+
+        Args:
+            band (BandNameType): The band name to read.
+
+        Returns:
+            Optional[np.ndarray]: The decoded band, or None if no path was given.
+        """
+        path = self.band_paths[band]
+        if path is None:
+            return None
+
+        if FileHandler.band_cache is not None:
+            key = (os.path.abspath(path), os.stat(path).st_mtime_ns, self.memmap)
+            return FileHandler.band_cache.get(key, lambda: self._decode_band(band))
+        return self._decode_band(band)
+
+    def _decode_band(self, band: BandNameType) -> Optional[np.ndarray]:
+        path = self.band_paths[band]
+        self.read_counts[band] += 1
+        if self.memmap:
+            return _memmap_image(path, self.memmap_dir)
+        return _load_image(path)
 
     def get_normalized_bands(
         self, requested_bands: Optional[List[BandNameType]] = None
@@ -186,17 +794,19 @@ class FileHandler:
                 If None, all available bands will be normalized.
 
         Returns:
-            Dict[str, Optional[np.ndarray]]: A dictionary mapping band names to their normalized image data.
+            LazyMapping: A mapping of band names to their normalized image data, computed on first access.
                 Bands with no data will be excluded from the result.
         """
         if requested_bands is None:
             requested_bands = list(self.bands.keys())
 
-        return {
-            band: _normalize(self.bands[band])
-            for band in requested_bands
-            if self.bands.get(band) is not None
-        }
+        return LazyMapping(
+            {
+                band: lambda band=band: self._normalized_bands[band]
+                for band in requested_bands
+                if self.band_paths.get(band) is not None
+            }
+        )
 
     def get_metadata_bands(
         self, requested_bands: Optional[list[BandNameType]] = None
@@ -210,30 +820,34 @@ class FileHandler:
 
         Returns:
             Dict[str, Dict]: A dictionary mapping band names to their metadata.
-                Metadata includes image data and dimensions (height and width).
+                Metadata includes dimensions and georeferencing read from the file header,
+                and image data read on first access.
         """
         if requested_bands is None:
             requested_bands = self.bands.keys()
 
         metadata = {}
         for band in requested_bands:
-            path = self.band_paths.get(band)
-            if path and os.path.exists(path):
-                metadata[band] = _metadata_image(path)
+            if self.band_paths.get(band) is not None:
+                metadata[band] = _metadata_image(
+                    header=lambda band=band: self._headers[band],
+                    image=lambda band=band: self.bands[band],
+                )
 
         return metadata
 
-    def get_images_collection(self) -> any:
+    def get_images_collection(self) -> List[np.ndarray]:
         """
         Retrieve a collection of all available image bands.
 
         Returns:
-            skimage.io.ImageCollection: A collection of images loaded from the available band file paths.
+            List[np.ndarray]: The available bands, in band_paths order, served from the shared band cache.
         """
-        image_columns = {
-            key: value for key, value in self.band_paths.items() if value is not None
-        }
-        return io.imread_collection(list(image_columns.values()))
+        return [
+            self.bands[key]
+            for key, value in self.band_paths.items()
+            if value is not None
+        ]
 
     def get_rasterio_tifs(self, requested_bands: Optional[list[BandNameType]] = None):
         """
@@ -0,0 +1,94 @@
+# Import packages and libraries
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from fezrs.utils.type_handler import BandPathType
+
+MODEL_FORMAT = 1
+"""Version of the saved model layout, bumped on incompatible changes."""
+
+
+def save_model(
+    path: BandPathType,
+    model: Any,
+    tool: str,
+    bands: List[str],
+    dtypes: List[str],
+    normalization: str = "none",
+    **extra: Any,
+) -> str:
+    """
+    Saves a fitted model with the band layout it was trained on.
+
+    Args:
+        path (BandPathType): Path of the file to write, conventionally .joblib.
+        model (Any): The fitted estimator.
+        tool (str): Name of the calculator that fitted the model.
+        bands (List[str]): Names of the feature bands, in feature order.
+        dtypes (List[str]): Data types of the training bands.
+        normalization (str): How band values were scaled before fitting, "none" for raw values.
+        **extra (Any): Further metadata stored alongside, e.g. the class labels.
+
+    Returns:
+        str: The path of the written file.
+    """
+    import joblib
+
+    metadata = {
+        "format": MODEL_FORMAT,
+        "tool": tool,
+        "bands": list(bands),
+        "dtypes": list(dtypes),
+        "normalization": normalization,
+        **extra,
+    }
+    joblib.dump({"metadata": metadata, "model": model}, path)
+    return str(path)
+
+
+def load_model(
+    path: BandPathType,
+    tool: Optional[str] = None,
+    bands: Optional[List[str]] = None,
+) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Loads a model written by save_model and checks that it fits the caller.
+
+    Only load files from trusted sources: models are unpickled.
+
+    Args:
+        path (BandPathType): Path of the saved model.
+        tool (Optional[str]): Expected calculator name, not checked if None.
+        bands (Optional[List[str]]): Expected feature bands in order, not checked if None.
+
+    Returns:
+        Tuple[Any, Dict[str, Any]]: The fitted estimator and its metadata.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file is not a saved model or does not match tool or bands.
+    """
+    import joblib
+
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"File {path} not found")
+
+    saved = joblib.load(path)
+    if not isinstance(saved, dict) or "metadata" not in saved:
+        raise ValueError(f"{path} is not a saved FEZrs model.")
+
+    metadata = saved["metadata"]
+    if metadata.get("format") != MODEL_FORMAT:
+        raise ValueError(
+            f"Unsupported model format {metadata.get('format')} in {path}, "
+            f"expected {MODEL_FORMAT}."
+        )
+    if tool is not None and metadata["tool"] != tool:
+        raise ValueError(f"{path} was fitted by {metadata['tool']}, not {tool}.")
+    if bands is not None and metadata["bands"] != list(bands):
+        raise ValueError(
+            f"{path} expects bands {metadata['bands']}, got {list(bands)}."
+        )
+
+    return saved["model"], metadata
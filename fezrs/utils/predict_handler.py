@@ -0,0 +1,124 @@
+# Import packages and libraries
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterator, Optional, Sequence, Tuple
+
+from fezrs.utils.type_handler import BandPathType
+
+_WORKER_MODEL = None
+"""Model held by each worker process, sent once by _init_worker."""
+
+
+def _init_worker(model: Any) -> None:
+    global _WORKER_MODEL
+    _WORKER_MODEL = model
+
+
+def _predict_rows(task: Tuple[int, np.ndarray]) -> Tuple[int, np.ndarray]:
+    row, features = task
+    return row, _WORKER_MODEL.predict(features)
+
+
+def _feature_chunks(
+    bands: Sequence[np.ndarray], rows_per_chunk: int
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Iterates over row chunks of the bands as (pixels, bands) feature matrices.
+
+    Args:
+        bands (Sequence[np.ndarray]): 2D bands of the same shape.
+        rows_per_chunk (int): Number of image rows per chunk.
+
+    Yields:
+        Tuple[int, np.ndarray]: The first row of each chunk and its features.
+    """
+    height = np.shape(bands[0])[0]
+    for row in range(0, height, rows_per_chunk):
+        rows = slice(row, row + rows_per_chunk)
+        features = np.stack([band[rows] for band in bands], axis=-1)
+        yield row, features.reshape(-1, len(bands))
+
+
+def open_labels(
+    shape: Tuple[int, int], dtype: Any, path: Optional[BandPathType] = None
+) -> np.ndarray:
+    """
+    Allocates a label image, in memory or as a memory-mapped .npy file.
+
+    Args:
+        shape (Tuple[int, int]): Image height and width.
+        dtype (Any): Data type of the labels.
+        path (Optional[BandPathType]): .npy file backing the labels, or None for memory.
+
+    Returns:
+        np.ndarray: The uninitialized label image.
+    """
+    if path is None:
+        return np.empty(shape, dtype=dtype)
+    return np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=shape)
+
+
+def predict_chunked(
+    model: Any,
+    bands: Sequence[np.ndarray],
+    chunk_size: int = 1_000_000,
+    workers: Optional[int] = 1,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Applies a fitted per-pixel model to whole bands, a chunk of rows at a time.
+
+    Chunks can be predicted on a process pool: the model is sent once to each
+    worker and at most two chunks per worker are in flight, so memory stays
+    bounded by a few chunks whatever the image size.
+
+    Args:
+        model (Any): A fitted estimator with a predict method, e.g. scikit-learn SVC.
+        bands (Sequence[np.ndarray]): 2D feature bands of the same shape.
+        chunk_size (int): Approximate number of pixels per chunk.
+        workers (Optional[int]): Number of worker processes. None uses every CPU,
+            1 predicts in the current process.
+        out (Optional[np.ndarray]): Preallocated (rows, cols) label image, e.g.
+            from open_labels. Allocated from the first chunk if None.
+
+    Returns:
+        np.ndarray: The (rows, cols) label image.
+
+    Raises:
+        ValueError: If chunk_size or workers is not positive.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"'chunk_size' must be >= 1, got {chunk_size}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"'workers' must be >= 1, got {workers}")
+
+    height, width = np.shape(bands[0])
+    rows_per_chunk = max(1, chunk_size // width)
+    chunks = _feature_chunks(bands, rows_per_chunk)
+
+    def _write(row, labels):
+        nonlocal out
+        if out is None:
+            out = np.empty((height, width), dtype=labels.dtype)
+        out[row : row + rows_per_chunk] = labels.reshape(-1, width)
+
+    if workers == 1 or height <= rows_per_chunk:
+        for row, features in chunks:
+            _write(row, model.predict(features))
+        return out
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(model,)
+    ) as executor:
+        pending = []
+        for task in chunks:
+            pending.append(executor.submit(_predict_rows, task))
+            if len(pending) >= 2 * workers:
+                _write(*pending.pop(0).result())
+        for future in pending:
+            _write(*future.result())
+
+    return out
@@ -0,0 +1,95 @@
+# Import packages and libraries
+import warnings
+import numpy as np
+import rasterio as rio
+from typing import Literal, Optional
+from rasterio.io import MemoryFile
+from rasterio.shutil import copy as rio_copy
+
+from fezrs.utils.type_handler import BandPathType
+
+RasterDriverType = Literal["GTiff", "COG"]
+"""Type alias for the supported raw raster export drivers."""
+
+
+def write_raster(
+    array: np.ndarray,
+    filename: BandPathType,
+    crs: Optional[rio.crs.CRS] = None,
+    transform: Optional[rio.Affine] = None,
+    driver: RasterDriverType = "GTiff",
+    compress: Optional[str] = "deflate",
+    block_size: int = 512,
+    nodata: Optional[float] = None,
+) -> str:
+    """
+    Writes an array to a tiled, compressed GeoTIFF or Cloud-Optimized GeoTIFF.
+
+    Args:
+        array (np.ndarray): Raster to write, (rows, cols) or (rows, cols, bands).
+            Boolean rasters are stored as uint8.
+        filename (BandPathType): Path of the file to write.
+        crs (Optional[rio.crs.CRS]): Coordinate reference system of the raster.
+        transform (Optional[rio.Affine]): Affine geotransform of the raster.
+        driver (RasterDriverType): "GTiff" for a tiled GeoTIFF, "COG" for a
+            Cloud-Optimized GeoTIFF with internal overviews.
+        compress (Optional[str]): GDAL compression method, or None.
+        block_size (int): Internal tile size, a multiple of 16.
+        nodata (Optional[float]): Value marking missing pixels, or None.
+
+    Returns:
+        str: The path of the written file.
+
+    Raises:
+        ValueError: If the array is not 2D/3D or the driver is not supported.
+    """
+    array = np.asarray(array)
+    if array.dtype == bool:
+        array = array.astype(np.uint8)
+
+    if array.ndim == 2:
+        bands_first = array[np.newaxis]
+    elif array.ndim == 3:
+        bands_first = np.moveaxis(array, -1, 0)
+    else:
+        raise ValueError(f"Expected a 2D or 3D raster, got {array.ndim} dimensions")
+
+    if driver not in ("GTiff", "COG"):
+        raise ValueError(f"Unsupported raster driver '{driver}'")
+
+    count, height, width = bands_first.shape
+    profile = {
+        "driver": "GTiff",
+        "height": height,
+        "width": width,
+        "count": count,
+        "dtype": bands_first.dtype,
+        "crs": crs,
+        "transform": transform if transform is not None else rio.Affine.identity(),
+        "nodata": nodata,
+        "tiled": True,
+        "blockxsize": block_size,
+        "blockysize": block_size,
+    }
+    if compress:
+        profile["compress"] = compress
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", rio.errors.NotGeoreferencedWarning)
+
+        if driver == "GTiff":
+            with rio.open(filename, "w", **profile) as dst:
+                dst.write(bands_first)
+            return str(filename)
+
+        # The COG driver only supports copies, so stage the raster in memory first
+        with MemoryFile() as memory_file:
+            with memory_file.open(**profile) as staging:
+                staging.write(bands_first)
+            with memory_file.open() as staging:
+                options = {"blocksize": block_size}
+                if compress:
+                    options["compress"] = compress
+                rio_copy(staging, filename, driver="COG", **options)
+
+    return str(filename)
@@ -0,0 +1,138 @@
+# Import packages and libraries
+import json
+import numpy as np
+import rasterio as rio
+from pathlib import Path
+from rasterio.features import rasterize
+from rasterio.transform import rowcol
+from typing import Optional, Tuple
+
+from fezrs.utils.type_handler import BandPathType
+
+
+def _samples_from_table(
+    path: BandPathType,
+    shape: Tuple[int, int],
+    transform: Optional[rio.Affine],
+    label_field: str,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Reads training pixels from a CSV table.
+
+    Args:
+        path (BandPathType): CSV file with "row"/"col" pixel coordinates, or "x"/"y"
+            map coordinates, and a label column.
+        shape (Tuple[int, int]): Image height and width.
+        transform (Optional[rio.Affine]): Geotransform used for map coordinates.
+        label_field (str): Name of the label column.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The rows, columns and labels.
+    """
+    import pandas as pd
+
+    table = pd.read_csv(path)
+    if {"row", "col"} <= set(table.columns):
+        rows, cols = table["row"].to_numpy(), table["col"].to_numpy()
+    elif {"x", "y"} <= set(table.columns):
+        if transform is None:
+            raise ValueError("Map coordinates need a georeferenced image.")
+        rows, cols = rowcol(transform, table["x"].to_numpy(), table["y"].to_numpy())
+    else:
+        raise ValueError(f"{path} needs 'row'/'col' or 'x'/'y' columns.")
+
+    rows, cols = np.asarray(rows, dtype=int), np.asarray(cols, dtype=int)
+    if (
+        np.any(rows < 0)
+        or np.any(cols < 0)
+        or np.any(rows >= shape[0])
+        or np.any(cols >= shape[1])
+    ):
+        raise ValueError(f"Some training samples of {path} lie outside the image.")
+
+    return rows, cols, table[label_field].to_numpy()
+
+
+def _samples_from_vector(
+    path: BandPathType,
+    shape: Tuple[int, int],
+    transform: Optional[rio.Affine],
+    label_field: str,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Reads training pixels from GeoJSON features, burning them onto the image grid.
+
+    Every pixel touched by a point, line or polygon becomes a sample labelled
+    with the feature's label property. Features must use the CRS of the image.
+
+    Args:
+        path (BandPathType): GeoJSON file of labelled features.
+        shape (Tuple[int, int]): Image height and width.
+        transform (Optional[rio.Affine]): Geotransform of the image.
+        label_field (str): Name of the label property.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The rows, columns and labels.
+    """
+    with open(path) as file:
+        collection = json.load(file)
+
+    features = collection.get("features", [collection])
+    labels = [feature["properties"][label_field] for feature in features]
+    classes, codes = np.unique(labels, return_inverse=True)
+
+    burned = rasterize(
+        (
+            (feature["geometry"], int(code) + 1)
+            for feature, code in zip(features, codes)
+        ),
+        out_shape=shape,
+        transform=transform if transform is not None else rio.Affine.identity(),
+        fill=0,
+        all_touched=True,
+        dtype="int32",
+    )
+
+    rows, cols = np.nonzero(burned)
+    return rows, cols, classes[burned[rows, cols] - 1]
+
+
+def read_training_samples(
+    path: BandPathType,
+    shape: Tuple[int, int],
+    transform: Optional[rio.Affine] = None,
+    label_field: str = "class",
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Reads labelled training pixels for supervised classifiers.
+
+    Args:
+        path (BandPathType): A CSV table (.csv) of pixel or map coordinates, or a
+            GeoJSON file (.geojson, .json) of labelled features.
+        shape (Tuple[int, int]): Image height and width.
+        transform (Optional[rio.Affine]): Geotransform of the image, needed for map
+            coordinates and vector labels.
+        label_field (str): Name of the label column or property.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The rows, columns and labels of
+            the training pixels.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the format is not supported or samples lie outside the image.
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"File {path} not found")
+
+    match (path.suffix.lower()):
+        case ".csv":
+            return _samples_from_table(path, shape, transform, label_field)
+        case ".geojson" | ".json":
+            return _samples_from_vector(path, shape, transform, label_field)
+        case _:
+            raise ValueError(
+                f"Unsupported training sample format '{path.suffix}', "
+                "expected .csv or .geojson"
+            )
@@ -0,0 +1,187 @@
+# Import packages and libraries
+import warnings
+import numpy as np
+import rasterio as rio
+from rasterio.windows import Window
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from fezrs.utils.type_handler import BandPathType
+
+
+def _open_raster(path: BandPathType):
+    """
+    Opens a raster with rasterio, silencing warnings about missing georeferencing.
+
+    Args:
+        path (BandPathType): The file path to the raster.
+
+    Returns:
+        rasterio.io.DatasetReader: The opened dataset.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", rio.errors.NotGeoreferencedWarning)
+        return rio.open(path)
+
+
+def block_windows(src, block_size: Optional[int] = None) -> Iterator[Window]:
+    """
+    Iterates over the windows covering a raster.
+
+    Args:
+        src (rasterio.io.DatasetReader): The dataset to cover.
+        block_size (Optional[int]): Size of square windows. If None, the native
+            internal tiling (or strip layout) of the file is used.
+
+    Yields:
+        Window: The windows, in row-major order.
+    """
+    if block_size is None:
+        for _, window in src.block_windows(1):
+            yield window
+        return
+
+    for row in range(0, src.height, block_size):
+        for col in range(0, src.width, block_size):
+            yield Window(
+                col,
+                row,
+                min(block_size, src.width - col),
+                min(block_size, src.height - row),
+            )
+
+
+def _read_block(src, window: Window) -> np.ndarray:
+    """
+    Reads a window shaped like skimage.io.imread output.
+
+    Args:
+        src (rasterio.io.DatasetReader): The dataset to read.
+        window (Window): The window to read.
+
+    Returns:
+        np.ndarray: A (rows, cols) block, or (rows, cols, bands) for multi-band files.
+    """
+    block = src.read(window=window)
+    return block[0] if src.count == 1 else np.moveaxis(block, 0, -1)
+
+
+def band_statistics(
+    path: BandPathType, block_size: Optional[int] = None
+) -> Tuple[float, float]:
+    """
+    Computes the minimum and maximum of a raster in a single streaming pass.
+
+    Args:
+        path (BandPathType): The file path to the raster.
+        block_size (Optional[int]): Size of square windows, see block_windows.
+
+    Returns:
+        Tuple[float, float]: The minimum and maximum pixel values.
+    """
+    minimum, maximum = None, None
+    with _open_raster(path) as src:
+        for window in block_windows(src, block_size):
+            block = _read_block(src, window)
+            block_min, block_max = np.min(block), np.max(block)
+            minimum = block_min if minimum is None else min(minimum, block_min)
+            maximum = block_max if maximum is None else max(maximum, block_max)
+
+    return minimum, maximum
+
+
+def stream_blocks(
+    band_paths: Dict[str, BandPathType],
+    output_file: BandPathType,
+    process_block: Callable[[Dict[str, np.ndarray]], np.ndarray],
+    block_size: Optional[int] = None,
+) -> str:
+    """
+    Runs a per-pixel function block by block and writes each result straight to a GeoTIFF.
+
+    The first band drives the block layout and supplies the CRS and transform of
+    the output. Only the current block of every band is held in memory.
+
+    Args:
+        band_paths (Dict[str, BandPathType]): Band names mapped to their file paths.
+            All bands must share the same dimensions.
+        output_file (BandPathType): Path of the GeoTIFF to write.
+        process_block (Callable[[Dict[str, np.ndarray]], np.ndarray]): Maps the
+            blocks of every band to the output block, either (rows, cols) or
+            (rows, cols, channels).
+        block_size (Optional[int]): Size of square windows, see block_windows.
+
+    Returns:
+        str: The path of the written GeoTIFF.
+
+    Raises:
+        ValueError: If no band is given or the bands have different dimensions.
+    """
+    if not band_paths:
+        raise ValueError("At least one band is required to stream blocks.")
+
+    sources = {band: _open_raster(path) for band, path in band_paths.items()}
+    try:
+        reference = next(iter(sources.values()))
+        for band, src in sources.items():
+            if (src.height, src.width) != (reference.height, reference.width):
+                raise ValueError(
+                    f"Band '{band}' is {src.height}x{src.width}, expected "
+                    f"{reference.height}x{reference.width}."
+                )
+
+        profile = reference.profile.copy()
+        profile.update(driver="GTiff", compress="deflate", nodata=None)
+        if block_size is not None:
+            profile.update(tiled=True, blockxsize=block_size, blockysize=block_size)
+        if profile.get("tiled") and (
+            profile["blockxsize"] % 16 or profile["blockysize"] % 16
+        ):
+            profile.update(tiled=False)
+            profile.pop("blockxsize", None)
+            profile.pop("blockysize", None)
+
+        dst = None
+        try:
+            for window in block_windows(reference, block_size):
+                blocks = {
+                    band: _read_block(src, window) for band, src in sources.items()
+                }
+                result = np.asarray(process_block(blocks))
+                if result.dtype == bool:
+                    result = result.astype(np.uint8)
+
+                if result.ndim == 2:
+                    bands_first = result[np.newaxis]
+                else:
+                    bands_first = np.moveaxis(result, -1, 0)
+
+                if dst is None:
+                    profile.update(dtype=result.dtype, count=bands_first.shape[0])
+                    dst = rio.open(output_file, "w", **profile)
+
+                dst.write(bands_first, window=window)
+        finally:
+            if dst is not None:
+                dst.close()
+    finally:
+        for src in sources.values():
+            src.close()
+
+    return str(output_file)
+
+
+def normalize_block(block: np.ndarray, statistics: Tuple[float, float]) -> np.ndarray:
+    """
+    Scales a block to [0, 1] using whole-image statistics.
+
+    Gives the same values as normalizing the whole image at once.
+
+    Args:
+        block (np.ndarray): The block to scale.
+        statistics (Tuple[float, float]): Minimum and maximum of the whole image.
+
+    Returns:
+        np.ndarray: The normalized block.
+    """
+    minimum, maximum = statistics
+    return (block - minimum) / (maximum - minimum)
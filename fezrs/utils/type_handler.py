@@ -72,6 +72,16 @@ PropertyGLCMType = Literal[
 ]
 """Type alias for supported GLCM property names."""
 
+SpectralIndexType = Literal[
+    "ndvi",
+    "ndwi",
+    "savi",
+    "bi",
+    "ui",
+    "afvi",
+]
+"""Type alias for spectral indices supported by the fused index engine."""
+
 BandNamePCAType = Literal["red", "nir", "blue", "swir1", "swir2", "green"]
 """Type alias for band names used in PCA."""
 
@@ -99,3 +109,56 @@ MagDirCDType = Literal[
     "direction",
 ]
 """Type alias for magnitude/direction change detection."""
+
+CVAOutputType = Literal[
+    "magnitude",
+    "direction",
+    "deltas",
+    "all",
+]
+"""Type alias for change vector analysis outputs."""
+
+MosaicMethodType = Literal[
+    "first",
+    "last",
+    "min",
+    "max",
+    "mean",
+]
+"""Type alias for the rules merging overlapping mosaic sources."""
+
+KMeansMethodType = Literal[
+    "full",
+    "minibatch",
+]
+"""Type alias for the k-means fitting algorithms."""
+
+PixelSamplingType = Literal[
+    "random",
+    "stratified",
+]
+"""Type alias for the ways of drawing a pixel sample to fit a model on."""
+
+BatchActionType = Literal[
+    "execute",
+    "raster",
+    "stream",
+    "process",
+]
+"""Type alias for how the batch runner executes a tool: figure, raster, streamed raster or no output."""
+
+
+class ToolConfigType(TypedDict, total=False):
+    """
+    TypedDict describing one tool of a batch run.
+
+    Only "tool" is required. Band parameters (e.g. nir_path) are filled from the
+    scene's bands of the same name unless "bands" maps them explicitly.
+    """
+
+    tool: str
+    name: str
+    params: dict
+    bands: dict
+    action: BatchActionType
+    options: dict
@@ -25,6 +25,7 @@ setup(
         "scikit-learn",
         "scikit-image",
         "opencv-python",
+        "tifffile",
     ],
     author="Mahdi Farmahinifarahani, Hooman Mirzaee, Mahdi Nedaee, Mohammad Hossein Kiani Fayz Abadi, Yoones Kiani Feyz Abadi, Erfan Karimzadehasl, Parsa Elmi",
     author_email="aradfarahani@aol.com",
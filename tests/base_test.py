@@ -0,0 +1,47 @@
+import numpy as np
+import tifffile
+import matplotlib.pyplot as plt
+
+from fezrs.base import _load_watermark
+from fezrs.tools.change_detection.cva_calculator import CVACalculator
+from fezrs.tools.image_enhancement.adaptive_calculator import AdaptiveCalculator
+
+
+def test_watermark_decoded_once_on_first_use(tmp_path):
+    nir = np.random.default_rng(0).integers(0, 256, (20, 30)).astype(np.uint8)
+    tifffile.imwrite(tmp_path / "nir.tif", nir)
+    _load_watermark.cache_clear()
+
+    tools = [
+        AdaptiveCalculator(nir_path=tmp_path / "nir.tif", clip_limit=0.02)
+        for _ in range(50)
+    ]
+    assert _load_watermark.cache_info().currsize == 0
+
+    tools[0].histogram_export(tmp_path, title="Adaptive")
+    tools[1].histogram_export(tmp_path, title="Adaptive")
+
+    info = _load_watermark.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+    assert tools[0]._logo_watermark is tools[49]._logo_watermark
+    assert tools[0]._logo_watermark.shape == (80, 80, 4)
+    assert not tools[0]._logo_watermark.flags.writeable
+    assert len(list(tmp_path.glob("*.png"))) == 2
+
+
+def test_execute_uses_requested_grid(tmp_path, monkeypatch, make_band_files):
+    paths = list(make_band_files(["a0", "a1", "b0", "b1"], (12, 10)).values())
+
+    grids = []
+    subplots = plt.subplots
+
+    def spy(*args, **kwargs):
+        grids.append((kwargs["nrows"], kwargs["ncols"]))
+        return subplots(*args, **kwargs)
+
+    monkeypatch.setattr(plt, "subplots", spy)
+    tool = CVACalculator(paths[:2], paths[2:])
+    tool.execute(tmp_path / "out", figsize=(2, 2), dpi=10, nrows=4, ncols=1)
+
+    assert grids == [(4, 1)]
+    assert len(list((tmp_path / "out").glob("*.png"))) == 1
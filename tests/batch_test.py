@@ -0,0 +1,129 @@
+import json
+import numpy as np
+import rasterio as rio
+from rasterio.transform import from_origin
+
+from fezrs.batch import main, read_catalog, run_batch
+from fezrs.utils import file_handler
+from fezrs.utils.file_handler import FileHandler
+
+TOOLS = [
+    {"tool": "NDVICalculator", "action": "raster"},
+    {"tool": "NDWICalculator", "action": "process"},
+    {
+        "tool": "KMeansCalculator",
+        "name": "kmeans",
+        "params": {"n_clusters": 2, "random_state": 0},
+        "action": "raster",
+    },
+    {"tool": "NotACalculator"},
+]
+
+
+def write_catalog(tmp_path, scenes=("a", "b")):
+    rng = np.random.default_rng(0)
+    catalog = {}
+    for scene in scenes:
+        catalog[scene] = {}
+        for band in ("nir", "red", "green"):
+            path = tmp_path / f"{scene}_{band}.tif"
+            with rio.open(
+                path,
+                "w",
+                driver="GTiff",
+                height=20,
+                width=30,
+                count=1,
+                dtype="uint16",
+                crs="EPSG:32639",
+                transform=from_origin(500000, 4000000, 30, 30),
+            ) as dst:
+                dst.write(rng.integers(1, 5000, (20, 30)).astype(np.uint16), 1)
+            catalog[scene][band] = path.name
+    (tmp_path / "catalog.json").write_text(json.dumps(catalog))
+    return read_catalog(tmp_path / "catalog.json")
+
+
+def test_batch_reports_every_task(tmp_path):
+    catalog = write_catalog(tmp_path)
+
+    results = run_batch(catalog, TOOLS, tmp_path / "out", workers=2)
+
+    assert [(r["scene"], r["tool"]) for r in results] == [
+        (scene, tool)
+        for scene in "ab"
+        for tool in ("NDVICalculator", "NDWICalculator", "kmeans", "NotACalculator")
+    ]
+    assert [r["status"] for r in results] == ["ok", "ok", "ok", "failed"] * 2
+    assert "NotACalculator" in results[3]["error"]
+    ndvi = results[4]["output"]
+    assert ndvi.startswith(str(tmp_path / "out" / "b" / "NDVICalculator"))
+    with rio.open(ndvi) as src:
+        assert src.crs == "EPSG:32639"
+
+
+def test_serial_batch_decodes_each_band_once(tmp_path, monkeypatch):
+    catalog = write_catalog(tmp_path, scenes=("a",))
+    decoded = []
+    load_image = file_handler._load_image
+    monkeypatch.setattr(
+        file_handler,
+        "_load_image",
+        lambda path: decoded.append(path) or load_image(path),
+    )
+
+    results = run_batch(catalog, TOOLS[:3], tmp_path / "out", workers=1)
+
+    assert all(r["status"] == "ok" for r in results)
+    assert sorted(decoded) == sorted(catalog["a"].values())
+    assert FileHandler.band_cache is None
+
+
+def test_cli_exit_code_and_report(tmp_path, capsys):
+    write_catalog(tmp_path, scenes=("a",))
+    (tmp_path / "tools.json").write_text(json.dumps(TOOLS[1:2]))
+    args = [str(tmp_path / "catalog.json"), str(tmp_path / "tools.json")]
+    args += [
+        "-o",
+        str(tmp_path / "out"),
+        "-w",
+        "1",
+        "--report",
+        str(tmp_path / "r.json"),
+    ]
+
+    assert main(args) == 0
+    assert json.loads((tmp_path / "r.json").read_text())[0]["status"] == "ok"
+
+    (tmp_path / "tools.json").write_text(json.dumps(TOOLS[3:]))
+    assert main(args) == 1
+    assert "0 succeeded, 1 failed" in capsys.readouterr().out
+
+
+def test_rerun_reuses_cached_outputs(tmp_path, monkeypatch):
+    catalog = write_catalog(tmp_path, scenes=("a",))
+    run_batch(catalog, TOOLS[:1], tmp_path / "out", workers=1, cache_dir=tmp_path / "c")
+    assert len(list((tmp_path / "c").glob("*.npz"))) == 1
+
+    decoded = []
+    monkeypatch.setattr(file_handler, "_load_image", decoded.append)
+    results = run_batch(
+        catalog, TOOLS[:1], tmp_path / "out", workers=1, cache_dir=tmp_path / "c"
+    )
+
+    assert results[0]["status"] == "ok" and decoded == []
+
+
+def test_crashed_worker_fails_only_its_task(tmp_path):
+    catalog = write_catalog(tmp_path, scenes=("a", "b", "c"))
+    crash = {"tool": "os._exit", "name": "crash", "params": {"status": 1}}
+    tools = [TOOLS[1], crash]
+
+    results = run_batch(catalog, tools, tmp_path / "out", workers=2)
+
+    assert [(r["scene"], r["tool"]) for r in results] == [
+        (scene, tool) for scene in "abc" for tool in ("NDWICalculator", "crash")
+    ]
+    assert [r["status"] for r in results] == ["ok", "failed"] * 3
+    assert "BrokenProcessPool" in results[1]["error"]
+    assert (tmp_path / "out" / "c" / "NDWICalculator").is_dir()
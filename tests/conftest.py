@@ -1,5 +1,30 @@
 import sys
 from pathlib import Path
 
+import pytest
+import tifffile
+import numpy as np
+
 # Add project root to sys.path
 sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+@pytest.fixture
+def make_band_files(tmp_path):
+    """
+    Factory writing tiled uint16 TIFF bands of random values to tmp_path.
+
+    Call it with the band names, the image shape and optionally the tile shape
+    and random seed; it returns the path of each band by name.
+    """
+
+    def make(names, shape, tile=(16, 16), seed=0):
+        rng = np.random.default_rng(seed)
+        paths = {}
+        for name in names:
+            paths[name] = tmp_path / f"{name}.tif"
+            image = rng.integers(1, 4000, shape).astype(np.uint16)
+            tifffile.imwrite(paths[name], image, tile=tile)
+        return paths
+
+    return make
@@ -0,0 +1,43 @@
+import sys
+import json
+import pytest
+import subprocess
+from pathlib import Path
+
+import fezrs
+
+HEAVY_BACKENDS = ("sklearn", "cv2", "rasterio", "pandas", "matplotlib", "skimage")
+
+
+def loaded_backends(statement):
+    code = (
+        f"import sys, json; {statement}; "
+        f"print(json.dumps([m for m in {HEAVY_BACKENDS!r} if m in sys.modules]))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def test_import_loads_no_backend():
+    assert loaded_backends("import fezrs") == []
+
+
+def test_calculator_loads_only_its_backends():
+    loaded = loaded_backends("from fezrs import NDVICalculator")
+
+    assert "rasterio" in loaded
+    assert not {"sklearn", "cv2", "pandas", "skimage"} & set(loaded)
+
+
+def test_public_names_resolve():
+    for name in fezrs.__all__:
+        assert getattr(fezrs, name).__name__ == name
+    assert set(fezrs.__all__) <= set(dir(fezrs))
+    with pytest.raises(AttributeError):
+        fezrs.NotACalculator
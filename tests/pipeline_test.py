@@ -0,0 +1,136 @@
+import pytest
+import numpy as np
+import rasterio as rio
+from rasterio.transform import from_origin
+
+from fezrs import (
+    BurnCalculator,
+    IndicesCalculator,
+    KMeansCalculator,
+    NDVICalculator,
+    SpectralProfileCalculator,
+)
+from fezrs.pipeline import Pipeline
+
+BANDS = ("red", "nir", "swir2", "before_nir", "before_swir2")
+
+
+@pytest.fixture
+def band_paths(tmp_path):
+    rng = np.random.default_rng(0)
+    paths = {}
+    for band in BANDS:
+        paths[f"{band}_path"] = tmp_path / f"{band}.tif"
+        with rio.open(
+            paths[f"{band}_path"],
+            "w",
+            driver="GTiff",
+            height=20,
+            width=30,
+            count=1,
+            dtype="float32",
+            crs="EPSG:32639",
+            transform=from_origin(500000, 4000000, 30, 30),
+        ) as dst:
+            dst.write(rng.uniform(100, 5000, (20, 30)).astype(np.float32), 1)
+    return paths
+
+
+def test_shared_intermediates_computed_once(band_paths, tmp_path):
+    change = {key: path for key, path in band_paths.items() if key != "red_path"}
+    pipeline = (
+        Pipeline(**band_paths)
+        .add("burn", BurnCalculator)
+        .add("nbr", IndicesCalculator, time="after")
+        .add("nbr_before", IndicesCalculator, time="before")
+        .add("ndvi", NDVICalculator)
+        .add("clusters", KMeansCalculator, n_clusters=2, random_state=0)
+    )
+
+    outputs = pipeline.run(tmp_path / "out")
+
+    expected = {
+        "burn": BurnCalculator(**change).process(),
+        "nbr": IndicesCalculator(**change, time="after").process(),
+        "nbr_before": IndicesCalculator(**change, time="before").process(),
+        "ndvi": NDVICalculator(
+            nir_path=band_paths["nir_path"], red_path=band_paths["red_path"]
+        ).process(),
+        "clusters": KMeansCalculator(
+            nir_path=band_paths["nir_path"], n_clusters=2, random_state=0
+        ).process(),
+    }
+    for name, output in expected.items():
+        np.testing.assert_array_equal(outputs[name], output)
+        assert len(list((tmp_path / "out" / name).glob("*.tif"))) == 1
+
+    # Every band decoded once, both NBRs and the NDVI computed once
+    handler = pipeline.files_handler
+    assert all(handler.read_counts[band] == 1 for band in BANDS)
+    assert [inputs for _, inputs in pipeline.computed] == [
+        (("band", "nir"), ("band", "swir2")),
+        (("band", "before_nir"), ("band", "before_swir2")),
+        (("normalized", "nir"), ("normalized", "red")),
+    ]
+
+
+def test_nodes_released_after_last_use(band_paths):
+    pipeline = Pipeline(**band_paths).add("burn", BurnCalculator)
+    pipeline.add("ndvi", NDVICalculator)
+    released = []
+    release = pipeline.files_handler.release
+    pipeline.files_handler.release = lambda band: released.append(band) or release(band)
+
+    pipeline.run()
+
+    # The change bands are freed after the burn, before the NDVI reads red
+    assert released[:3] == ["swir2", "before_nir", "before_swir2"]
+    assert not any(pipeline.files_handler.bands.is_loaded(band) for band in BANDS)
+    assert pipeline._intermediates == {}
+
+
+def test_views_serve_only_their_bands(tmp_path):
+    rng = np.random.default_rng(0)
+    paths = {}
+    for index, band in enumerate(("red", "green", "blue", "nir", "swir1", "swir2")):
+        paths[f"{band}_path"] = tmp_path / f"{band}.tif"
+        with rio.open(
+            paths[f"{band}_path"],
+            "w",
+            driver="GTiff",
+            height=20,
+            width=30,
+            count=1,
+            dtype="uint16",
+            crs="EPSG:32639",
+            transform=from_origin(500000 + 30 * index, 4000000, 30, 30),
+        ) as dst:
+            dst.write(rng.integers(1, 5000, (20, 30)).astype(np.uint16), 1)
+    # tif sorts first in band_paths, a view leaking it shifts the profiled band
+    extra = {"tif_path": paths["nir_path"]}
+
+    pipeline = Pipeline(memmap=True, **paths, **extra)
+    pipeline.add("profile", SpectralProfileCalculator)
+    pipeline.add("clusters", KMeansCalculator, n_clusters=2, random_state=0)
+    outputs = pipeline.run(tmp_path / "out")
+
+    profile = SpectralProfileCalculator(**paths)
+    profile.process()
+    np.testing.assert_array_equal(outputs["profile"], profile._output)
+    with rio.open(next((tmp_path / "out" / "clusters").glob("*.tif"))) as src:
+        assert src.transform == from_origin(500000 + 90, 4000000, 30, 30)
+
+    view = pipeline.files_handler.view(nir_path=paths["nir_path"])
+    assert isinstance(view.bands["nir"], np.memmap)
+    assert [band for band, image in view.bands.items() if image is not None] == ["nir"]
+    assert list(view.get_normalized_bands()) == ["nir"]
+    assert view.get_profile()["transform"] == from_origin(500090, 4000000, 30, 30)
+    with pytest.raises(ValueError):
+        view.use_memmap()
+
+
+def test_duplicate_name(band_paths):
+    pipeline = Pipeline(**band_paths).add("ndvi", NDVICalculator)
+
+    with pytest.raises(ValueError):
+        pipeline.add("ndvi", NDVICalculator)
@@ -0,0 +1,90 @@
+import pytest
+import tifffile
+import numpy as np
+import rasterio as rio
+
+from fezrs import CVACalculator, MagDirCalculator
+from fezrs.tools.change_detection.cva_engine import cva_block, stream_cva
+
+
+@pytest.fixture
+def band_files(make_band_files):
+    names = [f"{time}_{band}" for time in ("after", "before") for band in range(3)]
+    paths = list(make_band_files(names, (37, 29)).values())
+    return {"after": paths[:3], "before": paths[3:]}
+
+
+def test_cva_block_matches_definition():
+    rng = np.random.default_rng(1)
+    after = [rng.integers(0, 5, (6, 7)).astype(np.uint8) for _ in range(3)]
+    before = [rng.integers(0, 5, (6, 7)).astype(np.uint8) for _ in range(3)]
+
+    result = cva_block(after, before)
+
+    deltas = np.stack(after, -1).astype(float) - np.stack(before, -1)
+    codes = 1 + ((deltas > 0) * [1, 2, 4]).sum(-1)
+    codes[(deltas == 0).any(-1)] = 0
+    np.testing.assert_allclose(result[..., 0], np.linalg.norm(deltas, axis=-1))
+    np.testing.assert_array_equal(result[..., 1], codes)
+    np.testing.assert_array_equal(result[..., 2:], deltas)
+
+
+@pytest.mark.parametrize("select", ["magnitude", "direction"])
+def test_cva_two_bands_matches_magdir(band_files, select):
+    after, before = band_files["after"][:2], band_files["before"][:2]
+
+    cva = CVACalculator(after, before, select=select).process()
+    magdir = MagDirCalculator(
+        nir_path=after[0],
+        swir1_path=after[1],
+        before_nir_path=before[0],
+        before_swir1_path=before[1],
+        selecte=select,
+    ).process()
+
+    np.testing.assert_array_equal(cva, magdir)
+
+
+@pytest.mark.parametrize("select, layers", [("all", 5), ("deltas", 3)])
+def test_cva_stream_matches_process(band_files, tmp_path, select, layers):
+    tool = CVACalculator(
+        band_files["after"], band_files["before"], select=select, block_rows=8
+    )
+    tool.execute_stream(tmp_path / "out", block_size=16)
+
+    with rio.open(tool.output_file) as src:
+        streamed = np.moveaxis(src.read(), 0, -1)
+
+    assert streamed.shape == (37, 29, layers)
+    np.testing.assert_array_equal(streamed, tool.process())
+
+
+def test_stream_cva_writes_every_layer(band_files, tmp_path):
+    output = stream_cva(band_files["after"], band_files["before"], tmp_path / "cva.tif")
+
+    with rio.open(output) as src:
+        streamed = np.moveaxis(src.read(), 0, -1)
+
+    expected = cva_block(
+        [tifffile.imread(path) for path in band_files["after"]],
+        [tifffile.imread(path) for path in band_files["before"]],
+    )
+    np.testing.assert_array_equal(streamed, expected)
+
+
+def test_cva_mismatched_bands(band_files):
+    with pytest.raises(ValueError):
+        CVACalculator(band_files["after"], band_files["before"][:2]).process()
+
+
+def test_cva_reads_bands_through_file_handlers(band_files, tmp_path):
+    tool = CVACalculator(band_files["after"], band_files["before"])
+    expected = tool.process()
+
+    memmapped = CVACalculator(band_files["after"], band_files["before"])
+    memmapped.use_memmap(tmp_path / "memmap")
+    np.testing.assert_array_equal(memmapped.process(), expected)
+
+    for handler in memmapped._band_handlers.values():
+        assert handler.read_counts["tif"] == 1
+        assert isinstance(handler.bands["tif"], np.memmap)
@@ -0,0 +1,65 @@
+import pytest
+import tifffile
+import numpy as np
+import rasterio as rio
+
+from fezrs import MagDirCalculator
+
+BANDS = ("nir", "swir1", "before_nir", "before_swir1")
+
+
+@pytest.fixture
+def band_files(make_band_files):
+    return make_band_files(BANDS, (37, 29))
+
+
+def _per_pixel_magdir(images):
+    nir, swir1, before_nir, before_swir1 = (images[band] for band in BANDS)
+    magnitude = np.empty(nir.shape)
+    direction = np.empty(nir.shape)
+    for i in range(nir.shape[0]):
+        for j in range(nir.shape[1]):
+            delta_nir = nir[i][j] - before_nir[i][j]
+            delta_swir1 = swir1[i][j] - before_swir1[i][j]
+            magnitude[i][j] = np.sqrt(delta_nir**2 + delta_swir1**2)
+            if delta_nir == 0 or delta_swir1 == 0:
+                direction[i][j] = 0
+            elif delta_nir < 0 and delta_swir1 < 0:
+                direction[i][j] = 1
+            elif delta_nir > 0 and delta_swir1 < 0:
+                direction[i][j] = 2
+            elif delta_nir < 0 and delta_swir1 > 0:
+                direction[i][j] = 3
+            else:
+                direction[i][j] = 4
+    return {"magnitude": magnitude, "direction": direction}
+
+
+@pytest.mark.parametrize("block_rows", [5, 1024])
+@pytest.mark.parametrize("select", ["magnitude", "direction"])
+def test_magdir_matches_per_pixel_loop(band_files, select, block_rows):
+    images = {
+        band: tifffile.imread(path).astype(np.float64)
+        for band, path in band_files.items()
+    }
+    images["nir"][0, :3] = images["before_nir"][0, :3]
+
+    tifffile.imwrite(band_files["nir"], images["nir"].astype(np.uint16))
+    tool = MagDirCalculator(
+        **{f"{band}_path": path for band, path in band_files.items()},
+        selecte=select,
+        block_rows=block_rows,
+    )
+
+    np.testing.assert_array_equal(tool.process(), _per_pixel_magdir(images)[select])
+
+
+@pytest.mark.parametrize("select", ["magnitude", "direction"])
+def test_magdir_stream_matches_process(band_files, tmp_path, select):
+    tool = MagDirCalculator(
+        **{f"{band}_path": path for band, path in band_files.items()}, selecte=select
+    )
+    tool.execute_stream(tmp_path / "out", block_size=16)
+
+    with rio.open(tool.output_file) as src:
+        np.testing.assert_array_equal(src.read(1), tool.process())
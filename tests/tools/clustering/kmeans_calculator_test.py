@@ -0,0 +1,88 @@
+import pytest
+import numpy as np
+import rasterio as rio
+from rasterio.transform import from_origin
+
+from fezrs.tools.clustering.kmeans_calculator import KMeansCalculator
+from fezrs.tools.clustering.kmeans_engine import sample_pixels
+
+
+def write_band(path, data):
+    with rio.open(
+        path,
+        "w",
+        driver="GTiff",
+        height=data.shape[0],
+        width=data.shape[1],
+        count=1,
+        dtype=data.dtype.name,
+        crs="EPSG:32639",
+        transform=from_origin(500000, 4000000, 30, 30),
+    ) as dst:
+        dst.write(data, 1)
+    return path
+
+
+@pytest.fixture
+def nir(tmp_path):
+    rng = np.random.default_rng(0)
+    data = rng.choice([100, 800, 1500], size=(30, 40)) + rng.integers(0, 20, (30, 40))
+    return write_band(tmp_path / "nir.tif", data.astype(np.uint16))
+
+
+def test_saved_model_reapplied_to_other_scene(nir, tmp_path):
+    fitted = KMeansCalculator(nir_path=nir, n_clusters=3, random_state=0)
+    expected = fitted.process()
+    model_path = fitted.save_model(tmp_path / "kmeans.joblib")
+
+    reused = KMeansCalculator(nir_path=nir, model_path=model_path, chunk_size=100)
+    np.testing.assert_array_equal(reused.process(), expected)
+
+    # Another scene is assigned to the saved clusters, never refitted
+    other = np.full((10, 12), 790, dtype=np.uint16)
+    output = KMeansCalculator(
+        nir_path=write_band(tmp_path / "other.tif", other), model_path=model_path
+    ).process()
+    np.testing.assert_array_equal(np.unique(output), [np.median(np.unique(expected))])
+
+
+def test_save_before_fit(nir, tmp_path):
+    with pytest.raises(ValueError):
+        KMeansCalculator(nir_path=nir, n_clusters=3).save_model(tmp_path / "m.joblib")
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"sample_size": 300},
+        {"sample_size": 300, "sampling": "stratified"},
+        {"method": "minibatch", "batch_size": 256},
+        {"method": "minibatch", "sample_size": 500, "chunk_size": 50},
+    ],
+)
+def test_sampled_fit_matches_full_fit(nir, options):
+    expected = KMeansCalculator(nir_path=nir, n_clusters=3, random_state=0).process()
+
+    output = KMeansCalculator(
+        nir_path=nir, n_clusters=3, random_state=0, **options
+    ).process()
+
+    # Same partition of the scene, with centers a few digital numbers apart
+    np.testing.assert_allclose(np.unique(output), np.unique(expected), atol=5)
+    assert np.mean(np.abs(output - expected) < 5) == 1
+
+
+def test_stratified_sample_covers_the_scene():
+    band = np.arange(100 * 80).reshape(100, 80)
+
+    samples = sample_pixels(band, 500, "stratified", random_state=0)
+
+    rows, cols = np.divmod(samples[:, 0], 80)
+    assert len(samples) == 500
+    # One pixel in each 4 x 4 cell of the grid
+    assert len(np.unique((rows // 4) * 20 + cols // 4)) == 500
+
+
+def test_invalid_sample_size(nir):
+    with pytest.raises(ValueError):
+        KMeansCalculator(nir_path=nir, n_clusters=3, sample_size=2)._validate()
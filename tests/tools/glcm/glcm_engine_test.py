@@ -0,0 +1,95 @@
+import pytest
+import numpy as np
+from skimage.feature import graycomatrix, graycoprops
+
+from fezrs.tools.glcm.glcm_engine import (
+    glcm_features,
+    glcm_features_tiled,
+    glcm_property,
+)
+
+
+def _per_window_property(image, window_size, prop, distance, angle, levels):
+    result = np.empty(image.shape)
+    for i in range(image.shape[0]):
+        for j in range(image.shape[1]):
+            window = image[i : i + window_size, j : j + window_size]
+            glcm = graycomatrix(
+                window, [distance], [angle], levels=levels, normed=True, symmetric=True
+            )
+            result[i, j] = graycoprops(glcm, prop)[0][0]
+    return result
+
+
+@pytest.mark.parametrize("prop", ["contrast", "ASM", "dissimilarity", "homogeneity"])
+@pytest.mark.parametrize("window_size", [1, 3, 4])
+@pytest.mark.parametrize("angle", [0, np.pi / 4, np.pi / 2, 3 * np.pi / 4])
+def test_glcm_property_matches_per_window_glcm(prop, window_size, angle):
+    image = np.random.default_rng(0).integers(0, 8, (9, 11)).astype(np.uint8)
+
+    expected = _per_window_property(image, window_size, prop, 1, angle, 8)
+    result = glcm_property(image, window_size, prop, 1, angle, levels=8)
+
+    np.testing.assert_allclose(result, expected, atol=1e-12)
+
+
+def test_glcm_property_default_levels_with_uint8_image():
+    image = np.random.default_rng(1).integers(0, 256, (7, 6)).astype(np.uint8)
+
+    expected = _per_window_property(image, 3, "contrast", 2, 0, 256)
+    result = glcm_property(image, 3, "contrast", distance=2)
+
+    np.testing.assert_allclose(result, expected, atol=1e-12)
+
+
+def test_glcm_features_stack_matches_graycoprops_layout():
+    image = np.random.default_rng(2).integers(0, 6, (8, 9)).astype(np.uint8)
+    properties = ["contrast", "ASM", "homogeneity"]
+    distances = [1, 2]
+    angles = [0, np.pi / 2]
+
+    result = glcm_features(image, 3, properties, distances, angles, levels=6)
+
+    assert result.shape == (3, 2, 2, 8, 9)
+    for i in range(image.shape[0]):
+        for j in range(image.shape[1]):
+            glcm = graycomatrix(
+                image[i : i + 3, j : j + 3],
+                distances,
+                angles,
+                levels=6,
+                normed=True,
+                symmetric=True,
+            )
+            for p_index, prop in enumerate(properties):
+                np.testing.assert_allclose(
+                    result[p_index, :, :, i, j], graycoprops(glcm, prop), atol=1e-12
+                )
+
+
+@pytest.mark.parametrize("tile_size, workers", [(7, 1), (16, 2), (100, None)])
+def test_glcm_features_tiled_is_bit_identical(tile_size, workers):
+    image = np.random.default_rng(3).integers(0, 256, (37, 29)).astype(np.uint8)
+    options = {
+        "window_size": 4,
+        "properties": ["contrast", "ASM", "dissimilarity", "homogeneity"],
+        "distances": [1, 2],
+        "angles": [0, np.pi / 4, np.pi / 2, 3 * np.pi / 4],
+    }
+
+    expected = glcm_features(image, **options)
+    result = glcm_features_tiled(
+        image, tile_size=tile_size, workers=workers, **options
+    )
+
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_glcm_property_invalid_property():
+    with pytest.raises(ValueError):
+        glcm_property(np.zeros((4, 4), dtype=np.uint8), prop="unknown")
+
+
+def test_glcm_property_levels_out_of_range():
+    with pytest.raises(ValueError):
+        glcm_property(np.full((4, 4), 9, dtype=np.uint8), levels=8)
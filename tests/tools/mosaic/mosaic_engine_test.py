@@ -0,0 +1,163 @@
+import pytest
+import numpy as np
+import rasterio as rio
+from rasterio.merge import merge
+from rasterio.transform import from_origin
+
+from fezrs import MosaicCalculator, NDVICalculator
+from fezrs.tools.mosaic.mosaic_engine import (
+    build_vrt,
+    mosaic_array,
+    read_preview,
+    stream_mosaic,
+)
+
+
+def _write_tile(path, data, west, north, nodata=None):
+    with rio.open(
+        path,
+        "w",
+        driver="GTiff",
+        height=data.shape[0],
+        width=data.shape[1],
+        count=1,
+        dtype=data.dtype,
+        crs="EPSG:32639",
+        transform=from_origin(west, north, 30, 30),
+        nodata=nodata,
+    ) as dst:
+        dst.write(data, 1)
+    return path
+
+
+@pytest.fixture
+def tiles(tmp_path):
+    rng = np.random.default_rng(0)
+    return [
+        _write_tile(
+            tmp_path / f"tile_{index}.tif",
+            rng.integers(1, 4000, (50 + 7 * index, 60)).astype(np.uint16),
+            500000 + 900 * index,
+            4000000 - 600 * index,
+        )
+        for index in range(3)
+    ]
+
+
+def _write_mosaic(path, data, like):
+    with rio.open(like) as src:
+        profile = src.profile
+    profile.update(driver="GTiff", dtype=data.dtype)
+    with rio.open(path, "w", **profile) as dst:
+        dst.write(data, 1)
+    return path
+
+
+def _read(path):
+    with rio.open(path) as src:
+        return src.read(), src.transform
+
+
+@pytest.mark.parametrize("method", ["first", "last", "min", "max"])
+def test_mosaic_array_matches_rasterio_merge(tiles, method):
+    expected, transform = merge([str(tile) for tile in tiles], method=method)
+
+    mosaic, profile = mosaic_array(tiles, method)
+
+    assert profile["transform"] == transform
+    np.testing.assert_array_equal(mosaic, expected)
+
+
+def test_mosaic_array_mean(tiles):
+    first, _ = merge([str(tile) for tile in tiles], method="sum", dtype="float64")
+    count, _ = merge([str(tile) for tile in tiles], method="count", dtype="float64")
+
+    mosaic, _ = mosaic_array(tiles, "mean")
+
+    expected = np.round(
+        np.divide(first, count, where=count > 0, out=np.zeros_like(first))
+    )
+    np.testing.assert_array_equal(mosaic, expected.astype(np.uint16))
+
+
+@pytest.mark.parametrize("method", ["first", "mean"])
+def test_stream_mosaic_matches_in_memory(tiles, tmp_path, method):
+    output = stream_mosaic(tiles, tmp_path / "mosaic.tif", method, block_size=32)
+
+    streamed, transform = _read(output)
+    mosaic, profile = mosaic_array(tiles, method)
+
+    assert transform == profile["transform"]
+    np.testing.assert_array_equal(streamed, mosaic)
+
+
+def test_stream_mosaic_skips_nodata(tmp_path):
+    data = np.full((20, 20), 7, dtype=np.uint8)
+    data[:, :10] = 255
+    first = _write_tile(tmp_path / "first.tif", data, 500000, 4000000, nodata=255)
+    second = _write_tile(
+        tmp_path / "second.tif", np.full((20, 20), 3, np.uint8), 500000, 4000000
+    )
+
+    streamed, _ = _read(stream_mosaic([first, second], tmp_path / "out.tif", "first"))
+
+    assert (streamed[0, :, :10] == 3).all()
+    assert (streamed[0, :, 10:] == 7).all()
+
+
+def test_preview_is_read_from_overviews(tmp_path):
+    data = np.random.default_rng(1).integers(0, 255, (1100, 900)).astype(np.uint8)
+    tile = _write_tile(tmp_path / "large.tif", data, 500000, 4000000)
+
+    output = stream_mosaic([tile], tmp_path / "mosaic.tif", block_size=256)
+
+    with rio.open(output) as src:
+        assert src.overviews(1) == [2, 4]
+    assert read_preview(output, max_size=300).shape == (275, 225)
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_mosaic_calculator_execute(tiles, tmp_path, stream):
+    tool = MosaicCalculator(tif_paths=tiles, stream=stream, block_size=32).execute(
+        tmp_path
+    )
+
+    expected, _ = mosaic_array(tiles)
+    np.testing.assert_array_equal(_read(tool._output)[0], expected)
+    assert len(list(tmp_path.glob("*.png"))) == 1
+
+
+def test_mosaic_invalid_method(tiles):
+    with pytest.raises(ValueError):
+        mosaic_array(tiles, "median")
+
+
+@pytest.mark.parametrize("method", ["first", "last"])
+def test_build_vrt_matches_in_memory(tiles, tmp_path, method):
+    output = build_vrt(tiles, tmp_path / "mosaic.vrt", method)
+
+    virtual, transform = _read(output)
+    mosaic, profile = mosaic_array(tiles, method)
+
+    assert transform == profile["transform"]
+    np.testing.assert_array_equal(virtual, mosaic)
+
+
+def test_vrt_band_paths_feed_calculators(tiles, tmp_path):
+    nir = MosaicCalculator(tif_paths=tiles).execute_vrt(tmp_path).output_file
+    red = MosaicCalculator(tif_paths=tiles[::-1]).execute_vrt(tmp_path).output_file
+
+    result = NDVICalculator(nir_path=nir, red_path=red).process()
+
+    nir_mosaic = mosaic_array(tiles)[0][0]
+    red_mosaic = mosaic_array(tiles[::-1])[0][0]
+    expected = NDVICalculator(
+        nir_path=_write_mosaic(tmp_path / "nir.tif", nir_mosaic, nir),
+        red_path=_write_mosaic(tmp_path / "red.tif", red_mosaic, red),
+    ).process()
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_build_vrt_rejects_combining_methods(tiles, tmp_path):
+    with pytest.raises(ValueError):
+        build_vrt(tiles, tmp_path / "mosaic.vrt", "mean")
@@ -0,0 +1,213 @@
+import os
+import pytest
+import tifffile
+from unittest import mock
+import numpy as np
+from sklearn.decomposition import PCA
+
+from fezrs import PCACalculator
+from fezrs.tools.pca.pca_engine import (
+    CovarianceAccumulator,
+    band_samples,
+    project_bands,
+)
+
+BANDS = ("red", "nir", "blue", "swir1", "swir2", "green")
+
+
+@pytest.fixture
+def bands():
+    rng = np.random.default_rng(0)
+    mixing = rng.random((6, 6))
+    sources = rng.normal(size=(43, 37, 6)) * [50, 20, 10, 5, 2, 1]
+    return [band for band in np.moveaxis(sources @ mixing + 3000, -1, 0)]
+
+
+@pytest.fixture
+def band_files(tmp_path, bands):
+    paths = {}
+    for name, band in zip(BANDS, bands):
+        paths[f"{name}_path"] = tmp_path / f"{name}.tif"
+        tifffile.imwrite(paths[f"{name}_path"], band.astype(np.uint16))
+    return paths
+
+
+@pytest.mark.parametrize("block_rows", [5, 1024])
+def test_covariance_accumulator_matches_numpy(bands, block_rows):
+    accumulator = CovarianceAccumulator(6)
+    for _, samples in band_samples(bands, block_rows):
+        accumulator.update(samples)
+
+    pixels = np.stack(bands, -1).reshape(-1, 6)
+    assert accumulator.count == len(pixels)
+    np.testing.assert_allclose(accumulator.mean, pixels.mean(0))
+    np.testing.assert_allclose(accumulator.covariance, np.cov(pixels.T))
+
+
+def test_pixel_pca_matches_sklearn(bands):
+    accumulator = CovarianceAccumulator(6)
+    for _, samples in band_samples(bands, 8):
+        accumulator.update(samples)
+    variances, components = accumulator.components()
+
+    pixels = np.stack(bands, -1).reshape(-1, 6)
+    pca = PCA(n_components=6).fit(pixels)
+    signs = np.sign(np.sum(components * pca.components_, axis=1))
+
+    np.testing.assert_allclose(variances, pca.explained_variance_)
+    np.testing.assert_allclose(components, pca.components_ * signs[:, None], atol=1e-8)
+
+    projected = project_bands(bands, accumulator.mean, components, block_rows=7)
+    expected = (pca.transform(pixels) * signs).T.reshape(6, 43, 37)
+    np.testing.assert_allclose(projected, expected, atol=1e-6)
+
+
+def test_band_samples_subsampling(bands):
+    samples = np.concatenate(
+        [block for _, block in band_samples(bands, block_rows=10, sample_step=4)]
+    )
+
+    expected = np.stack(bands, -1)[::4, ::4].reshape(-1, 6)
+    np.testing.assert_array_equal(samples, expected)
+
+
+def test_pca_calculator_outputs_component_images(band_files):
+    tool = PCACalculator(**band_files, n_components=3)
+
+    output = tool.process()
+
+    assert output.shape == (3, 43, 37)
+    assert np.all(np.diff(tool.explained_variance) <= 0)
+    assert all(count <= 1 for count in tool.files_handler.read_counts.values())
+
+
+def _scene_files(tmp_path, name, seed):
+    rng = np.random.default_rng(seed)
+    paths = {}
+    for band in BANDS:
+        paths[f"{band}_path"] = tmp_path / f"{name}_{band}.tif"
+        tifffile.imwrite(
+            paths[f"{band}_path"], rng.integers(0, 4000, (20, 30)).astype(np.uint16)
+        )
+    return paths
+
+
+def test_fit_scenes_matches_pooled_pixels(tmp_path):
+    scenes = [_scene_files(tmp_path, f"scene{index}", index) for index in range(3)]
+
+    state = PCACalculator.fit_scenes(scenes, block_rows=6)
+
+    pixels = np.concatenate(
+        [
+            np.stack(
+                [tifffile.imread(scene[f"{band}_path"]) for band in BANDS], -1
+            ).reshape(-1, 6)
+            for scene in scenes
+        ]
+    )
+    assert state.count == len(pixels)
+    assert len(state.sources) == 3
+    np.testing.assert_allclose(state.covariance, np.cov(pixels.T.astype(float)))
+
+
+def test_fit_scenes_resumes_from_saved_state(tmp_path):
+    scenes = [_scene_files(tmp_path, f"scene{index}", index) for index in range(3)]
+    state_path = tmp_path / "pca_state.npz"
+
+    PCACalculator.fit_scenes(scenes[:2], state_path=state_path)
+    resumed = PCACalculator.fit_scenes(scenes, state_path=state_path)
+    direct = PCACalculator.fit_scenes(scenes)
+
+    assert resumed.count == direct.count
+    np.testing.assert_allclose(resumed.scatter, direct.scatter)
+    np.testing.assert_allclose(resumed.mean, direct.mean)
+
+
+def test_fit_scenes_refits_rewritten_scene(tmp_path):
+    scene = _scene_files(tmp_path, "scene", 0)
+    state_path = tmp_path / "pca_state.npz"
+    PCACalculator.fit_scenes([scene], state_path=state_path)
+
+    _scene_files(tmp_path, "scene", 1)
+    for path in scene.values():
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    resumed = PCACalculator.fit_scenes([scene], state_path=state_path)
+
+    assert resumed.count == 2 * 20 * 30
+    assert len(resumed.sources) == 2
+
+
+def test_fit_scenes_without_scenes():
+    with pytest.raises(ValueError):
+        PCACalculator.fit_scenes([])
+
+
+def test_interrupted_save_keeps_previous_state(tmp_path, bands):
+    state = CovarianceAccumulator(6)
+    for _, samples in band_samples(bands, 10):
+        state.update(samples)
+    state_path = state.save(tmp_path / "pca_state.npz")
+
+    with mock.patch("numpy.savez", side_effect=KeyboardInterrupt):
+        with pytest.raises(KeyboardInterrupt):
+            CovarianceAccumulator(6).save(state_path)
+
+    assert [path.name for path in tmp_path.iterdir()] == ["pca_state.npz"]
+    assert CovarianceAccumulator.load(state_path).count == state.count
+
+
+def test_merged_accumulators_match_single_pass(bands):
+    single = CovarianceAccumulator(6)
+    tiles = [CovarianceAccumulator(6), CovarianceAccumulator(6)]
+    for index, (_, samples) in enumerate(band_samples(bands, 10)):
+        single.update(samples)
+        tiles[index % 2].update(samples)
+
+    merged = tiles[0].merge(tiles[1])
+
+    np.testing.assert_allclose(merged.scatter, single.scatter)
+    np.testing.assert_allclose(merged.mean, single.mean)
+
+
+def test_pca_calculator_uses_saved_basis(tmp_path, band_files):
+    scenes = [_scene_files(tmp_path, f"scene{index}", index) for index in range(2)]
+    basis_path = PCACalculator.fit_scenes(scenes).save(tmp_path / "basis.npz")
+
+    tool = PCACalculator(**band_files, basis=basis_path)
+    output = tool.process()
+
+    basis = CovarianceAccumulator.load(basis_path)
+    _, components = basis.components()
+    bands = np.stack([tifffile.imread(band_files[f"{b}_path"]) for b in BANDS], -1)
+    expected = np.moveaxis((bands - basis.mean) @ components.T, -1, 0)
+    np.testing.assert_allclose(output, expected)
+
+
+def test_pca_export_has_one_row_per_component(tmp_path, band_files):
+    tool = PCACalculator(**band_files, n_components=2)
+    tool.execute(tmp_path / "out", figsize=(4, 4), dpi=10)
+
+    assert tool._output.shape[0] == 2
+    assert len(list((tmp_path / "out").glob("*.png"))) == 1
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"n_components": 0, "selectBand": "red"},
+        {"n_components": 2, "selectBand": "green"},
+    ],
+)
+def test_pca_rejects_components_out_of_range(tmp_path, band_files, options):
+    tool = PCACalculator(**band_files, **options)
+
+    with pytest.raises(ValueError):
+        tool.histogram_export(tmp_path)
+
+
+def test_pca_histogram_of_computed_component(tmp_path, band_files):
+    tool = PCACalculator(**band_files, n_components=2, selectBand="nir")
+    tool.histogram_export(tmp_path, figsize=(2, 2), dpi=10)
+
+    assert len(list(tmp_path.glob("*.png"))) == 1
@@ -0,0 +1,85 @@
+import pytest
+import numpy as np
+import rasterio as rio
+
+from fezrs import (
+    AFVICalculator,
+    BICalculator,
+    NDVICalculator,
+    NDWICalculator,
+    SAVICalculator,
+    SpectralIndicesCalculator,
+    UICalculator,
+)
+from fezrs.tools.spectral_indices.spectral_engine import index_bands, spectral_indices
+
+CALCULATORS = {
+    "ndvi": NDVICalculator,
+    "ndwi": NDWICalculator,
+    "savi": SAVICalculator,
+    "bi": BICalculator,
+    "ui": UICalculator,
+    "afvi": AFVICalculator,
+}
+
+
+@pytest.fixture
+def band_files(make_band_files):
+    return make_band_files(("nir", "red", "green", "swir1", "swir2"), (45, 38))
+
+
+@pytest.mark.parametrize("block_rows", [7, 1024])
+def test_spectral_indices_match_individual_calculators(band_files, block_rows):
+    tool = SpectralIndicesCalculator(
+        **{f"{band}_path": path for band, path in band_files.items()},
+        block_rows=block_rows,
+    )
+    result = tool.process()
+
+    assert tool.indices == list(CALCULATORS)
+    for position, (index, calculator) in enumerate(CALCULATORS.items()):
+        bands = index_bands([index])
+        expected = calculator(
+            **{f"{band}_path": band_files[band] for band in bands}
+        ).process()
+        np.testing.assert_array_equal(result[:, :, position], expected)
+
+    # Each band is decoded exactly once for all six indices
+    assert all(
+        tool.files_handler.read_counts[band] == 1 for band in index_bands(tool.indices)
+    )
+
+
+def test_spectral_indices_default_to_available_bands(band_files):
+    tool = SpectralIndicesCalculator(
+        nir_path=band_files["nir"], red_path=band_files["red"]
+    )
+
+    assert tool.indices == ["ndvi", "savi"]
+    assert tool.process().shape == (45, 38, 2)
+
+
+def test_spectral_indices_stream_matches_process(band_files, tmp_path):
+    tool = SpectralIndicesCalculator(
+        nir_path=band_files["nir"],
+        red_path=band_files["red"],
+        green_path=band_files["green"],
+        indices=["bi", "ndwi"],
+    )
+    tool.execute_stream(tmp_path / "out", block_size=16)
+
+    with rio.open(tool.output_file) as src:
+        streamed = np.moveaxis(src.read(), 0, -1)
+    np.testing.assert_array_equal(streamed, tool.process())
+
+
+def test_spectral_indices_missing_band(band_files):
+    tool = SpectralIndicesCalculator(nir_path=band_files["nir"], indices=["ui"])
+
+    with pytest.raises(ValueError):
+        tool.process()
+
+
+def test_spectral_indices_unknown_index():
+    with pytest.raises(ValueError):
+        spectral_indices({}, {}, ["evi"])
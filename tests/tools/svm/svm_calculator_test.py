@@ -0,0 +1,181 @@
+import json
+import pytest
+import numpy as np
+import pandas as pd
+import rasterio as rio
+from rasterio.transform import from_origin
+
+from fezrs.tools.svm.svm_calculator import SVMCalculator
+from fezrs.utils.model_handler import load_model
+from fezrs.utils.sample_handler import read_training_samples
+
+BANDS = ("red", "green", "blue", "nir", "swir1", "swir2")
+TRANSFORM = from_origin(500000, 4000000, 30, 30)
+
+
+@pytest.fixture
+def scene(tmp_path):
+    # Two land covers: the left part of the scene is darker in every band
+    rng = np.random.default_rng(0)
+    classes = np.ones((24, 40), dtype=int)
+    classes[:, 25:] = 2
+
+    paths = {}
+    for index, band in enumerate(BANDS):
+        data = (
+            classes * 1000 + index * 50 + rng.integers(0, 100, classes.shape)
+        ).astype(np.uint16)
+        paths[f"{band}_path"] = tmp_path / f"{band}.tif"
+        with rio.open(
+            paths[f"{band}_path"],
+            "w",
+            driver="GTiff",
+            height=24,
+            width=40,
+            count=1,
+            dtype="uint16",
+            crs="EPSG:32639",
+            transform=TRANSFORM,
+        ) as dst:
+            dst.write(data, 1)
+    return paths, classes
+
+
+@pytest.mark.parametrize("chunk_size", [1, 100, 1_000_000])
+def test_headless_svm_from_pixel_samples(scene, tmp_path, chunk_size):
+    paths, classes = scene
+    samples = pd.DataFrame(
+        {
+            "row": [2, 10, 20, 3, 12, 22],
+            "col": [3, 12, 20, 30, 35, 38],
+            "class": [1, 1, 1, 2, 2, 2],
+        }
+    )
+    samples.to_csv(tmp_path / "samples.csv", index=False)
+
+    tool = SVMCalculator(
+        **paths, training_path=tmp_path / "samples.csv", chunk_size=chunk_size
+    )
+
+    np.testing.assert_array_equal(tool.process(), classes)
+
+
+def test_headless_svm_from_vector_labels(scene, tmp_path):
+    paths, classes = scene
+
+    def box(west, east, label):
+        x0, y0 = TRANSFORM * (west, 2)
+        x1, y1 = TRANSFORM * (east, 20)
+        ring = [[x0, y0], [x1, y0], [x1, y1], [x0, y1], [x0, y0]]
+        return {
+            "type": "Feature",
+            "geometry": {"type": "Polygon", "coordinates": [ring]},
+            "properties": {"cover": label},
+        }
+
+    labels = tmp_path / "labels.geojson"
+    labels.write_text(
+        json.dumps(
+            {
+                "type": "FeatureCollection",
+                "features": [box(2, 10, "soil"), box(28, 36, "water")],
+            }
+        )
+    )
+
+    tool = SVMCalculator(**paths, training_path=labels, label_field="cover")
+
+    expected = np.where(classes == 1, "soil", "water")
+    np.testing.assert_array_equal(tool.process(), expected)
+
+
+def test_read_training_samples_map_coordinates(tmp_path):
+    x, y = TRANSFORM * (5.5, 7.5)
+    pd.DataFrame({"x": [x], "y": [y], "class": [3]}).to_csv(
+        tmp_path / "samples.csv", index=False
+    )
+
+    rows, cols, labels = read_training_samples(
+        tmp_path / "samples.csv", (24, 40), TRANSFORM
+    )
+
+    assert (rows[0], cols[0], labels[0]) == (7, 5, 3)
+
+
+def test_read_training_samples_outside_image(tmp_path):
+    pd.DataFrame({"row": [30], "col": [0], "class": [1]}).to_csv(
+        tmp_path / "samples.csv", index=False
+    )
+
+    with pytest.raises(ValueError):
+        read_training_samples(tmp_path / "samples.csv", (24, 40))
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_parallel_prediction_matches_serial(scene, tmp_path, workers):
+    paths, classes = scene
+    pd.DataFrame(
+        {"row": [2, 10, 3, 12], "col": [3, 12, 30, 35], "class": [1, 1, 2, 2]}
+    ).to_csv(tmp_path / "samples.csv", index=False)
+
+    tool = SVMCalculator(
+        **paths,
+        training_path=tmp_path / "samples.csv",
+        chunk_size=80,
+        workers=workers,
+        labels_path=tmp_path / "labels.npy",
+    )
+
+    np.testing.assert_array_equal(tool.process(), classes)
+    np.testing.assert_array_equal(np.load(tmp_path / "labels.npy"), classes)
+
+
+def test_invalid_workers(scene, tmp_path):
+    paths, _ = scene
+    pd.DataFrame({"row": [0], "col": [0], "class": [1]}).to_csv(
+        tmp_path / "samples.csv", index=False
+    )
+
+    with pytest.raises(ValueError):
+        SVMCalculator(
+            **paths, training_path=tmp_path / "samples.csv", workers=0
+        ).process()
+
+
+def test_saved_model_reused_without_training(scene, tmp_path):
+    paths, classes = scene
+    pd.DataFrame(
+        {"row": [2, 10, 3, 12], "col": [3, 12, 30, 35], "class": [1, 1, 2, 2]}
+    ).to_csv(tmp_path / "samples.csv", index=False)
+
+    trained = SVMCalculator(**paths, training_path=tmp_path / "samples.csv")
+    trained.process()
+    model_path = trained.save_model(tmp_path / "svm.joblib")
+
+    reused = SVMCalculator(**paths, model_path=model_path)
+
+    np.testing.assert_array_equal(reused.process(), classes)
+    assert reused.classifier.classes_.tolist() == [1, 2]
+
+
+def test_saved_model_rejects_other_band_layout(scene, tmp_path):
+    paths, _ = scene
+    pd.DataFrame({"row": [2, 3], "col": [3, 30], "class": [1, 2]}).to_csv(
+        tmp_path / "samples.csv", index=False
+    )
+    trained = SVMCalculator(**paths, training_path=tmp_path / "samples.csv")
+    trained.process()
+    model_path = trained.save_model(tmp_path / "svm.joblib")
+
+    with pytest.raises(ValueError):
+        load_model(model_path, "SVMCalculator", ["red", "green", "blue"])
+
+
+def test_interactive_svm_is_not_cached(scene, tmp_path):
+    paths, _ = scene
+    pd.DataFrame({"row": [2, 3], "col": [3, 30], "class": [1, 2]}).to_csv(
+        tmp_path / "samples.csv", index=False
+    )
+
+    assert not SVMCalculator(**paths)._cacheable
+    assert SVMCalculator(**paths, training_path=tmp_path / "samples.csv")._cacheable
@@ -0,0 +1,106 @@
+import os
+import numpy as np
+import tifffile
+
+from fezrs import KMeansCalculator, NDVICalculator
+from fezrs.utils import cache_handler
+from fezrs.utils.cache_handler import ResultCache
+
+
+def write_bands(tmp_path, seed=0):
+    rng = np.random.default_rng(seed)
+    for band in ("nir", "red"):
+        tifffile.imwrite(
+            tmp_path / f"{band}.tif", rng.integers(1, 255, (20, 30)).astype(np.uint8)
+        )
+    return {"nir_path": tmp_path / "nir.tif", "red_path": tmp_path / "red.tif"}
+
+
+def test_rerun_loads_output_from_cache(tmp_path, monkeypatch):
+    bands = write_bands(tmp_path)
+    cache = ResultCache(tmp_path / "cache")
+    first = NDVICalculator(**bands).use_cache(cache).execute_raster(tmp_path / "out")
+
+    processed = []
+    monkeypatch.setattr(NDVICalculator, "process", lambda self: processed.append(1))
+    second = NDVICalculator(**bands).use_cache(cache).execute_raster(tmp_path / "out")
+
+    assert processed == [] and (cache.hits, cache.misses) == (1, 1)
+    np.testing.assert_array_equal(second._output, first._output)
+
+
+def test_key_follows_inputs_and_parameters(tmp_path):
+    bands = write_bands(tmp_path)
+    cache = ResultCache(tmp_path / "cache")
+
+    def key(n_clusters=3):
+        return cache.key(
+            KMeansCalculator(nir_path=bands["nir_path"], n_clusters=n_clusters)
+        )
+
+    original = key()
+    assert key() == original
+    assert key(n_clusters=4) != original
+
+    stat = os.stat(bands["nir_path"])
+    os.utime(bands["nir_path"], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert key() != original
+
+
+def test_key_follows_package_and_tool_source(tmp_path, monkeypatch):
+    bands = write_bands(tmp_path)
+    cache = ResultCache(tmp_path / "cache")
+    original = cache.key(NDVICalculator(**bands))
+
+    monkeypatch.setattr(cache_handler, "_package_version", lambda: "0.0.0")
+    assert cache.key(NDVICalculator(**bands)) != original
+    monkeypatch.undo()
+
+    monkeypatch.setattr(cache_handler, "_module_digest", lambda module: "edited")
+    assert cache.key(NDVICalculator(**bands)) != original
+
+
+def test_unfingerprintable_parameter_disables_caching(tmp_path):
+    bands = write_bands(tmp_path)
+    cache = ResultCache(tmp_path / "cache")
+    tool = NDVICalculator(**bands).use_cache(cache)
+    tool.reference = object()
+
+    assert cache.key(tool) is None
+    tool.execute_raster(tmp_path / "out")
+    assert tool._output is not None
+    assert list((tmp_path / "cache").glob("*.npz")) == []
+
+
+def test_least_recently_used_outputs_evicted(tmp_path):
+    output = np.random.default_rng(0).random((100, 100))
+    cache = ResultCache(tmp_path / "cache", compress=False)
+    cache.put("a", output)
+    size = (tmp_path / "cache" / "a.npz").stat().st_size
+    cache.max_bytes = 2 * size
+
+    cache.put("b", output)
+    os.utime(tmp_path / "cache" / "a.npz", ns=(0, 0))
+    os.utime(tmp_path / "cache" / "b.npz", ns=(10**9, 10**9))
+    assert cache.get("a") is not None
+    cache.put("c", output)
+
+    assert sorted(path.stem for path in (tmp_path / "cache").glob("*.npz")) == [
+        "a",
+        "c",
+    ]
+    assert cache.get("b") is None
+
+
+def test_model_saved_after_cache_hit(tmp_path):
+    bands = write_bands(tmp_path)
+    cache = ResultCache(tmp_path / "cache")
+    params = dict(nir_path=bands["nir_path"], n_clusters=3, random_state=0)
+    KMeansCalculator(**params).use_cache(cache).execute_raster(tmp_path / "out")
+
+    tool = KMeansCalculator(**params).use_cache(cache).execute_raster(tmp_path / "out")
+    assert cache.hits == 1 and not hasattr(tool, "kmeans")
+
+    model_path = tool.save_model(tmp_path / "kmeans.joblib")
+    reused = KMeansCalculator(nir_path=bands["nir_path"], model_path=model_path)
+    np.testing.assert_array_equal(reused.process(), tool._output)
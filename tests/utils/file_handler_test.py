@@ -1,8 +1,9 @@
 import pytest
 from unittest import mock
+import tifffile
 import numpy as np
 
-from fezrs.utils.file_handler import _load_image
+from fezrs.utils.file_handler import FileHandler, _load_image, clear_memmap_dir
 
 
 def test_load_image_none_path():
@@ -10,9 +11,7 @@ def test_load_image_none_path():
 
 
 @mock.patch("fezrs.utils.file_handler.os.path.exists", return_value=True)
-@mock.patch(
-    "fezrs.utils.file_handler.io.imread", return_value=np.array([[1, 2], [3, 4]])
-)
+@mock.patch("skimage.io.imread", return_value=np.array([[1, 2], [3, 4]]))
 def test_load_image_valid_path(mock_imread, mock_exists):
     result = _load_image("image.tif")
     assert isinstance(result, np.ndarray)
@@ -23,3 +22,92 @@ def test_load_image_valid_path(mock_imread, mock_exists):
 def test_load_image_file_not_found(mock_exists):
     with pytest.raises(FileNotFoundError):
         _load_image("nonexistent.jpg")
+
+
+@mock.patch("fezrs.utils.file_handler.os.path.exists", return_value=True)
+@mock.patch(
+    "skimage.io.imread",
+    return_value=np.array([[1, 2], [3, 4]], dtype=np.uint16),
+)
+def test_file_handler_loads_bands_lazily(mock_imread, mock_exists):
+    handler = FileHandler(nir_path="nir.tif", red_path="red.tif")
+    normalized = handler.get_normalized_bands(requested_bands=["nir", "red"])
+
+    assert mock_imread.call_count == 0
+    assert set(normalized) == {"nir", "red"}
+
+    assert handler.bands["nir"].dtype == np.uint16
+    handler.bands["nir"]
+    normalized["nir"]
+    assert mock_imread.call_count == 1
+
+
+@mock.patch("fezrs.utils.file_handler.os.path.exists", return_value=False)
+def test_file_handler_missing_file_fails_early(mock_exists):
+    with pytest.raises(FileNotFoundError):
+        FileHandler(nir_path="nonexistent.tif")
+
+
+@mock.patch("fezrs.utils.file_handler.os.path.exists", return_value=True)
+@mock.patch(
+    "fezrs.utils.file_handler._header_image",
+    return_value={"height": 2, "width": 2},
+)
+@mock.patch(
+    "skimage.io.imread",
+    return_value=np.array([[1, 2], [3, 4]], dtype=np.uint8),
+)
+def test_file_handler_decodes_each_file_once(mock_imread, mock_header, mock_exists):
+    handler = FileHandler(nir_path="nir.tif", red_path="red.tif")
+
+    metadata = handler.get_metadata_bands(requested_bands=["nir", "red"])
+    assert metadata["nir"]["height"] == 2
+    assert mock_imread.call_count == 0
+
+    metadata["nir"]["image_skimage"]
+    metadata["nir"]["image_plt"]
+    handler.get_normalized_bands(requested_bands=["nir", "red"])["red"]
+    handler.get_metadata_bands(requested_bands=["red"])["red"]["image_skimage"]
+    handler.bands["nir"]
+    assert len(handler.get_images_collection()) == 2
+
+    assert mock_imread.call_count == 2
+    assert handler.read_counts["nir"] == 1
+    assert handler.read_counts["red"] == 1
+
+
+@pytest.mark.parametrize("compression", [None, "zlib"])
+def test_file_handler_memmap_backend_matches_in_memory(tmp_path, compression):
+    image = np.random.default_rng(0).integers(0, 4000, (30, 20)).astype(np.uint16)
+    path = tmp_path / "nir.tif"
+    tifffile.imwrite(path, image, compression=compression)
+
+    in_memory = FileHandler(nir_path=path)
+    mapped = FileHandler(nir_path=path).use_memmap(tmp_path / "cache")
+
+    assert isinstance(mapped.bands["nir"], np.memmap)
+    assert mapped.bands["nir"].dtype == np.uint16
+    np.testing.assert_array_equal(mapped.bands["nir"], in_memory.bands["nir"])
+
+    normalized = mapped.get_normalized_bands(requested_bands=["nir"])["nir"]
+    assert isinstance(normalized, np.memmap)
+    np.testing.assert_array_equal(
+        normalized, in_memory.get_normalized_bands(requested_bands=["nir"])["nir"]
+    )
+
+
+def test_failed_memmap_sidecar_leaves_no_staging_file(tmp_path):
+    image = np.random.default_rng(0).integers(0, 4000, (30, 20)).astype(np.uint16)
+    path = tmp_path / "nir.tif"
+    tifffile.imwrite(path, image, compression="zlib")
+    mapped = FileHandler(nir_path=path).use_memmap(tmp_path / "cache")
+
+    with mock.patch("rasterio.windows.Window", side_effect=OSError("read failed")):
+        with pytest.raises(OSError):
+            mapped.bands["nir"]
+    assert list((tmp_path / "cache").iterdir()) == []
+
+    mapped.get_normalized_bands(requested_bands=["nir"])["nir"]
+    assert len(list((tmp_path / "cache").glob("*.npy"))) == 2
+    assert clear_memmap_dir(tmp_path / "cache") == 30 * 20 * (2 + 8) + 2 * 128
+    assert list((tmp_path / "cache").iterdir()) == []
@@ -0,0 +1,75 @@
+import pytest
+import numpy as np
+import rasterio as rio
+from rasterio.transform import from_origin
+
+from fezrs import NDVICalculator
+from fezrs.utils.raster_handler import write_raster
+
+
+@pytest.fixture
+def georeferenced_bands(tmp_path):
+    rng = np.random.default_rng(0)
+    transform = from_origin(500000, 4000000, 30, 30)
+    paths = {}
+    for band in ("nir", "red"):
+        paths[band] = tmp_path / f"{band}.tif"
+        with rio.open(
+            paths[band],
+            "w",
+            driver="GTiff",
+            height=40,
+            width=50,
+            count=1,
+            dtype="uint16",
+            crs="EPSG:32639",
+            transform=transform,
+        ) as dst:
+            dst.write(rng.integers(1, 4000, (1, 40, 50)).astype(np.uint16))
+    return paths
+
+
+@pytest.mark.parametrize("driver", ["GTiff", "COG"])
+def test_write_raster_round_trip(tmp_path, driver):
+    array = np.random.default_rng(1).random((70, 60, 3)).astype(np.float32)
+
+    filename = write_raster(array, tmp_path / "out.tif", driver=driver, block_size=32)
+
+    with rio.open(filename) as src:
+        assert src.count == 3
+        assert src.profile["tiled"]
+        np.testing.assert_array_equal(np.moveaxis(src.read(), 0, -1), array)
+
+
+def test_write_raster_invalid_driver(tmp_path):
+    with pytest.raises(ValueError):
+        write_raster(np.zeros((4, 4)), tmp_path / "out.tif", driver="PNG")
+
+
+def test_execute_raster_keeps_georeferencing(georeferenced_bands, tmp_path):
+    tool = NDVICalculator(
+        nir_path=georeferenced_bands["nir"], red_path=georeferenced_bands["red"]
+    ).execute_raster(tmp_path / "out")
+
+    with rio.open(georeferenced_bands["nir"]) as src:
+        crs, transform = src.crs, src.transform
+
+    with rio.open(tool.output_file) as src:
+        assert src.crs == crs
+        assert src.transform == transform
+        np.testing.assert_array_equal(src.read(1), tool._output)
+
+
+def test_profile_read_from_header_only(georeferenced_bands):
+    tool = NDVICalculator(
+        nir_path=georeferenced_bands["nir"], red_path=georeferenced_bands["red"]
+    )
+
+    profile = tool.profile
+
+    with rio.open(georeferenced_bands["red"]) as src:
+        assert profile["crs"] == src.crs
+        assert profile["transform"] == src.transform
+        assert profile["nodata"] == src.nodata
+    assert tool.files_handler.get_profile("nir")["width"] == 50
+    assert sum(tool.files_handler.read_counts.values()) == 0
@@ -0,0 +1,74 @@
+import pytest
+import tifffile
+import numpy as np
+import rasterio as rio
+
+from fezrs import (
+    BurnCalculator,
+    EqualizeCalculator,
+    HSVCalculator,
+    NDVICalculator,
+    TimeCalculator,
+)
+from fezrs.utils.stream_handler import band_statistics, stream_blocks
+
+
+@pytest.fixture
+def band_files(make_band_files):
+    bands = ("nir", "red", "blue", "green", "swir2", "before_nir", "before_swir2")
+    return make_band_files(bands, (70, 90), tile=(32, 32))
+
+
+def _read(path):
+    with rio.open(path) as src:
+        data = src.read()
+    return data[0] if len(data) == 1 else np.moveaxis(data, 0, -1)
+
+
+def test_band_statistics_matches_whole_image(band_files):
+    image = tifffile.imread(band_files["nir"])
+    assert band_statistics(band_files["nir"], block_size=16) == (
+        image.min(),
+        image.max(),
+    )
+
+
+def test_stream_blocks_writes_every_block(band_files, tmp_path):
+    output = stream_blocks(
+        {"nir": band_files["nir"], "red": band_files["red"]},
+        tmp_path / "sum.tif",
+        lambda bands: bands["nir"].astype(np.int32) + bands["red"],
+    )
+
+    expected = tifffile.imread(band_files["nir"]).astype(np.int32) + tifffile.imread(
+        band_files["red"]
+    )
+    np.testing.assert_array_equal(_read(output), expected)
+
+
+@pytest.mark.parametrize("block_size", [None, 16])
+@pytest.mark.parametrize(
+    "calculator, bands, options",
+    [
+        (NDVICalculator, ("nir", "red"), {}),
+        (HSVCalculator, ("nir", "blue", "green"), {"channel": "hsv"}),
+        (BurnCalculator, ("nir", "swir2", "before_nir", "before_swir2"), {}),
+        (TimeCalculator, ("nir", "before_nir"), {"time": "before"}),
+    ],
+)
+def test_execute_stream_matches_process(
+    band_files, tmp_path, calculator, bands, options, block_size
+):
+    paths = {f"{band}_path": band_files[band] for band in bands}
+
+    expected = calculator(**paths, **options).process()
+    tool = calculator(**paths, **options).execute_stream(
+        tmp_path / "out", block_size=block_size
+    )
+
+    np.testing.assert_array_equal(_read(tool.output_file), np.asarray(expected))
+
+
+def test_execute_stream_unsupported_tool(band_files, tmp_path):
+    with pytest.raises(NotImplementedError):
+        EqualizeCalculator(nir_path=band_files["nir"]).execute_stream(tmp_path)